@@ -0,0 +1,174 @@
+import os
+import sys
+import glob
+import json
+import argparse
+import multiprocessing
+from time import perf_counter
+
+#utils changes the working directory to this folder when it is imported so paths given on the command line are resolved against this
+LAUNCH_DIRECTORY = os.getcwd()
+
+import defs
+import utils
+import solver
+from log import Log
+from cube import Cube
+from cube_internal import Cubiecube
+from gen_all_data import gen_data_if_missing
+
+#suffix of the solution logs, which are skipped when searching a directory for logs
+SOLUTION_LOG_SUFFIX = ".solution.log"
+
+#number of nodes the solve which compiles the searches before the batch starts may generate
+WARM_UP_NODE_BUDGET = 10**6
+
+def find_logs(inputs: list) -> list:
+    '''
+    Returns the paths of the log files given by a list of files, directories and glob patterns ("-" is passed through for stdin)
+    '''
+    paths = []
+
+    for pattern in inputs:
+        if pattern == "-":
+            paths.append(pattern)
+            continue
+
+        pattern = os.path.join(LAUNCH_DIRECTORY, pattern)
+
+        if os.path.isdir(pattern):
+            matches = [path for path in glob.glob(os.path.join(pattern, "*.log")) if not path.endswith(SOLUTION_LOG_SUFFIX)]
+        else: matches = glob.glob(pattern)
+
+        if not matches:
+            print("No log files match " + pattern, file=sys.stderr)
+
+        paths += sorted(matches)
+
+    return paths
+
+def solution_log_path(path: str, output_directory: str = None) -> str:
+    '''
+    Returns the path the solution log of the log file is saved to
+
+    path: the path of the log file ("-" for stdin)
+    output_directory: the directory to save the solution logs in (defaults to the directory of each log file)
+    '''
+    if path == "-":
+        name = "stdin"
+        directory = LAUNCH_DIRECTORY
+    else:
+        name = os.path.splitext(os.path.basename(path))[0]
+        directory = os.path.dirname(path)
+
+    if output_directory is not None:
+        directory = os.path.join(LAUNCH_DIRECTORY, output_directory)
+
+    return os.path.join(directory, name + SOLUTION_LOG_SUFFIX)
+
+def solve_log(job: tuple) -> dict:
+    '''
+    Solves the scrambled cube of a log within its time budget, saving the solution log each time a shorter solution is found.
+    Returns the summary of the solve.
+
+    job: the name of the log, the contents of the log, the path to save the solution log to and the keyword arguments of solver.solve
+         (with the time budget in seconds instead of a deadline)
+    '''
+    name, string, output_path, solve_args = job
+    solve_args = dict(solve_args)
+
+    summary = {"input": name, "output": None, "length": None, "solutions": 0, "time_to_first_solution": None}
+    counters = utils.new_counters()
+    start = perf_counter()
+
+    try:
+        cube = Cube.from_log(Log.from_string(string, output_path))
+
+        if solve_args.get("time_budget") is not None:
+            solve_args["deadline"] = start + solve_args["time_budget"]
+        del solve_args["time_budget"]
+
+        for solution in solver.solve(cube.state, counters=counters, **solve_args):
+            if summary["time_to_first_solution"] is None:
+                summary["time_to_first_solution"] = perf_counter() - start
+
+            #save every improvement so the best solution is kept if the batch is stopped
+            cube.apply_solution(solution).log.save()
+
+            summary["output"] = output_path
+            summary["length"] = len(solution)
+            summary["solutions"] += 1
+    except Exception as error:
+        summary["error"] = repr(error)
+
+    summary["time"] = perf_counter() - start
+    summary.update(utils.counters_to_dict(counters))
+
+    return summary
+
+def batch_solve(inputs: list, output_directory: str = None, summary_file = sys.stdout, n_workers: int = 1, time_budget: float = None,
+                search_depth: int = None, target_length: int = None, node_budget: int = None):
+    '''
+    Solves every log file given by the inputs and writes a line of JSON summarizing each solve to the summary file as it finishes
+
+    inputs: files, directories and glob patterns of log files ("-" reads a log from stdin)
+    output_directory: the directory to save the solution logs in (defaults to the directory of each log file)
+    summary_file: the file the JSON lines are written to
+    n_workers: the number of logs which are solved at once, each in its own process
+    time_budget: the number of seconds to search each log for (None disables the time limit)
+    search_depth, target_length, node_budget: the maximum solution length, target length and node budget of each solve (see solver.solve)
+    '''
+    solve_args = {"search_depth": search_depth, "time_budget": time_budget, "target_length": target_length, "node_budget": node_budget}
+
+    jobs = []
+    for path in find_logs(inputs):
+        if path == "-":
+            string = sys.stdin.read()
+        else:
+            with open(path, "r") as f:
+                string = f.read()
+
+        output_path = solution_log_path(path, output_directory)
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        jobs.append((path, string, output_path, solve_args))
+
+    #load the tables and compile the searches once so that the worker processes share them instead of spending their time budget on them
+    #(the node budget bounds the warm up solve in case the scramble is slow to prove optimal with small pruning tables)
+    defs.load_tables()
+    solver.best_solution(Cubiecube().apply_move_list_new([3, 50]), node_budget=WARM_UP_NODE_BUDGET)
+
+    if n_workers > 1 and len(jobs) > 1:
+        with multiprocessing.Pool(min(n_workers, len(jobs)), defs.load_tables) as pool:
+            summaries = pool.imap_unordered(solve_log, jobs)
+
+            for summary in summaries:
+                print(json.dumps(summary), file=summary_file, flush=True)
+    else:
+        for job in jobs:
+            print(json.dumps(solve_log(job)), file=summary_file, flush=True)
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Solves MC4D log files of scrambled 2^4 cubes without a GUI. A line of JSON summarizing each "
+                                                 "solve is written to stdout (or the summary file) as it finishes.")
+    parser.add_argument("inputs", nargs="*", default=["-"], help="log files, directories of log files or glob patterns (- or nothing reads a log from stdin)")
+    parser.add_argument("-o", "--output", help="directory to save the solution logs in (defaults to the directory of each log)")
+    parser.add_argument("-s", "--summary", help="file to write the JSON lines summary to (defaults to stdout)")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="number of logs to solve at once (defaults to one per core)")
+    parser.add_argument("-t", "--time", type=float, default=10.0, help="seconds to search each log for (defaults to 10, 0 disables the time limit)")
+    parser.add_argument("--max-length", type=int, help="only find solutions of at most this many moves")
+    parser.add_argument("--target-length", type=int, help="stop searching a log once a solution of at most this many moves is found")
+    parser.add_argument("--node-budget", type=int, help="stop searching a log after generating this many nodes")
+    args = parser.parse_args(argv)
+
+    #generate any data if it is missing
+    gen_data_if_missing()
+
+    if args.summary is None:
+        batch_solve(args.inputs, args.output, sys.stdout, args.workers, args.time or None, args.max_length, args.target_length, args.node_budget)
+    else:
+        with open(os.path.join(LAUNCH_DIRECTORY, args.summary), "w") as summary_file:
+            batch_solve(args.inputs, args.output, summary_file, args.workers, args.time or None, args.max_length, args.target_length, args.node_budget)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from time import perf_counter
+import numpy as np
+import numba as nb
+
+import utils
+
+def time_per_call(function, *args, repeats: int = 100000) -> float:
+    '''
+    Returns the average time in nanoseconds of calling function with args (after one warm up call)
+    '''
+    function(*args)
+
+    start = perf_counter()
+    for _ in range(repeats):
+        function(*args)
+
+    return (perf_counter() - start) / repeats * 1e9
+
+#the encoder used before utils.k4_list_to_int and utils.c3_list_to_int for comparison
+@nb.njit(nb.uint32(nb.uint8[:], nb.uint8), parallel=True)
+def parallel_base_to_int(array: np.ndarray, base: int) -> np.uint32:
+    index = np.arange(len(array))
+
+    return np.sum(base**index * array)
+
+def bench_index_encoders():
+    '''
+    Prints the per call latency of the index encoders for single lists and batches of lists
+    '''
+    print("Index encoders")
+
+    rng = np.random.default_rng(0)
+    k4_list = rng.integers(0, 4, 15, dtype=np.uint8)
+    c3_list = rng.integers(0, 3, 15, dtype=np.uint8)
+    k4_lists = rng.integers(0, 4, (100000, 15), dtype=np.uint8)
+
+    print("  k4 list   parallel base_to_int: {:10.1f} ns".format(time_per_call(parallel_base_to_int, k4_list, 4)))
+    print("  k4 list   k4_list_to_int:       {:10.1f} ns".format(time_per_call(utils.k4_list_to_int, k4_list)))
+    print("  c3 list   parallel base_to_int: {:10.1f} ns".format(time_per_call(parallel_base_to_int, c3_list[:-1], 3)))
+    print("  c3 list   c3_list_to_int:       {:10.1f} ns".format(time_per_call(utils.c3_list_to_int, c3_list)))
+    print("  100000 k4 lists k4_lists_to_int: {:9.1f} ns per list".format(time_per_call(utils.k4_lists_to_int, k4_lists, repeats=100) / len(k4_lists)))
+
+@nb.njit
+def sum_random_lookups(table: utils.PruningTable, indices: np.ndarray) -> int:
+    total = 0
+    for index in indices:
+        total += utils.prune_value(table, index, 1)
+    return total
+
+def bench_pruning_table_encodings(n_states: int = 2**26, n_lookups: int = 1000000):
+    '''
+    Prints the memory use and random lookup latency of a pruning table in each encoding
+
+    n_states: number of entries in the table
+    n_lookups: number of random lookups per measurement
+    '''
+    print("Pruning table encodings ({} entries)".format(n_states))
+
+    rng = np.random.default_rng(0)
+    indices = rng.integers(0, n_states, n_lookups, dtype=np.uint64)
+    distances = rng.integers(0, 12, n_states, dtype=np.uint8)
+
+    for name, encoding in (("byte", utils.PRUNE_ENCODING_BYTE), ("nibble", utils.PRUNE_ENCODING_NIBBLE), ("mod 3", utils.PRUNE_ENCODING_MOD3)):
+        table = utils.new_pruning_table(n_states, 12, encoding)
+        for distance in range(12):
+            utils.set_entries(table, np.flatnonzero(distances == distance).astype(np.uint64), utils.encode_distance(table, distance))
+        latency = time_per_call(sum_random_lookups, table, indices, repeats=10) / n_lookups
+        print("  {:7s} {:8.1f} MB {:8.1f} ns per lookup".format(name, table.data.nbytes / 2**20, latency))
+
+if __name__ == "__main__":
+    bench_index_encoders()
+    bench_pruning_table_encodings()
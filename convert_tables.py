@@ -0,0 +1,50 @@
+import os
+import sys
+
+import defs
+import utils
+
+def get_table_files():
+    '''
+    Returns the name of every table file along with its pruning depth (None for tables other than pruning tables)
+    '''
+    filenames = (defs.PERMUTATION_LIST_MOVE_TABLE_FILENAME, defs.A4_LIST_MOVE_TABLE_FILENAME, defs.C3_MOVE_TABLE_FILENAME, defs.I_MOVE_TABLE_FILENAME,
+                 defs.O_MOVE_TABLE_FILENAME, defs.IO_MOVE_TABLE_FILENAME, defs.K4_SYMMETRY_TABLE_FILENAME, defs.C3_SYMMETRY_TABLE_FILENAME,
+                 defs.IO_SYMMETRY_TABLE_FILENAME)
+
+    pruning_tables = ((defs.PHASE1_PRUNING_TABLE_NAME, defs.PHASE1_PRUNE_DEPTH), (defs.PHASE2_PRUNING_TABLE_NAME, defs.PHASE2_PRUNE_DEPTH),
+                      (defs.PHASE3_PRUNING_TABLE_NAME, defs.PHASE3_PRUNE_DEPTH))
+
+    return [(filename, None) for filename in filenames] + list(pruning_tables)
+
+def convert_tables():
+    '''
+    Converts any tables saved as h5 files or chunked table files into table files which can be memory mapped
+    '''
+    for filename, max_depth in get_table_files():
+        if not os.path.exists(filename):
+            continue
+
+        if utils.is_h5_file(filename):
+            utils.convert_h5_file(filename, max_depth)
+        elif utils.is_chunked_table_file(filename):
+            utils.decompress_table_file(filename)
+
+def compress_tables(codec: str = None):
+    '''
+    Converts the table files into chunked table files for shipping
+
+    codec: the compression codec (defaults to the fastest available)
+    '''
+    #convert any older formats first
+    convert_tables()
+
+    for filename, _ in get_table_files():
+        if os.path.exists(filename):
+            utils.compress_table_file(filename, codec)
+
+if __name__ == "__main__":
+    #run with "compress" (and optionally a codec) to compress the tables, otherwise the tables are converted to be memory mapped
+    if len(sys.argv) > 1 and sys.argv[1] == "compress":
+        compress_tables(*sys.argv[2:3])
+    else: convert_tables()
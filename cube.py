@@ -42,30 +42,41 @@ class Cube:
         return cube
     
     @classmethod
-    def from_log(cls):
+    def from_log(cls, log: Log = None):
         '''
-        Creates a cube from a log file
+        Creates a cube from a log (opens a file dialog to choose a log file if no log is given)
         '''
         new_cube = cls.__new__(cls)
-        new_cube.log = Log.open()
+        new_cube.log = Log.open() if log is None else log
 
         if new_cube.log is None:
             return None
 
         new_cube.state = Stickercube()
 
-        for twist in new_cube.log.scramble:
-            new_cube.state.twist(twist)
-        for twist in new_cube.log.solution:
-            new_cube.state.twist(twist)
+        new_cube.state.twist_list(new_cube.log.scramble + new_cube.log.solution)
         
         return new_cube
     
-    def solve(self, search_depth = None):
+    def apply_solution(self, solution: list):
+        '''
+        Returns a copy of the cube with the solution from the solver applied (and appended to its log)
+        '''
+        newcube = self.copy()
+
+        #apply the moves
+        for move_string in " ".join(defs.TWIST_MC4D_NAMES[move] for move in solution).split():
+            newcube.twist(Twist.from_mc4d_string(move_string))
+
+        return newcube
+
+    def solve(self, search_depth = None, n_workers: int = 1, race: bool = False):
         '''
         Solves the cube
 
         search_depth: maximum solution length desired
+        n_workers: the number of processes to search with
+        race: whether to race searches of the cube in several orientations against each other (n_workers is then ignored)
         '''
         #set scrambling to false
         self.log.scrambling = False
@@ -73,17 +84,11 @@ class Cube:
         
         try:
             #for every solution
-            for solution in solver.solve(self.state, search_depth):
+            for solution in solver.solve(self.state, search_depth, n_workers, race=race):
                 print("Found solution length:", len(solution))
                 
-                newcube = self.copy()
-
-                #apply the moves
-                for move_string in " ".join(defs.TWIST_MC4D_NAMES[move] for move in solution).split():
-                    newcube.twist(Twist.from_mc4d_string(move_string))
-                
                 #save the log file
-                newcube.log.save()
+                self.apply_solution(solution).log.save()
         except KeyboardInterrupt:
             return
         
@@ -92,9 +97,11 @@ class Cube:
 
 
 
-    def optimal_solve(self):
+    def optimal_solve(self, n_workers: int = 1):
         '''
         Solves the cube optimally via iterative deepening A*
+
+        n_workers: the number of processes to search with
         '''
 
         #set scrambling to false
@@ -104,17 +111,11 @@ class Cube:
             depth = 0
             while True:
                 #find solution
-                for solution in solver.solve(self.state, depth):
+                for solution in solver.solve(self.state, depth, n_workers):
                     print("Found optimal solution of length:", len(solution))
                     
-                    newcube = self.copy()
-
-                    #apply the moves
-                    for move_string in " ".join(defs.TWIST_MC4D_NAMES[move] for move in solution).split():
-                        newcube.twist(Twist.from_mc4d_string(move_string))
-                    
                     #save the log file
-                    newcube.log.save()
+                    self.apply_solution(solution).log.save()
 
                     #optimal solution was found so return
                     return
@@ -104,11 +104,11 @@ class Stickercube:
         '''
         Applies the twist to the cube
         '''
-        #update the position of each piece
-        for i in range(16):
-            #if the piece is on the correct side then turn it
-            if self.position[i, twist.axis]*twist.side >= 0:
-                    self.position[i,:] = twist.rotate_vector(self.position[i])
+        #get the pieces on the correct side
+        turned = self.position[:, twist.axis]*twist.side >= 0
+
+        #turn them
+        self.position[turned] = self.position[turned][:, twist.index_map] * twist.signs
     
     def twist_new(self, twist: Twist):
         '''
@@ -117,7 +117,88 @@ class Stickercube:
         new_cube = self.copy()
         new_cube.twist(twist)
         return new_cube
+
+    def twist_list(self, twists: list):
+        '''
+        Applies the twists to the cube in a single compiled call
+        '''
+        if len(twists) == 0:
+            return
+
+        self.position = self.position.astype(np.int64)
+
+        utils.twist_position(self.position, np.array([twist.axis for twist in twists], dtype=np.int64), np.array([twist.side for twist in twists], dtype=np.int64),
+                             np.array([twist.index_map for twist in twists], dtype=np.int64), np.array([twist.signs for twist in twists], dtype=np.int64))
+
+    def twist_list_new(self, twists: list):
+        '''
+        Returns the result of applying the twists to the cube
+        '''
+        new_cube = self.copy()
+        new_cube.twist_list(twists)
+        return new_cube
     
+    @staticmethod
+    def relabel_axes(position: np.ndarray, axes) -> np.ndarray:
+        '''
+        Returns the piece positions with each axis a relabelled as axes[a]
+        '''
+        axes = np.asarray(axes)
+
+        new_position = np.empty_like(position)
+        new_position[..., axes] = np.sign(position) * (axes[np.abs(position) - 1] + 1)
+
+        return new_position
+
+    @staticmethod
+    def get_symmetry_piece_map(axes) -> np.ndarray:
+        '''
+        Returns where each piece of the solved cube is moved to by relabelling each axis a as axes[a]
+        '''
+        relabelled = Stickercube.relabel_axes(Stickercube.solved, axes)
+
+        return np.array([np.nonzero(np.all(Stickercube.solved == piece, axis=1))[0][0] for piece in relabelled], dtype=np.uint8)
+
+    def conjugate(self, axes):
+        '''
+        Conjugates the cube by the symmetry which relabels each axis a as axes[a]. Applying the conjugated twists to the conjugated cube
+        gives the same result as conjugating the cube after the twists.
+        '''
+        new_position = np.empty_like(self.position)
+        new_position[Stickercube.get_symmetry_piece_map(axes)] = Stickercube.relabel_axes(self.position, axes)
+
+        self.position = new_position
+
+    def conjugate_new(self, axes):
+        '''
+        Returns the cube conjugated by the symmetry which relabels each axis a as axes[a]
+        '''
+        new_cube = self.copy()
+        new_cube.conjugate(axes)
+        return new_cube
+
+    @staticmethod
+    def get_k4_symmetry_maps(axes):
+        '''
+        Returns the location map and K4 maps of the symmetry which relabels each axis a as axes[a]. Conjugating a cube by the symmetry moves
+        the piece in location i to location_map[i] and changes its K4 orientation from k to k4_maps[i, k]. Unlike the A4 maps of
+        Cubiecube.get_symmetry_maps these also exist for symmetries which split axes 0 and 1, but the K4 map then depends on the location.
+        Raises ValueError if the new K4 orientation depends on the C3 orientation.
+        '''
+        location_map = Stickercube.get_symmetry_piece_map(axes)[:15]
+
+        #conjugate a cube with every piece in each orientation and read the new orientation of the piece from each location
+        k4_maps = np.empty((15, 12), dtype=np.uint8)
+        for a4 in range(12):
+            cube = Stickercube.from_a4_list(np.full(15, a4, dtype=np.uint8))
+            cube.conjugate(axes)
+            k4_maps[:, a4] = cube.get_a4_list()[location_map] // 3
+
+        if np.any(k4_maps != np.repeat(k4_maps[:, ::3], 3, axis=1)):
+            raise ValueError("Symmetry " + str(axes) + " does not preserve the K4 orientation")
+
+        return location_map, k4_maps[:, ::3].copy()
+
     def get_permutation_list(self):
         '''
         Returns the permutation list of the pieces of the cube in the "is replaced by" format
@@ -211,6 +292,9 @@ class Cubiecube:
         return "A4:" + str(self.a4) + " Permutation:" + str(self.permutation)
     
     def __eq__(self, other: object) -> bool:
+        #comparing with a batch compares with each of its cubes
+        if type(other) == CubieBatch:
+            return other == self
         if type(other) != Cubiecube:
             raise NotImplementedError
         
@@ -352,6 +436,96 @@ class Cubiecube:
 
         return new_cube
     
+    def to_stickercube(self):
+        '''
+        Creates a stickercube definition from this cubiecube
+        '''
+        #get the positions of the pieces from their orientations as if each were in its own location
+        location_position = Stickercube.from_a4_list(self.a4).position
+
+        #move each piece to its location (the piece in all negative axes stays solved)
+        position = np.empty_like(location_position)
+        position[np.append(self.permutation, 15)] = location_position
+
+        #the orientation only places the stickers of axes 2 and 3 so swap the other two stickers of pieces which would otherwise be reflected
+        absolute = np.abs(position)
+        inversions = np.sum(np.triu(absolute[:, :, None] > absolute[:, None, :]), axis=(1, 2))
+        reflected = (-1)**inversions * np.prod(np.sign(position), axis=1) * np.prod(np.sign(Stickercube.solved), axis=1) == -1
+
+        swapped = np.where(absolute == 1, 2, np.where(absolute == 2, 1, absolute))
+        position[reflected] = np.sign(position[reflected]) * swapped[reflected]
+
+        return Stickercube(position)
+
+    @staticmethod
+    def get_symmetry_maps(axes):
+        '''
+        Returns the location map and A4 map of the symmetry which relabels each axis a as axes[a]. Conjugating a cubiecube by the symmetry
+        moves the piece in location i to location_map[i] and changes its A4 orientation from a to a4_map[a]. Only symmetries which fix the
+        pair of axes 0 and 1 are supported since the A4 orientation of a piece depends on the order of these axes.
+        '''
+        if sorted(axes[:2]) != [0, 1]:
+            raise ValueError("Cubiecube symmetries must fix the pair of axes 0 and 1")
+
+        location_map = Stickercube.get_symmetry_piece_map(axes)[:15]
+
+        #conjugate a cube with every piece in each orientation and read the new orientation of the piece which stays in location 0
+        a4_map = np.empty(12, dtype=np.uint8)
+        for a4 in range(12):
+            cube = Stickercube.from_a4_list(np.full(15, a4, dtype=np.uint8))
+            cube.conjugate(axes)
+            a4_map[a4] = cube.get_a4_list()[0]
+
+        return location_map, a4_map
+
+    def conjugate(self, axes):
+        '''
+        Conjugates the cube by the symmetry which relabels each axis a as axes[a]. Symmetries which fix the pair of axes 0 and 1 are applied
+        with the maps from get_symmetry_maps and any other relabelling by conjugating the cube as a stickercube.
+        '''
+        if sorted(axes[:2]) != [0, 1]:
+            cube = self.to_stickercube().conjugate_new(axes).to_cubiecube()
+            self.permutation, self.a4 = cube.permutation, cube.a4
+            return
+
+        location_map, a4_map = Cubiecube.get_symmetry_maps(axes)
+
+        permutation = np.empty_like(self.permutation)
+        permutation[location_map] = location_map[self.permutation]
+        a4 = np.empty_like(self.a4)
+        a4[location_map] = a4_map[self.a4]
+
+        self.permutation = permutation
+        self.a4 = a4
+
+    def conjugate_new(self, axes):
+        '''
+        Returns the cube conjugated by the symmetry which relabels each axis a as axes[a]
+        '''
+        new_cube = self.copy()
+        new_cube.conjugate(axes)
+        return new_cube
+
+    def invert(self):
+        '''
+        Replaces the cube state with its inverse (multiplying the cube state by its inverse gives the solved cube)
+        '''
+        permutation = np.empty_like(self.permutation)
+        permutation[self.permutation] = np.arange(15, dtype=np.uint8)
+        a4 = np.empty_like(self.a4)
+        a4[self.permutation] = utils.a4_inverse_table[self.a4]
+
+        self.permutation = permutation
+        self.a4 = a4
+
+    def invert_new(self):
+        '''
+        Returns the inverse of the cube state
+        '''
+        new_cube = self.copy()
+        new_cube.invert()
+        return new_cube
+
     def get_k4_list(self):
         '''
         Returns the K4 orientation list for the cube
@@ -403,7 +577,7 @@ class Cubiecube:
         Returns the C3 orientation coordinates for the cube
         '''
 
-        return utils.base_to_int(self.a4[:-1] % 3, 3)
+        return utils.c3_list_to_int(self.a4 % 3)
     
     @classmethod
     def from_c3_coord(cls, c3_coord):
@@ -424,7 +598,7 @@ class Cubiecube:
         Returns the K4 coordinate for the state
         '''
 
-        return utils.base_to_int(self.get_k4_list(), 4)
+        return utils.k4_list_to_int(self.get_k4_list())
     
     @classmethod
     def from_k4_coord(cls, k4_coord: int):
@@ -439,49 +613,22 @@ class Cubiecube:
         Returns the coordinate for which pieces are in the correct W axis layer
         '''
 
-        #get indices of K pieces
-        indices = np.arange(15, dtype=np.int64)[self.permutation > 7]
-
-        #compute the id
-        return int(6434 - indices[0] - (-1 + indices[1])*indices[1]/2 - (-2 + indices[2])*(-1 + indices[2])*indices[2]/6 - (-3 + indices[3])*(-2 + indices[3])*(-1 + indices[3])*indices[3]/24 - (-4 + indices[4])*(-3 + indices[4])*(-2 + indices[4])*(-1 + indices[4])*indices[4]/120 - (-5 + indices[5])*(-4 + indices[5])*(-3 + indices[5])*(-2 + indices[5])*(-1 + indices[5])*indices[5]/720 - (-6 + indices[6])*(-5 + indices[6])*(-4 + indices[6])*(-3 + indices[6])*(-2 + indices[6])*(-1 + indices[6])*indices[6]/5040)
+        return int(utils.permutation_to_IO_coord(self.permutation))
     
     def get_I_coord(self):
         '''
         Returns the I permutation coordinate
         '''
-        #remove IO information
-        permutation = self.permutation[self.permutation < 8]
-
-        #compute the I permutation coordinate and account for known parity
-        coordI = 0
-        
-        for i in range(2, 8):
-            coordI += np.sum(permutation[:i] > permutation[i]) * int(utils.factorial[i]/2)
-        
-        #encode the parity of the I cell as which half of the coordinates it is
+        #the parity of the I cell is encoded as which half of the coordinates it is
         #since the parity of the cells is linked, when the coords are combined we can ignore the parity of the I cell and only use the O cell parity
-        if not utils.permutation_parity(permutation[:8]):
-            coordI += 20160
-
-        return coordI
+        return utils.sub_permutation_to_coord(self.permutation, 0, 8)
     
     def get_O_coord(self):
         '''
         Returns the O permutation coordinate
         '''
-        #remove IO information
-        permutation = self.permutation[self.permutation > 7] - 8
-        
-        #compute the O permutation coordinate
-        coordO = 0
-        for i in range(2, 7):
-            coordO += np.sum(permutation[:i] > permutation[i]) * int(utils.factorial[i]/2)
-
-        #encode the parity
-        if not utils.permutation_parity(permutation):
-            coordO += 2520
 
-        return coordO
+        return utils.sub_permutation_to_coord(self.permutation, 8, 7)
     
     @classmethod
     def from_permutation_coords(cls, IO_coord, I_coord, O_coord):
@@ -520,4 +667,287 @@ class Cubiecube:
         #update the second last piece with known parity
         c3_list[-1] = np.mod(-np.sum(c3_list, dtype=np.int32), 3)
 
-        return cls(a4 = c3_list, permutation = permutation)
\ No newline at end of file
+        return cls(a4 = c3_list, permutation = permutation)
+    #the batched codecs below convert between arrays of coordinates and arrays of A4 lists or permutations with shape (N, 15)
+
+    @staticmethod
+    def get_c3_coords(a4s: np.ndarray) -> np.ndarray:
+        '''
+        Returns the C3 coordinates of an array of A4 lists
+        '''
+        return utils.c3_lists_to_int(a4s % 3)
+
+    @staticmethod
+    def get_k4_coords(a4s: np.ndarray) -> np.ndarray:
+        '''
+        Returns the K4 coordinates of an array of A4 lists
+        '''
+        return utils.k4_lists_to_int(a4s // 3)
+
+    @staticmethod
+    def get_IO_coords(permutations: np.ndarray) -> np.ndarray:
+        '''
+        Returns the IO coordinates of an array of permutations
+        '''
+        return utils.permutations_to_IO_coords(permutations)
+
+    @staticmethod
+    def get_I_coords(permutations: np.ndarray) -> np.ndarray:
+        '''
+        Returns the I coordinates of an array of permutations
+        '''
+        return utils.permutations_to_I_coords(permutations)
+
+    @staticmethod
+    def get_O_coords(permutations: np.ndarray) -> np.ndarray:
+        '''
+        Returns the O coordinates of an array of permutations
+        '''
+        return utils.permutations_to_O_coords(permutations)
+
+    @staticmethod
+    def c3_coords_to_a4s(c3_coords: np.ndarray) -> np.ndarray:
+        '''
+        Returns the A4 lists with the given C3 coordinates and solved K4 orientation
+        '''
+        return utils.int_to_c3_lists(c3_coords.astype(np.uint32))
+
+    @staticmethod
+    def k4_coords_to_a4s(k4_coords: np.ndarray) -> np.ndarray:
+        '''
+        Returns the A4 lists with the given K4 coordinates and solved C3 orientation
+        '''
+        return utils.int_to_k4_lists(k4_coords.astype(np.uint32)) * np.uint8(3)
+
+    @staticmethod
+    def coords_to_permutations(IO_coords: np.ndarray, I_coords: np.ndarray, O_coords: np.ndarray) -> np.ndarray:
+        '''
+        Returns the permutations with the given IO, I and O coordinates
+        '''
+        return utils.coords_to_permutations(IO_coords.astype(np.uint16), I_coords.astype(np.uint16), O_coords.astype(np.uint16))
+
+    @staticmethod
+    def to_ints(a4s: np.ndarray, permutations: np.ndarray) -> np.ndarray:
+        '''
+        Returns the unique integers (see to_int) of an array of A4 lists and permutations as an array of python integers
+        '''
+        index = Cubiecube.get_O_coords(permutations).astype(object) * defs.N_HALF_I_COORD_STATES + (Cubiecube.get_I_coords(permutations) % defs.N_HALF_I_COORD_STATES).astype(object)
+
+        index = index * defs.N_IO_COORD_STATES + Cubiecube.get_IO_coords(permutations).astype(object)
+
+        index = index * defs.N_C3_COORD_STATES + Cubiecube.get_c3_coords(a4s).astype(object)
+
+        return index * defs.N_PHASE1_STATES + Cubiecube.get_k4_coords(a4s).astype(object)
+
+    @staticmethod
+    def from_ints(ints: np.ndarray):
+        '''
+        Returns the A4 lists and permutations of an array of unique integers (see from_int)
+        '''
+        ints = np.asarray(ints, dtype=object)
+
+        remaining_ints, k4_coords = ints // defs.N_PHASE1_STATES, ints % defs.N_PHASE1_STATES
+        remaining_ints, c3_coords = remaining_ints // defs.N_C3_COORD_STATES, remaining_ints % defs.N_C3_COORD_STATES
+        remaining_ints, IO_coords = remaining_ints // defs.N_IO_COORD_STATES, remaining_ints % defs.N_IO_COORD_STATES
+        O_coords, I_coords = remaining_ints // defs.N_HALF_I_COORD_STATES, remaining_ints % defs.N_HALF_I_COORD_STATES
+
+        a4s = Cubiecube.k4_coords_to_a4s(k4_coords.astype(np.uint32)) + Cubiecube.c3_coords_to_a4s(c3_coords.astype(np.uint32))
+
+        IO_coords = IO_coords.astype(np.uint16)
+        I_coords = I_coords.astype(np.uint16)
+        O_coords = O_coords.astype(np.uint16)
+        permutations = Cubiecube.coords_to_permutations(IO_coords, I_coords, O_coords)
+
+        #guarantee even permutation parity
+        odd = ~utils.permutations_parity(permutations)
+        permutations[odd] = Cubiecube.coords_to_permutations(IO_coords[odd], I_coords[odd] + defs.N_HALF_I_COORD_STATES, O_coords[odd])
+
+        return a4s, permutations
+
+
+class CubieBatch:
+
+    def __init__(self, a4s: np.ndarray=None, permutations: np.ndarray=None, n: int=1):
+        '''
+        A batch of cube definitions stored as arrays of A4 orientations and permutations with shape (N, 15), so that operations on every cube
+        in the batch are done at once. Each cube is represented as in Cubiecube.
+
+        a4s: ndarray of the a4 orientations of the cubes with shape (N, 15)
+        permutations: ndarray of the permutations of the cubes with shape (N, 15) in the "is replaced by" format
+        n: the number of cubes if neither a4s nor permutations are given
+        '''
+
+        #default to solved
+        if a4s is not None:
+            n = len(a4s)
+        elif permutations is not None:
+            n = len(permutations)
+
+        if a4s is None:
+            self.a4s = np.zeros((n, 15), dtype=np.uint8)
+        else: self.a4s = np.ascontiguousarray(a4s, dtype=np.uint8)
+        if permutations is None:
+            self.permutations = np.tile(np.arange(15, dtype=np.uint8), (n, 1))
+        else: self.permutations = np.ascontiguousarray(permutations, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.a4s)
+
+    def __str__(self) -> str:
+        return "CubieBatch of " + str(len(self)) + " cubes"
+
+    def __getitem__(self, key):
+        '''
+        Returns the cubiecube at an integer index or a batch of the cubes selected by a slice, index array or mask
+        '''
+        if isinstance(key, (int, np.integer)):
+            return Cubiecube(self.a4s[key].copy(), self.permutations[key].copy())
+
+        return CubieBatch(self.a4s[key], self.permutations[key])
+
+    def __eq__(self, other: object) -> np.ndarray:
+        '''
+        Returns whether each cube equals the corresponding cube of another batch (or a single cubiecube)
+        '''
+        if type(other) == Cubiecube:
+            other = CubieBatch.from_cubiecubes([other])
+        elif type(other) != CubieBatch:
+            raise NotImplementedError
+
+        return np.all(self.a4s == other.a4s, axis=1) & np.all(self.permutations == other.permutations, axis=1)
+
+    #the batch is mutable so it is not hashable itself, use hashes for the cubes
+    __hash__ = None
+
+    @classmethod
+    def from_cubiecubes(cls, cubes: list):
+        '''
+        Creates a batch from a list of cubiecubes
+        '''
+        return cls(np.array([cube.a4 for cube in cubes], dtype=np.uint8).reshape(-1, 15),
+                   np.array([cube.permutation for cube in cubes], dtype=np.uint8).reshape(-1, 15))
+
+    def to_cubiecubes(self) -> list:
+        '''
+        Returns the list of cubiecubes in the batch
+        '''
+        return [self[i] for i in range(len(self))]
+
+    def copy(self):
+        '''
+        Returns a copy of the batch
+        '''
+        return CubieBatch(self.a4s.copy(), self.permutations.copy())
+
+    def keys(self) -> np.ndarray:
+        '''
+        Returns an array with shape (N, 2) which packs each cube into two integers, so that equal cubes have equal keys
+        '''
+        #each a4 orientation and location fits in 4 bits
+        shifts = 4 * np.arange(15, dtype=np.uint64)
+
+        return np.stack((np.bitwise_or.reduce(self.a4s.astype(np.uint64) << shifts, axis=1),
+                         np.bitwise_or.reduce(self.permutations.astype(np.uint64) << shifts, axis=1)), axis=1)
+
+    def hashes(self) -> np.ndarray:
+        '''
+        Returns a 64 bit hash of each cube
+        '''
+        keys = self.keys()
+
+        return keys[:, 0] * np.uint64(0x9E3779B97F4A7C15) ^ keys[:, 1]
+
+    def unique(self):
+        '''
+        Returns a batch of the distinct cubes in the batch
+        '''
+        _, indices = np.unique(self.keys(), axis=0, return_index=True)
+
+        return self[np.sort(indices)]
+
+    def apply_move(self, moves):
+        '''
+        Applies a move to every cube in the batch, or each move of an array of moves to the corresponding cube
+        '''
+        moves = np.atleast_1d(moves)
+
+        self.multiply(CubieBatch(defs.A4_LIST_MOVE_TABLE[moves], defs.PERMUTATION_LIST_MOVE_TABLE[moves]))
+
+    def apply_move_new(self, moves):
+        '''
+        Returns the result of applying a move to every cube in the batch, or each move of an array of moves to the corresponding cube
+        '''
+        new_batch = self.copy()
+        new_batch.apply_move(moves)
+
+        return new_batch
+
+    def multiply(self, other):
+        '''
+        Multiplies each cube by the corresponding cube of another batch, or every cube by a single cubiecube or a batch of one cube. A batch
+        of one cube multiplied by a larger batch becomes a batch of the products with each of its cubes.
+        Raises ValueError if both batches hold more than one cube and their lengths differ.
+        '''
+        if type(other) == Cubiecube:
+            other = CubieBatch.from_cubiecubes([other])
+
+        self.a4s, self.permutations = utils.multiply_cubies(self.a4s, self.permutations, other.a4s, other.permutations)
+
+    def multiply_new(self, other):
+        '''
+        Returns the result of multiplying each cube by the corresponding cube of another batch (or by a single cubiecube)
+        '''
+        new_batch = self.copy()
+        new_batch.multiply(other)
+
+        return new_batch
+
+    def get_c3_coords(self) -> np.ndarray:
+        '''
+        Returns the C3 coordinates of the cubes
+        '''
+        return Cubiecube.get_c3_coords(self.a4s)
+
+    def get_k4_coords(self) -> np.ndarray:
+        '''
+        Returns the K4 coordinates of the cubes
+        '''
+        return Cubiecube.get_k4_coords(self.a4s)
+
+    def get_IO_coords(self) -> np.ndarray:
+        '''
+        Returns the IO coordinates of the cubes
+        '''
+        return Cubiecube.get_IO_coords(self.permutations)
+
+    def get_I_coords(self) -> np.ndarray:
+        '''
+        Returns the I coordinates of the cubes
+        '''
+        return Cubiecube.get_I_coords(self.permutations)
+
+    def get_O_coords(self) -> np.ndarray:
+        '''
+        Returns the O coordinates of the cubes
+        '''
+        return Cubiecube.get_O_coords(self.permutations)
+
+    def to_ints(self) -> np.ndarray:
+        '''
+        Returns the unique integers (see Cubiecube.to_int) of the cubes as an array of python integers
+        '''
+        return Cubiecube.to_ints(self.a4s, self.permutations)
+
+    @classmethod
+    def from_ints(cls, ints: np.ndarray):
+        '''
+        Creates a batch from an array of unique integers (see Cubiecube.from_int)
+        '''
+        return cls(*Cubiecube.from_ints(ints))
+
+    @classmethod
+    def random(cls, n: int):
+        '''
+        Returns a batch of n random cubes
+        '''
+        return cls.from_ints(np.array([randrange(0, defs.N_STATES) for _ in range(n)], dtype=object))
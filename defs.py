@@ -18,16 +18,41 @@ N_PHASE1_STATES = 1073741824
 N_PHASE2_STATES = 30778405515
 N_PHASE3_STATES = 101606400
 
+#symmetries of the phase 2 coordinates as the new axis of each axis. They must fix the W axis to preserve the phase 2 moves and the pair
+#of axes 0 and 1 since the A4 orientation of a piece depends on the order of these axes, which leaves only the reflection swapping X and Y
+PHASE2_SYMMETRIES = ((0, 1, 2, 3), (1, 0, 2, 3))
+
+#symmetries of the phase 1 coordinate. Every relabelling of axes 0, 1 and 2 which fixes W preserves the solved K4 orientation and keeps
+#locations 8 to 14 together. The K4 orientation is only acted on location by location so the split of axes 0 and 1 does not matter here.
+PHASE1_SYMMETRIES = ((0, 1, 2, 3), (1, 0, 2, 3), (0, 2, 1, 3), (1, 2, 0, 3), (2, 0, 1, 3), (2, 1, 0, 3))
+
+#number of IO coordinate classes under the phase 2 symmetries and states in the symmetry reduced phase 2 pruning table
+N_IO_SYMMETRY_CLASSES = 3379
+N_PHASE2_REDUCED_STATES = 16161652251
+
+#number of classes of the K4 orientation of locations 8 to 14 under the phase 1 symmetries and states in the symmetry reduced phase 1 pruning table
+N_K4_SYMMETRY_CLASSES = 2800
+N_PHASE1_REDUCED_STATES = 183500800
+
 #number of moves
 N_PHASE1_MOVES = 92
 N_PHASE2_MOVES = 44
 N_PHASE3_MOVES = 12
 
 #pruning table depths
-PHASE1_PRUNE_DEPTH = 6 #default 6
+PHASE1_PRUNE_DEPTH = 8 #full depth
 PHASE2_PRUNE_DEPTH = 7 #default 7
 PHASE3_PRUNE_DEPTH = 21 #full depth
 
+#distance of the phase 3 states furthest from solved, which the phase 3 table must reach since the phase 3 search relies on exact distances
+PHASE3_FULL_DEPTH = 21
+
+#pruning table encodings used when generating the tables (see utils.PruningTable)
+#the phase 3 table must hold exact distances so it cannot use utils.PRUNE_ENCODING_NIBBLE which saturates (see utils.check_exact_pruning_table)
+PHASE1_PRUNING_TABLE_ENCODING = utils.PRUNE_ENCODING_MOD3
+PHASE2_PRUNING_TABLE_ENCODING = utils.PRUNE_ENCODING_MOD3
+PHASE3_PRUNING_TABLE_ENCODING = utils.PRUNE_ENCODING_BYTE
+
 #file names
 PERMUTATION_LIST_MOVE_TABLE_FILENAME = "perm_list.move"
 A4_LIST_MOVE_TABLE_FILENAME = "A4_list.move"
@@ -35,11 +60,19 @@ C3_MOVE_TABLE_FILENAME = "C3.move"
 I_MOVE_TABLE_FILENAME = "I.move"
 O_MOVE_TABLE_FILENAME = "O.move"
 IO_MOVE_TABLE_FILENAME = "IO.move"
+K4_SYMMETRY_TABLE_FILENAME = "K4.sym"
+C3_SYMMETRY_TABLE_FILENAME = "C3.sym"
+IO_SYMMETRY_TABLE_FILENAME = "IO.sym"
 
-PHASE1_PRUNING_TABLE_NAME = "phase1.prun"
-PHASE2_PRUNING_TABLE_NAME = "phase2.prun"
+PHASE1_PRUNING_TABLE_NAME = "phase1sym.prun"
+PHASE2_PRUNING_TABLE_NAME = "phase2sym.prun"
 PHASE3_PRUNING_TABLE_NAME = "phase3.prun"
 
+#progress of generating the pruning tables is saved to these files so generation can be resumed
+PHASE1_PRUNING_CHECKPOINT_NAME = PHASE1_PRUNING_TABLE_NAME + ".checkpoint"
+PHASE2_PRUNING_CHECKPOINT_NAME = PHASE2_PRUNING_TABLE_NAME + ".checkpoint"
+PHASE3_PRUNING_CHECKPOINT_NAME = PHASE3_PRUNING_TABLE_NAME + ".checkpoint"
+
 #twist data
 TWIST_AXES = (0, 1, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2)
 TWIST_MC4D_NAMES = ('128,1,1 128,1,1', '79,1,1 79,1,1', '182,1,1', '182,1,1 182,1,1', '182,-1,1', '20,1,1', '20,1,1 20,1,1', '20,-1,1', '24,1,1 24,1,1', '12,1,1', '22,1,1 22,1,1', '14,1,1', '128,1,1', '128,-1,1', '132,1,1 132,1,1', '120,1,1', '130,1,1 130,1,1', '122,1,1', '79,1,1', '79,-1,1', '75,1,1 75,1,1', '68,1,1', '76,1,1 76,1,1', '66,1,1', '183,1,1 183,1,1', '177,1,1', '185,1,1 185,1,1', '175,1,1', '19,1,1', '24,1,1', '24,-1,1', '11,1,1', '3,-1,1', '3,1,1', '0,1,1', '0,-1,1', '17,1,1', '22,1,1', '22,-1,1', '9,1,1', '6,1,1', '6,-1,1', '2,1,1', '2,-1,1', '127,1,1', '132,1,1', '132,-1,1', '119,1,1', '111,-1,1', '111,1,1', '108,1,1', '108,-1,1', '125,1,1', '130,1,1', '130,-1,1', '117,1,1', '114,1,1', '114,-1,1', '110,1,1', '110,-1,1', '62,1,1', '75,1,1', '75,-1,1', '70,1,1', '59,-1,1', '59,1,1', '60,1,1', '60,-1,1', '63,1,1', '76,1,1', '76,-1,1', '71,1,1', '54,1,1', '54,-1,1', '58,1,1', '58,-1,1', '178,1,1', '183,1,1', '183,-1,1', '170,1,1', '162,-1,1', '162,1,1', '165,1,1', '165,-1,1', '180,1,1', '185,1,1', '185,-1,1', '172,1,1', '167,1,1', '167,-1,1', '163,1,1', '163,-1,1')
@@ -50,24 +83,79 @@ PHASE1_MOVES = ((0, 12, 13, 14, 15, 16, 17, 44, 45, 46, 47, 48, 49, 50, 51, 52,
 PHASE2_MOVES = ((0, 12, 13, 14, 15, 16, 17, 1, 18, 19, 20, 21, 22, 23, 2, 3, 4, 24, 25, 26, 27, 5, 6, 7, 8, 9, 10, 11, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43), (1, 18, 19, 20, 21, 22, 23, 2, 3, 4, 24, 25, 26, 27, 5, 6, 7, 8, 9, 10, 11, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 0, 12, 13, 14, 15, 16, 17), (2, 3, 4, 24, 25, 26, 27, 5, 6, 7, 8, 9, 10, 11, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 0, 12, 13, 14, 15, 16, 17, 1, 18, 19, 20, 21, 22, 23), (5, 6, 7, 8, 9, 10, 11, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 0, 12, 13, 14, 15, 16, 17, 1, 18, 19, 20, 21, 22, 23, 2, 3, 4, 24, 25, 26, 27))
 PHASE3_MOVES = ((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0), (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0, 1), (5, 6, 7, 8, 9, 10, 11, 0, 1, 2, 3, 4))
 
-#tables
-print("Loading tables...")
-try: PHASE1_PRUNING_TABLE = utils.import_data(PHASE1_PRUNING_TABLE_NAME)
-except FileNotFoundError: PHASE1_PRUNING_TABLE = None
-try: PHASE2_PRUNING_TABLE = utils.import_data(PHASE2_PRUNING_TABLE_NAME)
-except FileNotFoundError: PHASE2_PRUNING_TABLE = None
-try: PHASE3_PRUNING_TABLE = utils.import_data(PHASE3_PRUNING_TABLE_NAME)
-except FileNotFoundError: PHASE3_PRUNING_TABLE = None
-try: PERMUTATION_LIST_MOVE_TABLE = utils.import_data(PERMUTATION_LIST_MOVE_TABLE_FILENAME)
-except FileNotFoundError: PERMUTATION_LIST_MOVE_TABLE = np.empty((1, 15), dtype=np.uint8)
-try: A4_LIST_MOVE_TABLE = utils.import_data(A4_LIST_MOVE_TABLE_FILENAME)
-except FileNotFoundError: A4_LIST_MOVE_TABLE = np.empty((1, 15), dtype=np.uint8)
-try: C3_MOVE_TABLE = utils.import_data(C3_MOVE_TABLE_FILENAME)
-except FileNotFoundError: C3_MOVE_TABLE = None
-try: I_MOVE_TABLE = utils.import_data(I_MOVE_TABLE_FILENAME)
-except FileNotFoundError: I_MOVE_TABLE = None
-try: O_MOVE_TABLE = utils.import_data(O_MOVE_TABLE_FILENAME)
-except FileNotFoundError: O_MOVE_TABLE = None
-try: IO_MOVE_TABLE = utils.import_data(IO_MOVE_TABLE_FILENAME)
-except FileNotFoundError: IO_MOVE_TABLE = None
-print("Done")
\ No newline at end of file
+#twist data as arrays for the compiled searches
+TWIST_AXES_ARRAY = np.array(TWIST_AXES, dtype=np.uint8)
+PHASE2_MOVES_ARRAY = np.array(PHASE2_MOVES, dtype=np.uint8)
+
+#tables are loaded the first time they are used (see __getattr__) and can be replaced by assigning to them
+def load_pruning_table(filename: str, max_depth: int):
+    try: return utils.import_pruning_table(filename, max_depth)
+    except FileNotFoundError: return None
+
+def load_exact_pruning_table(filename: str, max_depth: int, full_depth: int):
+    #pruning table which must hold the exact distance of every state
+    table = load_pruning_table(filename, max_depth)
+
+    if table is not None:
+        utils.check_exact_pruning_table(table.encoding, table.max_depth, full_depth, filename)
+    return table
+
+def load_data(filename: str, missing=None):
+    try: return utils.import_data(filename)
+    except FileNotFoundError: return missing
+
+def load_k4_chunk_move_table():
+    #packed K4 move table derived from the permutation and A4 list move tables
+    permutation_list_move_table = get_table("PERMUTATION_LIST_MOVE_TABLE")
+    a4_list_move_table = get_table("A4_LIST_MOVE_TABLE")
+
+    if permutation_list_move_table.shape == (1, 15) or a4_list_move_table.shape == (1, 15):
+        return None
+    return utils.gen_k4_chunk_move_table(permutation_list_move_table, a4_list_move_table)
+
+def load_symmetry_classes(table_name: str, gen_symmetry_classes):
+    #symmetry classes derived from a symmetry table
+    symmetry_table = get_table(table_name)
+
+    if symmetry_table is None:
+        return None
+    return gen_symmetry_classes(symmetry_table)
+
+TABLE_LOADERS = {
+    "PHASE1_PRUNING_TABLE": lambda: load_pruning_table(PHASE1_PRUNING_TABLE_NAME, PHASE1_PRUNE_DEPTH),
+    "PHASE2_PRUNING_TABLE": lambda: load_pruning_table(PHASE2_PRUNING_TABLE_NAME, PHASE2_PRUNE_DEPTH),
+    "PHASE3_PRUNING_TABLE": lambda: load_exact_pruning_table(PHASE3_PRUNING_TABLE_NAME, PHASE3_PRUNE_DEPTH, PHASE3_FULL_DEPTH),
+    "PERMUTATION_LIST_MOVE_TABLE": lambda: load_data(PERMUTATION_LIST_MOVE_TABLE_FILENAME, np.empty((1, 15), dtype=np.uint8)),
+    "A4_LIST_MOVE_TABLE": lambda: load_data(A4_LIST_MOVE_TABLE_FILENAME, np.empty((1, 15), dtype=np.uint8)),
+    "C3_MOVE_TABLE": lambda: load_data(C3_MOVE_TABLE_FILENAME),
+    "I_MOVE_TABLE": lambda: load_data(I_MOVE_TABLE_FILENAME),
+    "O_MOVE_TABLE": lambda: load_data(O_MOVE_TABLE_FILENAME),
+    "IO_MOVE_TABLE": lambda: load_data(IO_MOVE_TABLE_FILENAME),
+    "K4_SYMMETRY_TABLE": lambda: load_data(K4_SYMMETRY_TABLE_FILENAME),
+    "C3_SYMMETRY_TABLE": lambda: load_data(C3_SYMMETRY_TABLE_FILENAME),
+    "IO_SYMMETRY_TABLE": lambda: load_data(IO_SYMMETRY_TABLE_FILENAME),
+    "K4_CHUNK_MOVE_TABLE": load_k4_chunk_move_table,
+    "K4_SYMMETRY_CLASSES": lambda: load_symmetry_classes("K4_SYMMETRY_TABLE", utils.gen_k4_symmetry_classes),
+    "IO_SYMMETRY_CLASSES": lambda: load_symmetry_classes("IO_SYMMETRY_TABLE", utils.gen_symmetry_classes),
+}
+
+def get_table(name: str):
+    '''
+    Returns the table with the given name, loading it if it has not been used yet
+    '''
+    if name not in globals():
+        globals()[name] = TABLE_LOADERS[name]()
+    return globals()[name]
+
+def load_tables():
+    '''
+    Loads every table which has not been used yet so that processes started afterwards share them
+    '''
+    for name in TABLE_LOADERS:
+        get_table(name)
+
+def __getattr__(name: str):
+    #only called for names which are not module globals, which includes tables that have not been loaded yet
+    if name in TABLE_LOADERS:
+        return get_table(name)
+    raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
@@ -1,17 +1,22 @@
+import os
+import sys
+
 import gen_move_tables
 import phase1
 import phase2
 import phase3
 import defs
 
-def gen_data_if_missing():
-    #generate any data that is missing
+def gen_data_if_missing(n_workers: int = 1):
+    #generate any data that is missing, using n_workers processes to generate the pruning tables
 
     #must be done first
     if defs.PERMUTATION_LIST_MOVE_TABLE.shape == (1, 15) or defs.A4_LIST_MOVE_TABLE.shape == (1, 15):
         gen_move_tables.gen_k4_and_permutation_move_table()
 
     #then these can be generated
+    if defs.K4_SYMMETRY_TABLE is None:
+        gen_move_tables.gen_K4_symmetry_table()
     if defs.C3_MOVE_TABLE is None:
         gen_move_tables.gen_c3_move_table()
     if defs.IO_MOVE_TABLE is None:
@@ -20,11 +25,32 @@ def gen_data_if_missing():
         gen_move_tables.gen_I_move_table()
     if defs.O_MOVE_TABLE is None:
         gen_move_tables.gen_O_move_table()
+    if defs.C3_SYMMETRY_TABLE is None:
+        gen_move_tables.gen_C3_symmetry_table()
+    if defs.IO_SYMMETRY_TABLE is None:
+        gen_move_tables.gen_IO_symmetry_table()
 
     #then we can generate the pruning tables
     if defs.PHASE1_PRUNING_TABLE is None:
-        phase1.prune()
+        phase1.prune(n_workers)
     if defs.PHASE2_PRUNING_TABLE is None:
-        phase2.prune()
+        phase2.prune(n_workers)
     if defs.PHASE3_PRUNING_TABLE is None:
-        phase3.prune()
\ No newline at end of file
+        phase3.prune(n_workers)
+
+def resume(n_workers: int = 1):
+    '''
+    Continues generating any pruning tables from their last checkpoint and then generates any other missing data
+
+    n_workers: the number of worker processes used to generate the pruning tables
+    '''
+    for checkpoint, prune in ((defs.PHASE1_PRUNING_CHECKPOINT_NAME, phase1.prune), (defs.PHASE2_PRUNING_CHECKPOINT_NAME, phase2.prune),
+                              (defs.PHASE3_PRUNING_CHECKPOINT_NAME, phase3.prune)):
+        if os.path.exists(checkpoint):
+            prune(n_workers)
+
+    gen_data_if_missing(n_workers)
+
+if __name__ == "__main__":
+    #run with the number of worker processes to use, otherwise one per core is used
+    resume(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count())
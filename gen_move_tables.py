@@ -2,7 +2,7 @@ import numpy as np
 from tqdm import trange
 
 import defs
-from cube_internal import Cubiecube, Stickercube
+from cube_internal import Cubiecube, CubieBatch, Stickercube
 import gen_twist_data
 import utils
 
@@ -28,98 +28,166 @@ def gen_k4_and_permutation_move_table():
     #save the data
     defs.PERMUTATION_LIST_MOVE_TABLE = permutation_list_table
     defs.A4_LIST_MOVE_TABLE = a4_list_table
+    defs.K4_CHUNK_MOVE_TABLE = utils.gen_k4_chunk_move_table(permutation_list_table, a4_list_table)
     utils.write_data(permutation_list_table, defs.PERMUTATION_LIST_MOVE_TABLE_FILENAME)
     utils.write_data(a4_list_table, defs.A4_LIST_MOVE_TABLE_FILENAME)
 
+def gen_permutation_move_table(n_moves: int, permutations: np.ndarray, get_coords) -> np.ndarray:
+    '''
+    Returns the move table of a permutation coordinate
+
+    n_moves: the number of moves
+    permutations: the permutations of every coordinate with shape (N, 15)
+    get_coords: function taking a cubie batch and returning the coordinates of the cubes
+    '''
+    cubes = CubieBatch(permutations=permutations)
+
+    move_table = np.empty((n_moves, len(cubes)), dtype=np.uint16)
+    for j in trange(n_moves, leave=False, desc="Moves"):
+        move_table[j] = get_coords(cubes.apply_move_new(j))
+
+    return move_table
+
 def gen_c3_move_table():
     print("Generating C3 move table...")
     #initialize empty move table for the c3 coordinate in phase 2
     c3_move_table = np.empty((defs.N_PHASE2_MOVES, defs.N_C3_COORD_STATES), dtype=np.uint32)
 
-    for i in trange(defs.N_C3_COORD_STATES, leave=False, desc="C3 states"):
+    chunk_size = 2**16
 
-        #get a cube with the desired orientation
-        cube = Cubiecube.from_c3_coord(i)
+    for start in trange(0, defs.N_C3_COORD_STATES, chunk_size, leave=False, desc="C3 states"):
+        #get the cubies of the chunk with the desired orientation
+        a4s = utils.int_to_c3_lists(np.arange(start, min(start + chunk_size, defs.N_C3_COORD_STATES), dtype=np.uint32))
 
-        #for every coordinate
         for j in range(defs.N_PHASE2_MOVES):
-    
-            #apply the twist
-            new_cube = cube.apply_move_new(j)
+            #apply the twist (the permutation is not needed) and save the resulting orientations in the move table
+            new_a4s = utils.permute_a4_lists(a4s, defs.PERMUTATION_LIST_MOVE_TABLE[j], defs.A4_LIST_MOVE_TABLE[j])
+            c3_move_table[j, start:start + len(a4s)] = utils.c3_lists_to_int(new_a4s % 3)
 
-            #save the resulting orientation in the move table
-            c3_move_table[j, i] = new_cube.get_c3_coord()
-    
     #save the data
     defs.C3_MOVE_TABLE = c3_move_table
     utils.write_data(c3_move_table, defs.C3_MOVE_TABLE_FILENAME)
 
 def gen_IO_move_table():
     print("Generating IO move table...")
-    #initialize empty move table for the IO coordinate in phase 2
-    IO_move_table = np.empty((defs.N_PHASE2_MOVES, defs.N_IO_COORD_STATES), dtype=np.uint16)
+    coords = np.arange(defs.N_IO_COORD_STATES, dtype=np.uint16)
+    zeros = np.zeros_like(coords)
 
-    for i in trange(defs.N_IO_COORD_STATES, leave=False, desc="IO states"):
+    IO_move_table = gen_permutation_move_table(defs.N_PHASE2_MOVES, utils.coords_to_permutations(coords, zeros, zeros), CubieBatch.get_IO_coords)
 
-        #get a cube with the desired orientation
-        cube = Cubiecube.from_permutation_coords(i, 0, 0)
-
-        #for every coordinate
-        for j in range(defs.N_PHASE2_MOVES):
-        
-            #apply the twist
-            new_cube = cube.apply_move_new(j)
-
-            #save the resulting orientation in the move table
-            IO_move_table[j, i] = new_cube.get_IO_coord()
-    
     #save the data
     defs.IO_MOVE_TABLE = IO_move_table
     utils.write_data(IO_move_table, defs.IO_MOVE_TABLE_FILENAME)
 
 def gen_I_move_table():
     print("Generating I move table...")
-    #initialize empty move table for the IO coordinate in phase 3
-    I_move_table = np.empty((defs.N_PHASE3_MOVES, defs.N_I_COORD_STATES), dtype=np.uint16)
-
-    #for every coordinate
-    for i in trange(defs.N_I_COORD_STATES, desc="I states"):
-        
-        #get a cube with the desired orientation
-        cube = Cubiecube.from_permutation_coords(0, i, 0)
+    coords = np.arange(defs.N_I_COORD_STATES, dtype=np.uint16)
+    zeros = np.zeros_like(coords)
 
-        for j in range(defs.N_PHASE3_MOVES):
+    I_move_table = gen_permutation_move_table(defs.N_PHASE3_MOVES, utils.coords_to_permutations(zeros, coords, zeros), CubieBatch.get_I_coords)
 
-            #apply the twist
-            new_cube = cube.apply_move_new(j)
-
-            #save the resulting orientation in the move table
-            I_move_table[j, i] = new_cube.get_I_coord()
-    
     #save the data
     defs.I_MOVE_TABLE = I_move_table
     utils.write_data(I_move_table, defs.I_MOVE_TABLE_FILENAME)
 
 def gen_O_move_table():
     print("Generating O move table...")
-    #initialize empty move table for the IO coordinate in phase 3
-    O_move_table = np.empty((defs.N_PHASE3_MOVES, defs.N_O_COORD_STATES), dtype=np.uint16)
+    coords = np.arange(defs.N_O_COORD_STATES, dtype=np.uint16)
+    zeros = np.zeros_like(coords)
+
+    O_move_table = gen_permutation_move_table(defs.N_PHASE3_MOVES, utils.coords_to_permutations(zeros, zeros, coords), CubieBatch.get_O_coords)
+
+    #save the data
+    defs.O_MOVE_TABLE = O_move_table
+    utils.write_data(O_move_table, defs.O_MOVE_TABLE_FILENAME)
 
-    for i in trange(defs.N_O_COORD_STATES, desc="O States"):
+def gen_K4_symmetry_table():
+    print("Generating K4 symmetry table...")
 
-        #get a cube with the desired orientation
-        cube = Cubiecube.from_permutation_coords(0, 0, i)
+    #the symmetries must map phase 1 moves to phase 1 moves for symmetric states to have the same distance. Symmetries which split axes 0 and 1
+    #cannot conjugate cubiecubes so the moves are conjugated as stickercubes
+    twists = gen_twist_data.gen_twist_order()
+    move_cubes = [Cubiecube().apply_move_new(j) for j in range(defs.N_PHASE1_MOVES)]
+    for axes in defs.PHASE1_SYMMETRIES:
+        for j in range(defs.N_PHASE1_MOVES):
+            if Stickercube().twist_new(twists[j]).conjugate_new(axes).to_cubiecube() not in move_cubes:
+                raise ValueError("Symmetry " + str(axes) + " does not preserve the phase 1 moves")
 
-        #for every move
-        for j in range(defs.N_PHASE3_MOVES):
+    location_maps = np.empty((len(defs.PHASE1_SYMMETRIES), 15), dtype=np.uint8)
+    k4_maps = np.empty((len(defs.PHASE1_SYMMETRIES), 15, 4), dtype=np.uint8)
 
-            #apply the twist
-            new_cube = cube.apply_move_new(j)
+    for i, axes in enumerate(defs.PHASE1_SYMMETRIES):
+        location_maps[i], k4_maps[i] = Stickercube.get_k4_symmetry_maps(axes)
+
+        #the symmetry classes split the packed K4 state between locations 0 to 7 and 8 to 14
+        if np.any(location_maps[i, :8] >= 8):
+            raise ValueError("Symmetry " + str(axes) + " does not keep locations 0 to 7 together")
+
+    K4_symmetry_table = utils.gen_k4_chunk_symmetry_table(location_maps, k4_maps)
 
-            #save the resulting orientation in the move table
-            O_move_table[j, i] = new_cube.get_O_coord()
-    
     #save the data
-    defs.O_MOVE_TABLE = O_move_table
-    utils.write_data(O_move_table, defs.O_MOVE_TABLE_FILENAME)
+    defs.K4_SYMMETRY_TABLE = K4_symmetry_table
+    defs.K4_SYMMETRY_CLASSES = utils.gen_k4_symmetry_classes(K4_symmetry_table)
+    utils.write_data(K4_symmetry_table, defs.K4_SYMMETRY_TABLE_FILENAME)
+
+def gen_C3_symmetry_table():
+    print("Generating C3 symmetry table...")
+    #initialize empty symmetry table for the c3 coordinate in phase 2
+    c3_symmetry_table = np.empty((len(defs.PHASE2_SYMMETRIES), defs.N_C3_COORD_STATES), dtype=np.uint32)
+
+    chunk_size = 2**16
+
+    for i, axes in enumerate(defs.PHASE2_SYMMETRIES):
+        location_map, a4_map = Cubiecube.get_symmetry_maps(axes)
+
+        for start in trange(0, defs.N_C3_COORD_STATES, chunk_size, leave=False, desc="C3 states"):
+            coords = np.arange(start, min(start + chunk_size, defs.N_C3_COORD_STATES))
+
+            #get the c3 lists of the chunk with the last piece determined by the parity
+            c3_lists = np.empty((len(coords), 15), dtype=np.uint8)
+            c3_lists[:, :14] = coords[:, None] // 3**np.arange(14) % 3
+            c3_lists[:, 14] = -np.sum(c3_lists[:, :14], axis=1, dtype=np.int32) % 3
+
+            #move each orientation to its new location
+            new_c3_lists = np.empty_like(c3_lists)
+            new_c3_lists[:, location_map] = a4_map[c3_lists]
+
+            c3_symmetry_table[i, start:start + len(coords)] = utils.c3_lists_to_int(new_c3_lists)
+
+    #save the data
+    defs.C3_SYMMETRY_TABLE = c3_symmetry_table
+    utils.write_data(c3_symmetry_table, defs.C3_SYMMETRY_TABLE_FILENAME)
+
+def gen_IO_symmetry_table():
+    print("Generating IO symmetry table...")
+
+    #the symmetries must map phase 2 moves to phase 2 moves for symmetric states to have the same distance
+    move_cubes = [Cubiecube().apply_move_new(j) for j in range(defs.N_PHASE2_MOVES)]
+    for axes in defs.PHASE2_SYMMETRIES:
+        for cube in move_cubes:
+            if cube.conjugate_new(axes) not in move_cubes:
+                raise ValueError("Symmetry " + str(axes) + " does not preserve the phase 2 moves")
+
+    #initialize empty symmetry table for the IO coordinate in phase 2
+    IO_symmetry_table = np.empty((len(defs.PHASE2_SYMMETRIES), defs.N_IO_COORD_STATES), dtype=np.uint16)
+
+    for j, axes in enumerate(defs.PHASE2_SYMMETRIES):
+        #the IO coordinate only depends on the permutation so only the location map is needed
+        location_map, _ = Cubiecube.get_symmetry_maps(axes)
 
+        for i in trange(defs.N_IO_COORD_STATES, leave=False, desc="IO states"):
+
+            #get a cube with the desired permutation
+            cube = Cubiecube.from_permutation_coords(i, 0, 0)
+
+            #conjugate the permutation
+            permutation = np.empty_like(cube.permutation)
+            permutation[location_map] = location_map[cube.permutation]
+
+            #save the conjugated IO coordinate in the symmetry table
+            IO_symmetry_table[j, i] = Cubiecube(permutation=permutation).get_IO_coord()
+
+    #save the data
+    defs.IO_SYMMETRY_TABLE = IO_symmetry_table
+    defs.IO_SYMMETRY_CLASSES = utils.gen_symmetry_classes(IO_symmetry_table)
+    utils.write_data(IO_symmetry_table, defs.IO_SYMMETRY_TABLE_FILENAME)
@@ -1,6 +1,10 @@
 import numpy as np
-import tkinter as tk
-from tkinter import filedialog
+
+#tkinter is only needed for the file dialogs so logs can be read and written on machines without it
+try:
+    import tkinter as tk
+    from tkinter import filedialog
+except ImportError: tk = None
 
 from twist import Twist
 
@@ -93,6 +97,8 @@ class Log:
         '''
 
         #create a gui
+        if tk is None:
+            raise RuntimeError("tkinter is required to choose a log file")
         root = tk.Tk()
         root.withdraw()
 
@@ -122,20 +128,34 @@ class Log:
 
         #try to open the file
         try:
-            file = open(file_path, "r")
+            with open(file_path, "r") as file:
+                string = file.read()
         except FileNotFoundError: 
             print("Cannot open log file, invalid filepath.")
             return None
-      
-        
-        first_line = file.readline()
-        if first_line[:11] != "MagicCube4D" or first_line[-10:-1] != "{4,3,3} 2":
-            print("File is not a 2^4 MC4D log file!")
+
+        try:
+            return cls.from_string(string, file_path)
+        except ValueError as error:
+            print(error)
             return None
+
+    @classmethod
+    def from_string(cls, string: str, file_path: str = None):
+        '''
+        Returns a MC4DLog object from the contents of an MC4D log file, raising ValueError if it is not a 2^4 log
+
+        string: the contents of the log file
+        file_path: the path the log will be saved to
+        '''
+        lines = string.splitlines(keepends=True)
+
+        first_line = lines[0] if lines else ""
+        if first_line[:11] != "MagicCube4D" or first_line.rstrip("\r\n")[-9:] != "{4,3,3} 2":
+            raise ValueError("File is not a 2^4 MC4D log file!")
         
-        moves = " ".join(file.readlines()[5:]).strip().rstrip(".")
-        
-        file.close()
+        #the moves follow the header line, the 4 lines of the view matrix and the separator line
+        moves = " ".join(lines[6:]).strip().rstrip(".")
 
         if "m|" in moves:
             scramble_moves, solution_moves = moves.split("m|")
@@ -171,6 +191,8 @@ class Log:
         '''
 
         #create a gui
+        if tk is None:
+            raise RuntimeError("tkinter is required to choose a log file")
         root = tk.Tk()
         root.withdraw()
 
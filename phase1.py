@@ -1,119 +1,129 @@
 import numpy as np
 import numba as nb
-from tqdm import trange
 
 import defs
 import utils
 
+#number of solutions returned by each call to the compiled search
+SOLUTION_BATCH_SIZE = 64
+
 class Node(utils.BaseNode):
     '''
     Contains the data for a phase 1 node and the functionality to generate new nodes by applying moves.
     '''
 
-    __slots__ = ("list",)
+    __slots__ = ()
 
-    def __init__(self, index: int) -> None:
-        super().__init__(index)
-        self.list = utils.int_to_base(self.index, 4, 15)
+    @property
+    def list(self):
+        '''
+        The K4 list of the node
+        '''
+        return utils.int_to_base(self.index, 4, 15)
     
     @classmethod
     def from_list(cls, list):
         node = cls.__new__(cls)
-        node.list = list
-        node.index = utils.base_to_int(list, 4)
+        node.index = utils.k4_list_to_int(list)
         return node
        
     def apply_move(self, move: int):
-        new_list = apply_move(move, self.list)
-        new_index = utils.base_to_int(new_list, 4)
-        
         new_node = Node.__new__(Node)
-        new_node.index = new_index
-        new_node.list = new_list
+        new_node.index = apply_move(move, self.index, defs.K4_CHUNK_MOVE_TABLE)
         return new_node
 
-@nb.njit(nb.uint8[:](nb.uint8, nb.uint8[:]))
-def apply_move(move: int, k4_state: np.ndarray) -> int:
+@nb.njit(nb.uint32(nb.uint8, nb.uint32, nb.uint32[:, :, ::1]), cache=True)
+def apply_move(move: int, index: int, k4_chunk_move_table: np.ndarray) -> int:
     '''
-    Calculates the K4 list state resulting from applying the given move on the K4 list state
+    Calculates the packed K4 state (node index) resulting from applying the given move on the packed K4 state
+
+    move: the move to apply
+    index: the packed K4 state
+    k4_chunk_move_table: the table from utils.gen_k4_chunk_move_table
     '''
-    #apply the permutation
-    new_k4_state = k4_state[defs.PERMUTATION_LIST_MOVE_TABLE[move]]
+    return (k4_chunk_move_table[move, 0, index & 255] | k4_chunk_move_table[move, 1, (index >> 8) & 255]
+            | k4_chunk_move_table[move, 2, (index >> 16) & 255] | k4_chunk_move_table[move, 3, index >> 24])
 
-    #apply the group multiplication
-    #utils.k4_table[new_k4_state, move_tables.a4_list[move]]
+def apply_move_to_indices(nodes: np.ndarray, move: int) -> np.ndarray:
+    '''
+    Returns the indices of the nodes resulting from applying the move to an array of node indices
+    '''
+    table = defs.K4_CHUNK_MOVE_TABLE[move]
 
-    result = np.empty(15, dtype=np.uint8)
-    for i in range(15):
-        result[i] = utils.k4_table[new_k4_state[i], defs.A4_LIST_MOVE_TABLE[move, i]]
+    return table[0][nodes & 255] | table[1][(nodes >> 8) & 255] | table[2][(nodes >> 16) & 255] | table[3][nodes >> 24]
 
-    return result
+@nb.njit(nb.uint32(nb.uint8, nb.uint32, nb.uint32[:, :, ::1]), cache=True)
+def conjugate(symmetry: int, index: int, k4_chunk_symmetry_table: np.ndarray) -> int:
+    '''
+    Calculates the packed K4 state (node index) resulting from conjugating the packed K4 state by the given symmetry
 
-def prune():
+    symmetry: the index of the symmetry in defs.PHASE1_SYMMETRIES
+    index: the packed K4 state
+    k4_chunk_symmetry_table: the table from utils.gen_k4_chunk_symmetry_table
     '''
-    Calculates and saves the pruning table
+    return (k4_chunk_symmetry_table[symmetry, 0, index & 255] | k4_chunk_symmetry_table[symmetry, 1, (index >> 8) & 255]
+            | k4_chunk_symmetry_table[symmetry, 2, (index >> 16) & 255] | k4_chunk_symmetry_table[symmetry, 3, index >> 24])
+
+@nb.njit
+def get_reduced_index(index: int, k4_chunk_symmetry_table: np.ndarray, k4_classes: utils.SymmetryClasses) -> int:
     '''
-    print("Generating Phase 1 Pruning Table...")
+    Returns the index of the node in the symmetry reduced pruning table (symmetric nodes have the same index). The reduced index is the
+    class of the pieces in locations 8 to 14 followed by the 16 bits of the pieces in locations 0 to 7 conjugated to match the class representative.
+    '''
+    upper = np.uint32(index) >> 16
+    upper_class = k4_classes.class_index[upper]
+    lower = conjugate(k4_classes.symmetry[upper], index, k4_chunk_symmetry_table) & 65535
 
-    #initialize the distance array with all entries as max_depth + 1
-    distance = np.full(defs.N_PHASE1_STATES, defs.PHASE1_PRUNE_DEPTH+1, dtype=np.uint8)
-
-    #queue contains a tuple of (k4_state_index, last_move_axis)
-    #initialize 2 queues with the first one having the solved state in it
-    queues = [[(np.uint32(0), np.uint8(-1))],[]]
-
-    #set the solved state
-    distance[0] = 0
-
-    #defines which queue we are currently working out of
-    current_queue = 0
-
-    #current distance from solved
-    current_depth = 0
-
-    #while any of the queues are full and we are below the max depth
-    while (queues) and (current_depth < defs.PHASE1_PRUNE_DEPTH):
-
-        #for every node in the queue
-        for j in trange(len(queues[current_queue]), leave=False, desc="Exploring Depth " + str(current_depth+1)):
-            
-            #dequeue a node
-            node, axis = queues[current_queue].pop()
-
-            #compute the list representation of the node
-            node_list = utils.int_to_base(node, 4, 15)
-
-            #for every move in PHASE 1
-            for i in defs.PHASE1_MOVES[(axis + 1) % 4]:
-
-                #check if the move is redundant given the last move
-                if axis == defs.TWIST_AXES[i]:
-                    break
-                
-                #get the new node list
-                new_node_list = apply_move(i, node_list)
-
-                #get the index of this new node
-                new_node = utils.base_to_int(new_node_list, 4)
-               
-                #if the node has not been visited
-                if distance[new_node] == defs.PHASE1_PRUNE_DEPTH + 1:
-                    #update the distance
-                    distance[new_node] = current_depth + 1
-                    
-                    #add the move to a queue if it will be within the maximum depth
-                    if current_depth + 1 < defs.PHASE1_PRUNE_DEPTH:
-                        queues[np.mod(current_queue + 1, 2)].append((new_node, defs.TWIST_AXES[i]))
-    
-        #cycle which queue we are working out of
-        current_queue = np.mod(current_queue + 1, 2)
+    #if other symmetries fix the representative then choose the smallest lower bits they give
+    reduced_lower = lower
+    for symmetry in range(1, len(k4_chunk_symmetry_table)):
+        if k4_classes.stabilizer[upper_class, symmetry]:
+            reduced_lower = min(reduced_lower, conjugate(symmetry, lower, k4_chunk_symmetry_table))
+
+    return (np.int64(upper_class) << 16) | reduced_lower
+
+@nb.njit
+def get_reduced_indices(indices: np.ndarray, k4_chunk_symmetry_table: np.ndarray, k4_classes: utils.SymmetryClasses) -> np.ndarray:
+    '''
+    Returns the symmetry reduced pruning table indices for an array of node indices
+    '''
+    reduced_indices = np.empty(len(indices), dtype=np.int64)
+    for i in range(len(indices)):
+        reduced_indices[i] = get_reduced_index(indices[i], k4_chunk_symmetry_table, k4_classes)
+    return reduced_indices
+
+def apply_move_to_reduced_indices(indices: np.ndarray, move: int) -> np.ndarray:
+    '''
+    Returns the symmetry reduced indices of the nodes resulting from applying the move to the representatives of an array of symmetry reduced indices
+    '''
+    nodes = (defs.K4_SYMMETRY_CLASSES.representative[indices >> 16].astype(np.int64) << 16) | (indices & 65535)
+
+    return get_reduced_indices(apply_move_to_indices(nodes, move), defs.K4_SYMMETRY_TABLE, defs.K4_SYMMETRY_CLASSES)
+
+@nb.njit
+def apply_move_to_reduced_index(move: int, index: int, k4_chunk_move_table: np.ndarray, k4_chunk_symmetry_table: np.ndarray,
+                                k4_classes: utils.SymmetryClasses) -> int:
+    '''
+    Returns the symmetry reduced index of the node resulting from applying the move to the representative of the symmetry reduced index
+    '''
+    node = (np.uint32(k4_classes.representative[index >> 16]) << 16) | np.uint32(index & 65535)
+
+    return get_reduced_index(apply_move(move, node, k4_chunk_move_table), k4_chunk_symmetry_table, k4_classes)
+
+def prune(n_workers: int = 1):
+    '''
+    Calculates and saves the symmetry reduced pruning table
+
+    n_workers: the number of worker processes used to generate the table
+    '''
+    print("Generating Phase 1 Pruning Table...")
 
-        #add 1 to the current distance
-        current_depth += 1
+    table = utils.prune_breadth_first(defs.N_PHASE1_REDUCED_STATES, defs.PHASE1_PRUNE_DEPTH, defs.N_PHASE1_MOVES, apply_move_to_reduced_indices, defs.PHASE1_PRUNING_TABLE_ENCODING,
+                                      defs.PHASE1_PRUNING_CHECKPOINT_NAME, n_workers)
 
     #write the data
-    defs.PHASE1_PRUNING_TABLE = distance
-    utils.write_data(distance, defs.PHASE1_PRUNING_TABLE_NAME)
+    defs.PHASE1_PRUNING_TABLE = table
+    utils.write_pruning_table(table, defs.PHASE1_PRUNING_TABLE_NAME)
 
     return
 
@@ -131,14 +141,14 @@ def can_solve(node: Node, moves: int) -> bool:
         return False
 
     #get the value from the pruning table
-    pruneVal = defs.PHASE1_PRUNING_TABLE[node.index]
+    pruneVal = get_distance(node)
 
     #the number of moves is less than the lower bound then return false
     if moves < pruneVal:
         return False
 
     #if the pruning table value is less than or equal to the pruning depth then we can find out easily
-    if pruneVal <= defs.PHASE1_PRUNE_DEPTH:
+    if pruneVal <= defs.PHASE1_PRUNING_TABLE.max_depth:
         return pruneVal <= moves
     
     #for every move
@@ -153,96 +163,177 @@ def can_solve(node: Node, moves: int) -> bool:
     #if no new states are solvable in the required number of moves then return false
     return False
 
-def solution_generator(node: Node):
+@nb.njit
+def scan_distance(table: utils.PruningTable, index: int, k4_chunk_move_table: np.ndarray, k4_chunk_symmetry_table: np.ndarray,
+                  k4_classes: utils.SymmetryClasses) -> int:
+    '''
+    Returns the distance from solved of a visited entry of a mod 3 symmetry reduced pruning table
+    '''
+    return utils.scan_distance(table, index, defs.N_PHASE1_MOVES, apply_move_to_reduced_index, k4_chunk_move_table, k4_chunk_symmetry_table, k4_classes)
+
+def get_distance(node: Node) -> int:
+    '''
+    Returns the distance of the node from solved according to the pruning table
+    '''
+    index = get_reduced_index(node.index, defs.K4_SYMMETRY_TABLE, defs.K4_SYMMETRY_CLASSES)
+
+    return utils.get_distance(defs.PHASE1_PRUNING_TABLE, index, scan_distance, defs.K4_CHUNK_MOVE_TABLE, defs.K4_SYMMETRY_TABLE, defs.K4_SYMMETRY_CLASSES)
+
+def solution_generator(node: Node, bound: np.ndarray = None, offset: int = 0, counters: np.ndarray = None, poll_interval: int = utils.BOUND_POLL_INTERVAL,
+                       poll = None):
     '''
     A generator which returns all solutions for the node in order of increasing length
 
     node: the node to be solved
+    bound: array whose first entry is the length which solutions must be shorter than (may be lowered during the search by other searches)
+    offset: the number of moves added to the solutions before they are compared with the bound
+    counters: counters which the work done by the search is added to
+    poll_interval: the number of nodes generated between checks of the bound
+    poll: function called at each check of the bound which may lower the bound to stop the search
     '''
+    if bound is None:
+        bound = np.array([np.iinfo(np.int64).max])
+    if counters is None:
+        counters = utils.new_counters()
 
     #initialize the maximum search depth to the lower bound from the pruning table
-    depth = defs.PHASE1_PRUNING_TABLE[node.index]
+    distance = get_distance(node)
+    depth = distance
 
-    #initialize an empty sequence
-    sequence = []
+    while True:
+        #stop once the solutions can no longer be shorter than the bound
+        if depth + offset >= bound[0]:
+            counters[utils.COUNTER_CUT_SEARCHES] += 1
+            return
+
+        #the search does not visit the node itself so check for the empty solution separately
+        if depth == 0:
+            if node.index == 0:
+                yield []
+            depth += 1
+            continue
 
-    #create a solution generator
-    solutions = search_generator(node, sequence, depth)
+        #initialize the search stack with the node at the bottom
+        stack_index = np.empty(depth, dtype=np.uint32)
+        stack_distance = np.empty(depth, dtype=np.uint8)
+        stack_axis = np.empty(depth, dtype=np.uint8)
+        stack_cursor = np.zeros(depth, dtype=np.uint8)
+        sequence = np.empty(depth, dtype=np.uint8)
+        solutions = np.empty((SOLUTION_BATCH_SIZE, depth), dtype=np.uint8)
+        state = np.array([0, 0, poll_interval], dtype=np.int64)
+
+        stack_index[0] = node.index
+        #no move has been applied at the bottom of the stack so use an axis that matches no move
+        stack_distance[0] = distance
+        stack_axis[0] = 4
+
+        #yield every solution at this depth a batch at a time
+        while True:
+            n_solutions = search(stack_distance, stack_index, stack_axis, stack_cursor, sequence, solutions, state, depth, defs.K4_CHUNK_MOVE_TABLE,
+                                 defs.K4_SYMMETRY_TABLE, defs.K4_SYMMETRY_CLASSES, defs.PHASE1_PRUNING_TABLE, bound, offset, poll_interval)
+
+            counters[utils.COUNTER_NODES] += state[1]
+            state[1] = 0
+
+            #the bound was lowered to the depth during the search
+            if n_solutions == utils.SEARCH_CUT:
+                counters[utils.COUNTER_CUT_SEARCHES] += 1
+                return
+
+            for i in range(n_solutions):
+                yield solutions[i].tolist()
+
+            #the search at this depth is exhausted
+            if state[0] < 0:
+                break
 
-    #while there is no solution
-    while not next(solutions):
-        #increase the depth of the solution generator
-        depth += 1
-        solutions = search_generator(node, sequence, depth)
-    
-    #yield the first solution found
-    yield sequence
-    
-    #yield all subsequent solutions
-    while True:
-        #yield each solution
-        for _ in solutions:
-            yield sequence
+            #otherwise the search stopped for a check of the bound or a full batch so let the caller check its limits
+            if poll is not None:
+                poll()
+            if depth + offset >= bound[0]:
+                counters[utils.COUNTER_CUT_SEARCHES] += 1
+                return
 
-        #increase the depth of the generator
+        #increase the depth and start again
         depth += 1
-        solutions = search_generator(node, sequence, depth)
-
 
-def search_generator(node: Node, sequence: list, depth: int):
+@nb.njit
+def search(stack_distance, stack_index, stack_axis, stack_cursor, sequence, solutions, state, depth, k4_chunk_move_table, k4_chunk_symmetry_table, k4_classes,
+           pruning_table, bound, offset, poll_interval):
     '''
-    A generator which returns false if no solution was found and true if solutions were found. The solution sequence is stored in sequence.
-
-    node: the node which is being searched
-    sequence: the sequence of moves which was applied to get to node
-    depth: the maximum depth of the search
+    Depth first search for solutions of exactly 'depth' moves using an explicit stack. Solutions are stored in solutions and the number found is returned.
+    The search stops when solutions is full, at each check of the bound or when there are no more solutions (the level in state is then -1).
+    Calling it again with the same arrays resumes the search. If a check of the bound finds that solutions of this depth are no longer short
+    enough then the search is abandoned and SEARCH_CUT is returned.
+
+    stack_distance: the pruning value of the node at each level of the stack
+    stack_index: the index (packed K4 state) of the node at each level of the stack
+    stack_axis: the axis of the move which produced the node at each level
+    stack_cursor: the next move to try at each level
+    sequence: the moves applied to get to each level of the stack
+    solutions: array which the solutions are written to
+    state: the current level of the stack, the number of nodes generated so far and the number of nodes until the next check of the bound
+    depth: the length of the solutions
+    k4_chunk_move_table, k4_chunk_symmetry_table, k4_classes, pruning_table: the phase 1 tables
+    bound, offset, poll_interval: the bound which the solutions plus offset moves must be shorter than and the number of nodes between checks of it
     '''
 
-    #save the sequence length
-    seqLen = len(sequence)
+    level = state[0]
+    n_solutions = 0
 
-    #get the lower bound for the number of moves required to solve the original node
-    distGuess = seqLen + defs.PHASE1_PRUNING_TABLE[node.index]
+    while level >= 0:
+        #check the bound every poll_interval nodes
+        status = utils.poll_bound(state, bound, depth, offset, poll_interval)
+        if status == utils.SEARCH_CUT:
+            state[0] = -1
+            return utils.SEARCH_CUT
+        elif status == utils.SEARCH_POLL:
+            state[0] = level
+            return n_solutions
 
-    #if the minimum distance is more than the bound then yield the distance and then stop the generator
-    if distGuess > depth: 
-        yield False
-        return
-    
-    #if the node is the solution and we are at the full depth then yield true
-    if node.index == 0 and seqLen == depth: 
-        yield True
-        return
+        move = stack_cursor[level]
 
-    #no solution has been found yet
-    sol_found = False
+        #if every move has been tried then go back down the stack
+        if move == defs.N_PHASE1_MOVES:
+            level -= 1
+            continue
 
-    #for every move
-    for i in range(defs.N_PHASE1_MOVES):
+        stack_cursor[level] = move + 1
 
         #don't try redundant moves
-        if (not seqLen == 0) and (defs.TWIST_AXES[i] == defs.TWIST_AXES[sequence[-1]]):
+        if defs.TWIST_AXES_ARRAY[move] == stack_axis[level]:
             continue
-        
+
         #get the new node
-        new_node = node.apply_move(i)
+        index = apply_move(move, stack_index[level], k4_chunk_move_table)
+        state[1] += 1
+        state[2] -= 1
+
+        #if the minimum distance is more than the bound then skip this node
+        distance = utils.prune_value(pruning_table, get_reduced_index(index, k4_chunk_symmetry_table, k4_classes), stack_distance[level])
+        if level + 1 + distance > depth:
+            continue
 
-        #append the move to the path
-        sequence.append(i)
+        sequence[level] = move
 
-        #recursively continue searching
-        for sol in search_generator(new_node, sequence, depth):
+        #if we are at the full depth then check if the node is solved
+        if level + 1 == depth:
+            if index == 0:
+                solutions[n_solutions] = sequence
+                n_solutions += 1
 
-            #if a solution was found then yield true otherwise we can stop searching this node
-            if sol:
-                sol_found = True
-                yield True
-            else: 
-                break
+                #stop if there is no room for more solutions
+                if n_solutions == len(solutions):
+                    state[0] = level
+                    return n_solutions
+            continue
 
-        #remove the last move from the sequence since no solution was found
-        del sequence[-1]
+        #push the node onto the stack
+        level += 1
+        stack_index[level] = index
+        stack_distance[level] = distance
+        stack_axis[level] = defs.TWIST_AXES_ARRAY[move]
+        stack_cursor[level] = 0
 
-    #if no solution was found then return the minimum distance it could be from solved
-    if not sol_found:
-        yield False
\ No newline at end of file
+    state[0] = level
+    return n_solutions
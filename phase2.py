@@ -1,5 +1,5 @@
 import numpy as np
-from tqdm import trange
+import numba as nb
 
 import defs
 import utils
@@ -33,68 +33,83 @@ class Node(utils.BaseNode):
         new_node.io = new_io
         return new_node
 
-def prune():
+@nb.njit
+def get_reduced_index(c3: int, io: int, c3_symmetry_table: np.ndarray, io_classes: utils.SymmetryClasses) -> int:
     '''
-    Calculates and saves the pruning table
+    Returns the index of the node with the given coordinates in the symmetry reduced pruning table (symmetric nodes have the same index)
     '''
-    print("Generating Phase 2 Pruning Table...")
+    io_class = io_classes.class_index[io]
+    c3 = c3_symmetry_table[io_classes.symmetry[io], c3]
 
-    #initialize the distance array with all entries as max_depth + 1
-    distance = np.full(defs.N_PHASE2_STATES, defs.PHASE2_PRUNE_DEPTH+1, dtype=np.uint8)
-
-    #queue contains a tuple of (c3_coord, IO_coord, last_move_axis)
-    #initialize 2 queues with the first one having the solved state in it
-    queues = [[(np.uint32(0), np.uint16(0), np.uint8(-1))],[]]
-
-    #set the solved state
-    distance[0] = 0
-
-    #defines which queue we are currently working out of
-    current_queue = 0
-
-    #current distance from solved
-    current_depth = 0
-
-    #while any of the queues are full and we are below the max depth
-    while (queues) and (current_depth < defs.PHASE2_PRUNE_DEPTH):
-
-        #for every node in the queue
-        for j in trange(len(queues[current_queue]), leave=False, desc="Exploring Depth " + str(current_depth+1)):
-            
-            #dequeue a node
-            node_c3, node_IO, axis = queues[current_queue].pop()
-
-            #for every move in PHASE 2
-            for i in defs.PHASE2_MOVES[(axis + 1) % 4]:
-
-                #check if the move is redundant given the last move and break
-                if axis == defs.TWIST_AXES[i]:
-                    break
-                
-                #get the new node list
-                new_node_c3, new_node_IO = defs.C3_MOVE_TABLE[i, node_c3], defs.IO_MOVE_TABLE[i, node_IO]
-
-                #get the index of this new node
-                new_node = int(new_node_IO) * defs.N_C3_COORD_STATES + int(new_node_c3)
-               
-                #if the node has not been visited
-                if distance[new_node] == defs.PHASE2_PRUNE_DEPTH + 1:
-                    #update the distance
-                    distance[new_node] = current_depth + 1
-                    
-                    #add the move to a queue if it will be within the maximum depth
-                    if current_depth + 1 < defs.PHASE2_PRUNE_DEPTH:
-                        queues[np.mod(current_queue + 1, 2)].append((new_node_c3, new_node_IO, defs.TWIST_AXES[i]))
-    
-        #cycle which queue we are working out of
-        current_queue = np.mod(current_queue + 1, 2)
+    #if other symmetries fix the representative IO coordinate then choose the smallest C3 coordinate they give
+    reduced_c3 = c3
+    for symmetry in range(1, len(c3_symmetry_table)):
+        if io_classes.stabilizer[io_class, symmetry]:
+            reduced_c3 = min(reduced_c3, c3_symmetry_table[symmetry, c3])
+
+    return np.int64(io_class) * defs.N_C3_COORD_STATES + reduced_c3
+
+@nb.njit
+def get_reduced_indices(c3s: np.ndarray, ios: np.ndarray, c3_symmetry_table: np.ndarray, io_classes: utils.SymmetryClasses) -> np.ndarray:
+    '''
+    Returns the symmetry reduced pruning table indices for arrays of coordinates
+    '''
+    indices = np.empty(len(c3s), dtype=np.int64)
+    for i in range(len(c3s)):
+        indices[i] = get_reduced_index(c3s[i], ios[i], c3_symmetry_table, io_classes)
+    return indices
+
+def apply_move_to_reduced_indices(indices: np.ndarray, move: int) -> np.ndarray:
+    '''
+    Returns the symmetry reduced indices of the nodes resulting from applying the move to the representatives of an array of symmetry reduced indices
+    '''
+    io_classes, c3s = np.divmod(indices, defs.N_C3_COORD_STATES)
+    ios = defs.IO_SYMMETRY_CLASSES.representative[io_classes]
+
+    return get_reduced_indices(defs.C3_MOVE_TABLE[move][c3s], defs.IO_MOVE_TABLE[move][ios], defs.C3_SYMMETRY_TABLE, defs.IO_SYMMETRY_CLASSES)
+
+@nb.njit
+def apply_move_to_reduced_index(move: int, index: int, c3_move_table: np.ndarray, io_move_table: np.ndarray, c3_symmetry_table: np.ndarray,
+                                io_classes: utils.SymmetryClasses) -> int:
+    '''
+    Returns the symmetry reduced index of the node resulting from applying the move to the representative of the symmetry reduced index
+    '''
+    io_class, c3 = divmod(np.int64(index), defs.N_C3_COORD_STATES)
+    io = io_classes.representative[io_class]
 
-        #add 1 to the current distance
-        current_depth += 1
+    return get_reduced_index(c3_move_table[move, c3], io_move_table[move, io], c3_symmetry_table, io_classes)
+
+@nb.njit
+def scan_distance(table: utils.PruningTable, index: int, c3_move_table: np.ndarray, io_move_table: np.ndarray, c3_symmetry_table: np.ndarray,
+                  io_classes: utils.SymmetryClasses) -> int:
+    '''
+    Returns the distance from solved of a visited entry of a mod 3 symmetry reduced pruning table
+    '''
+    return utils.scan_distance(table, index, defs.N_PHASE2_MOVES, apply_move_to_reduced_index, c3_move_table, io_move_table, c3_symmetry_table, io_classes)
+
+def get_distance(node: Node) -> int:
+    '''
+    Returns the distance of the node from solved according to the pruning table
+    '''
+    index = get_reduced_index(node.c3, node.io, defs.C3_SYMMETRY_TABLE, defs.IO_SYMMETRY_CLASSES)
+
+    return utils.get_distance(defs.PHASE2_PRUNING_TABLE, index, scan_distance, defs.C3_MOVE_TABLE, defs.IO_MOVE_TABLE, defs.C3_SYMMETRY_TABLE,
+                              defs.IO_SYMMETRY_CLASSES)
+
+def prune(n_workers: int = 1):
+    '''
+    Calculates and saves the symmetry reduced pruning table
+
+    n_workers: the number of worker processes used to generate the table
+    '''
+    print("Generating Phase 2 Pruning Table...")
+
+    table = utils.prune_breadth_first(defs.N_PHASE2_REDUCED_STATES, defs.PHASE2_PRUNE_DEPTH, defs.N_PHASE2_MOVES, apply_move_to_reduced_indices, defs.PHASE2_PRUNING_TABLE_ENCODING,
+                                      defs.PHASE2_PRUNING_CHECKPOINT_NAME, n_workers)
 
     #write the data
-    defs.PHASE2_PRUNING_TABLE = distance
-    utils.write_data(distance, defs.PHASE2_PRUNING_TABLE_NAME)
+    defs.PHASE2_PRUNING_TABLE = table
+    utils.write_pruning_table(table, defs.PHASE2_PRUNING_TABLE_NAME)
 
     return
 
@@ -112,14 +127,14 @@ def can_solve(node: Node, moves: int) -> bool:
         return False
 
     #get the value from the pruning table
-    pruneVal = defs.PHASE2_PRUNING_TABLE[node.index]
+    pruneVal = get_distance(node)
 
     #the number of moves is less than the lower bound then return false
     if moves < pruneVal:
         return False
 
     #if the pruning table value is less than or equal to the pruning depth then we can find out easily
-    if pruneVal <= defs.PHASE2_PRUNE_DEPTH:
+    if pruneVal <= defs.PHASE2_PRUNING_TABLE.max_depth:
         return pruneVal <= moves
     
     #for every move
@@ -134,97 +149,161 @@ def can_solve(node: Node, moves: int) -> bool:
     #if no new states are solvable in the required number of moves then return false
     return False
 
-def solution_generator(node: Node, last_axis: int = 0):
+def solution_generator(node: Node, last_axis: int = 0, bound: np.ndarray = None, offset: int = 0, counters: np.ndarray = None,
+                       poll_interval: int = utils.BOUND_POLL_INTERVAL, poll = None):
     '''
     A generator which returns all solutions for the node in order of increasing length
 
     node: the node to be solved
+    last_axis: the axis of the last move performed (sequences beginning with a twist of this axis will be found first)
+    bound: array whose first entry is the length which solutions must be shorter than (may be lowered during the search by other searches)
+    offset: the number of moves added to the solutions before they are compared with the bound
+    counters: counters which the work done by the search is added to
+    poll_interval: the number of nodes generated between checks of the bound
+    poll: function called at each check of the bound which may lower the bound to stop the search
     '''
+    if bound is None:
+        bound = np.array([np.iinfo(np.int64).max])
+    if counters is None:
+        counters = utils.new_counters()
 
     #initialize the maximum search depth to the lower bound from the pruning table
-    depth = defs.PHASE2_PRUNING_TABLE[node.index]
+    distance = get_distance(node)
+    depth = distance
 
-    #initialize an empty sequence
-    sequence = []
+    while True:
+        #stop once the solutions can no longer be shorter than the bound
+        if depth + offset >= bound[0]:
+            counters[utils.COUNTER_CUT_SEARCHES] += 1
+            return
+
+        #the search does not visit the node itself so check for the empty solution separately
+        if depth == 0:
+            if node.index == 0:
+                yield []
+            depth += 1
+            continue
 
-    #create a solution generator
-    solutions = search_generator(node, sequence, depth, (last_axis - 1) % 4)
+        #initialize the search stack with the node at the bottom
+        stack_c3 = np.empty(depth, dtype=np.uint32)
+        stack_io = np.empty(depth, dtype=np.uint16)
+        stack_distance = np.empty(depth, dtype=np.uint8)
+        stack_axis = np.empty(depth, dtype=np.uint8)
+        stack_cursor = np.zeros(depth, dtype=np.uint8)
+        sequence = np.empty(depth, dtype=np.uint8)
+        state = np.array([0, 0, poll_interval], dtype=np.int64)
+
+        stack_c3[0] = node.c3
+        stack_io[0] = node.io
+        stack_distance[0] = distance
+        stack_axis[0] = (last_axis - 1) % 4
+
+        #yield every solution at this depth
+        while True:
+            status = search(stack_distance, stack_c3, stack_io, stack_axis, stack_cursor, sequence, state, depth, defs.C3_MOVE_TABLE, defs.IO_MOVE_TABLE,
+                            defs.C3_SYMMETRY_TABLE, defs.IO_SYMMETRY_CLASSES, defs.PHASE2_PRUNING_TABLE, bound, offset, poll_interval)
+
+            counters[utils.COUNTER_NODES] += state[1]
+            state[1] = 0
+
+            #the bound was lowered to the depth during the search
+            if status == utils.SEARCH_CUT:
+                counters[utils.COUNTER_CUT_SEARCHES] += 1
+                return
+
+            #the search at this depth is exhausted
+            if status == 0:
+                break
 
-    #while there is no solution
-    while not next(solutions):
-        #increase the depth of the solution generator
-        depth += 1
-        solutions = search_generator(node, sequence, depth, (last_axis - 1) % 4)
-    
-    #yield the first solution found
-    yield sequence
-    
-    #yield all subsequent solutions
-    while True:
-        #yield each solution
-        for _ in solutions:
-            yield sequence
+            if status == 1:
+                yield sequence.tolist()
+                continue
 
-        #increase the depth of the generator
-        depth += 1
-        solutions = search_generator(node, sequence, depth, (last_axis - 1) % 4)
+            #otherwise the search stopped for a check of the bound so let the caller check its limits
+            if poll is not None:
+                poll()
+            if depth + offset >= bound[0]:
+                counters[utils.COUNTER_CUT_SEARCHES] += 1
+                return
 
+        #increase the depth and start again
+        depth += 1
 
-def search_generator(node: Node, sequence: list, depth: int, last_axis: int):
+@nb.njit
+def search(stack_distance, stack_c3, stack_io, stack_axis, stack_cursor, sequence, state, depth, c3_move_table, io_move_table, c3_symmetry_table, io_classes,
+           pruning_table, bound, offset, poll_interval):
     '''
-    A generator which returns false if no solution was found and true if solutions were found. The solution sequence is stored in sequence.
-
-    node: the node which is being searched
-    sequence: the sequence of moves which was applied to get to node
-    depth: the maximum depth of the search
-    last_axis: the axis of the last move performed (sequences beginning with a twist of this axis will be found first)
+    Depth first search for solutions of exactly 'depth' moves using an explicit stack. Returns 1 when a solution has been stored in sequence,
+    SEARCH_POLL at each check of the bound and 0 when there are no more solutions. Calling it again with the same arrays resumes the search.
+    If a check of the bound finds that solutions of this depth are no longer short enough then the search is abandoned and SEARCH_CUT is returned.
+
+    stack_distance: the pruning value of the node at each level of the stack
+    stack_c3: the C3 coordinate of the node at each level of the stack
+    stack_io: the IO coordinate of the node at each level of the stack
+    stack_axis: the axis of the move which produced the node at each level (sequences beginning with a twist of the axis after the bottom one are found first)
+    stack_cursor: the position in the move order of the next move to try at each level
+    sequence: the moves applied to get to each level of the stack
+    state: the current level of the stack, the number of nodes generated so far and the number of nodes until the next check of the bound
+    depth: the length of the solutions
+    c3_move_table, io_move_table, c3_symmetry_table, io_classes, pruning_table: the phase 2 tables
+    bound, offset, poll_interval: the bound which the solutions plus offset moves must be shorter than and the number of nodes between checks of it
     '''
 
-    #save the sequence length
-    seqLen = len(sequence)
+    level = state[0]
 
-    #get the lower bound for the number of moves required to solve the original node
-    distGuess = seqLen + defs.PHASE2_PRUNING_TABLE[node.index]
+    while level >= 0:
+        #check the bound every poll_interval nodes
+        status = utils.poll_bound(state, bound, depth, offset, poll_interval)
+        if status == utils.SEARCH_CUT:
+            state[0] = -1
+            return utils.SEARCH_CUT
+        elif status == utils.SEARCH_POLL:
+            state[0] = level
+            return utils.SEARCH_POLL
 
-    #if the minimum distance is more than the bound then yield the distance and then stop the generator
-    if distGuess > depth: 
-        yield False
-        return
-    
-    #if the node is the solution and we are at the full depth then yield true
-    if node.index == 0 and seqLen == depth: 
-        yield True
-        return
+        cursor = stack_cursor[level]
+
+        #if every move has been tried then go back down the stack
+        if cursor == defs.N_PHASE2_MOVES:
+            level -= 1
+            continue
 
-    #no solution has been found yet
-    sol_found = False
+        stack_cursor[level] = cursor + 1
 
-    #for every move
-    for i in defs.PHASE2_MOVES[(last_axis + 1) % 4]:
+        axis = stack_axis[level]
+        move = defs.PHASE2_MOVES_ARRAY[(axis + 1) % 4, cursor]
 
         #don't try redundant moves
-        if (not seqLen == 0) and (defs.TWIST_AXES[i] == last_axis):
+        if level != 0 and defs.TWIST_AXES_ARRAY[move] == axis:
             continue
-        
-        #get the new node
-        new_node = node.apply_move(i)
 
-        #append the move to the path
-        sequence.append(i)
+        #get the new node
+        c3 = c3_move_table[move, stack_c3[level]]
+        io = io_move_table[move, stack_io[level]]
+        state[1] += 1
+        state[2] -= 1
+
+        #if the minimum distance is more than the bound then skip this node
+        distance = utils.prune_value(pruning_table, get_reduced_index(c3, io, c3_symmetry_table, io_classes), stack_distance[level])
+        if level + 1 + distance > depth:
+            continue
 
-        #recursively continue searching
-        for sol in search_generator(new_node, sequence, depth, defs.TWIST_AXES[i]):
+        sequence[level] = move
 
-            #if a solution was found then yield true otherwise we can stop searching this node
-            if sol:
-                sol_found = True
-                yield True
-            else: 
-                break
+        #if we are at the full depth then check if the node is solved
+        if level + 1 == depth:
+            if c3 == 0 and io == 0:
+                state[0] = level
+                return 1
+            continue
 
-        #remove the last move from the sequence since no solution was found
-        del sequence[-1]
+        #push the node onto the stack
+        level += 1
+        stack_c3[level] = c3
+        stack_io[level] = io
+        stack_distance[level] = distance
+        stack_axis[level] = defs.TWIST_AXES_ARRAY[move]
+        stack_cursor[level] = 0
 
-    #if no solution was found then return the minimum distance it could be from solved
-    if not sol_found:
-        yield False
\ No newline at end of file
+    state[0] = level
+    return 0
@@ -1,5 +1,5 @@
 import numpy as np
-from tqdm import trange
+import numba as nb
 
 import defs
 import utils
@@ -33,68 +33,56 @@ class Node(utils.BaseNode):
         
         return new_node
 
-def prune():
+def apply_move_to_indices(nodes: np.ndarray, move: int) -> np.ndarray:
+    '''
+    Returns the indices of the nodes resulting from applying the move to an array of node indices
+    '''
+    nodes_O, nodes_I = np.divmod(nodes, defs.N_HALF_I_COORD_STATES)
+    nodes_I += defs.N_HALF_I_COORD_STATES * (nodes_O >= defs.N_HALF_O_COORD_STATES)
+
+    return defs.O_MOVE_TABLE[move][nodes_O].astype(np.int64) * defs.N_HALF_I_COORD_STATES + defs.I_MOVE_TABLE[move][nodes_I] % defs.N_HALF_I_COORD_STATES
+
+@nb.njit
+def apply_move(move: int, index: int, i_move_table: np.ndarray, o_move_table: np.ndarray) -> int:
+    '''
+    Returns the index of the node resulting from applying the move to the node with the given index
+    '''
+    o, i = divmod(np.int64(index), defs.N_HALF_I_COORD_STATES)
+    if o >= defs.N_HALF_O_COORD_STATES:
+        i += defs.N_HALF_I_COORD_STATES
+
+    return np.int64(o_move_table[move, o]) * defs.N_HALF_I_COORD_STATES + i_move_table[move, i] % defs.N_HALF_I_COORD_STATES
+
+@nb.njit
+def scan_distance(table: utils.PruningTable, index: int, i_move_table: np.ndarray, o_move_table: np.ndarray) -> int:
+    '''
+    Returns the distance from solved of a visited entry of a mod 3 pruning table
+    '''
+    return utils.scan_distance(table, index, defs.N_PHASE3_MOVES, apply_move, i_move_table, o_move_table)
+
+def get_distance(node: Node) -> int:
+    '''
+    Returns the distance of the node from solved according to the pruning table
+    '''
+    return utils.get_distance(defs.PHASE3_PRUNING_TABLE, node.index, scan_distance, defs.I_MOVE_TABLE, defs.O_MOVE_TABLE)
+
+def prune(n_workers: int = 1):
     '''
     Calculates and saves the pruning table
+
+    n_workers: the number of worker processes used to generate the table
     '''
-    print("Generating Phase 3 Pruning Table...")
+    #the search follows the distances straight to a solution so they must be exact
+    utils.check_exact_pruning_table(defs.PHASE3_PRUNING_TABLE_ENCODING, defs.PHASE3_PRUNE_DEPTH, defs.PHASE3_FULL_DEPTH, defs.PHASE3_PRUNING_TABLE_NAME)
 
-    #initialize the distance array with all entries as max_depth + 1
-    distance = np.full(defs.N_PHASE3_STATES, defs.PHASE3_PRUNE_DEPTH+1, dtype=np.uint8)
-
-    #queue contains a tuple of (I_coord, O_coord, last_move_axis)
-    #initialize 2 queues with the first one having the solved state in it
-    queues = [[(np.uint16(0), np.uint16(0), np.uint8(-1))],[]]
-
-    #set the solved state
-    distance[0] = 0
-
-    #defines which queue we are currently working out of
-    current_queue = 0
-
-    #current distance from solved
-    current_depth = 0
-
-    #while any of the queues are full and we are below the max depth
-    while (queues) and (current_depth < defs.PHASE3_PRUNE_DEPTH):
-
-        #for every node in the queue
-        for j in trange(len(queues[current_queue]), leave=False, desc="Exploring Depth " + str(current_depth+1)):
-            
-            #dequeue a node
-            node_I, node_O, axis = queues[current_queue].pop()
-
-            #for every move in PHASE 2
-            for i in defs.PHASE3_MOVES[(axis + 1) % 4]:
-
-                #check if the move is redundant given the last move
-                if axis == defs.TWIST_AXES[i]:
-                    break
-                
-                #get the new node list
-                new_node_I, new_node_O = defs.I_MOVE_TABLE[i, node_I], defs.O_MOVE_TABLE[i, node_O]
-
-                #get the index of this new node
-                new_node = int(new_node_O) * defs.N_HALF_I_COORD_STATES + int(new_node_I) % defs.N_HALF_I_COORD_STATES
-               
-                #if the node has not been visited
-                if distance[new_node] == defs.PHASE3_PRUNE_DEPTH + 1:
-                    #update the distance
-                    distance[new_node] = current_depth + 1
-                    
-                    #add the move to a queue if it will be within the maximum depth
-                    if current_depth + 1 < defs.PHASE3_PRUNE_DEPTH:
-                        queues[np.mod(current_queue + 1, 2)].append((new_node_I, new_node_O, defs.TWIST_AXES[i]))
-    
-        #cycle which queue we are working out of
-        current_queue = np.mod(current_queue + 1, 2)
+    print("Generating Phase 3 Pruning Table...")
 
-        #add 1 to the current distance
-        current_depth += 1
+    table = utils.prune_breadth_first(defs.N_PHASE3_STATES, defs.PHASE3_PRUNE_DEPTH, defs.N_PHASE3_MOVES, apply_move_to_indices, defs.PHASE3_PRUNING_TABLE_ENCODING,
+                                      defs.PHASE3_PRUNING_CHECKPOINT_NAME, n_workers)
 
     #write the data
-    defs.PHASE3_PRUNING_TABLE = distance
-    utils.write_data(distance, defs.PHASE3_PRUNING_TABLE_NAME)
+    defs.PHASE3_PRUNING_TABLE = table
+    utils.write_pruning_table(table, defs.PHASE3_PRUNING_TABLE_NAME)
 
     return
 
@@ -106,24 +94,23 @@ def can_solve(node: Node, moves: int, last_move: int or None = None) -> bool:
     moves: the number of moves available
     '''
 
-    pruneVal = defs.PHASE3_PRUNING_TABLE[node.index]
+    pruneVal = get_distance(node)
 
     #if the last axis is none or if the prune value + 1 is not equal to the number of moves then we don't need to check if first move cancellation is possible
     if last_move is None or pruneVal + 1 != moves:
         return pruneVal <= moves
     else: 
         #condition with move cancellation
-        return defs.PHASE3_PRUNING_TABLE[node.index] - int(match_axis_first_move(node, defs.TWIST_AXES[last_move])) <= moves
+        return pruneVal - int(match_axis_first_move(node, defs.TWIST_AXES[last_move], pruneVal)) <= moves
 
-def match_axis_first_move(node: Node, last_axis: int) -> bool:
+def match_axis_first_move(node: Node, last_axis: int, dist: int) -> bool:
     '''
     Returns True if an optimal solution begins with a move whose axis matches move, False otherwise
 
     node: the node to be solved
     last_axis: the axis of the last move performed
+    dist: the distance of the node from solved
     '''
-    #get the distance to solved
-    dist = defs.PHASE3_PRUNING_TABLE[node.index]
 
     #for every move
     for i in defs.PHASE3_MOVES[last_axis]:
@@ -135,30 +122,41 @@ def match_axis_first_move(node: Node, last_axis: int) -> bool:
         new_node = node.apply_move(i)
 
         #if the pruning value decreased then this is an optimal first move
-        if defs.PHASE3_PRUNING_TABLE[new_node.index] < dist:
+        if utils.prune_value(defs.PHASE3_PRUNING_TABLE, new_node.index, dist) < dist:
             return True
 
     return False
 
 
-def solution_generator(node: Node, last_axis: int = 0):
+def solution_generator(node: Node, last_axis: int = 0, bound: np.ndarray = None, offset: int = 0, counters: np.ndarray = None):
     '''
     A generator which returns all shortest solutions for the node
 
     node: the node to be solved
     last_move: the last move performed (prioritizes finding sequences that begin with the same axis to cancel a move)
+    bound: array whose first entry is the length which solutions must be shorter than (the pruning table is exact so the search goes
+           straight to the solutions and the bound is only checked before each depth)
+    offset: the number of moves added to the solutions before they are compared with the bound
+    counters: counters which the work done by the search is added to
     '''
 
     #initialize the maximum search depth to the lower bound from the pruning table
-    depth = defs.PHASE3_PRUNING_TABLE[node.index]
+    distance = get_distance(node)
+    depth = distance
 
     #initialize an empty sequence
     sequence = []
 
     #yield each solution
     while True:
+        #stop once the solutions can no longer be shorter than the bound
+        if bound is not None and depth + offset >= bound[0]:
+            if counters is not None:
+                counters[utils.COUNTER_CUT_SEARCHES] += 1
+            return
+
         #create a solution generator
-        solutions = search_generator(node, sequence, depth, (last_axis - 1) % 4)
+        solutions = search_generator(node, sequence, depth, (last_axis - 1) % 4, distance)
 
         #for every solution yield the sequence
         for _ in solutions:
@@ -168,7 +166,7 @@ def solution_generator(node: Node, last_axis: int = 0):
         depth += 1
 
 
-def search_generator(node: Node, sequence: list, depth: int, last_axis: int):
+def search_generator(node: Node, sequence: list, depth: int, last_axis: int, distance: int):
     '''
     A generator which returns false if no solution was found and true if solutions were found. The solution sequence is stored in sequence.
 
@@ -176,13 +174,14 @@ def search_generator(node: Node, sequence: list, depth: int, last_axis: int):
     sequence: the sequence of moves which was applied to get to node
     depth: the maximum depth of the search
     last_axis: the axis of the last move performed (sequences beginning with a twist of this axis will be found first)
+    distance: the distance of the node from solved according to the pruning table
     '''
 
     #save the sequence length
     seqLen = len(sequence)
 
     #get the the number of moves required to solve the original node
-    dist = seqLen + defs.PHASE3_PRUNING_TABLE[node.index]
+    dist = seqLen + distance
 
     #if the minimum distance is more than the bound then then stop the generator
     if dist > depth: 
@@ -207,7 +206,7 @@ def search_generator(node: Node, sequence: list, depth: int, last_axis: int):
         sequence.append(i)
 
         #recursively continue searching, setting the last axis such that the redundant moves are searched last
-        for sol in search_generator(new_node, sequence, depth, defs.TWIST_AXES[i]):
+        for sol in search_generator(new_node, sequence, depth, defs.TWIST_AXES[i], utils.prune_value(defs.PHASE3_PRUNING_TABLE, new_node.index, distance)):
 
             #if a solution was found then yield true otherwise we can stop searching this node
             yield True
@@ -1,4 +1,9 @@
 from time import perf_counter
+import os
+import multiprocessing
+import queue
+from typing import NamedTuple
+import numpy as np
 
 import defs
 import utils
@@ -38,82 +43,454 @@ def sequence_cancellation(sequence1: list, sequence2: list) -> bool:
     except IndexError:
         return False
 
+class SolveLimits(NamedTuple):
+    '''
+    The limits of a solve, each of which is ignored if it is None. The solve stops once the deadline (a time returned by time.perf_counter)
+    has passed, once the searches have generated node_budget nodes or once a solution of target_length moves or fewer has been found.
+    '''
+    deadline: float = None
+    target_length: int = None
+    node_budget: int = None
+
+    def search_limit_reached(self, nodes: int) -> bool:
+        '''
+        Returns whether the deadline has passed or the searches have used the node budget
+
+        nodes: the number of nodes generated by the searches
+        '''
+        return (self.deadline is not None and perf_counter() >= self.deadline) or (self.node_budget is not None and nodes >= self.node_budget)
+
+    def target_reached(self, solution: list) -> bool:
+        '''
+        Returns whether the solution is short enough to stop the solve
+        '''
+        return self.target_length is not None and len(solution) <= self.target_length
+
+def solve_phase1_solution(cube: Cubiecube, phase1_sol: list, bound: np.ndarray, counters: np.ndarray = None, poll_interval: int = utils.BOUND_POLL_INTERVAL,
+                          poll = None):
+    '''
+    A generator which yields solutions of the cube beginning with the phase 1 solution. Each solution is shorter than bound[0] when it is
+    found and the caller should lower the bound to its length. The bound is read whenever it is needed so other searches may lower it too.
+
+    cube: the cube to solve
+    phase1_sol: the phase 1 solution
+    bound: array holding the length which solutions must be shorter than
+    counters: counters which the work done by the search is added to
+    poll_interval: the number of nodes the phase 2 search generates between checks of the bound
+    poll: function called at each check of the bound which may lower the bound to stop the search
+    '''
+    if counters is None:
+        counters = utils.new_counters()
+
+    #get the length of the phase 1 solution
+    len_phase1_sol = len(phase1_sol)
+
+    #get the cubiecube for the beginning of phase 2
+    phase2_cube = cube.apply_move_list_new(phase1_sol)
+
+    #get the last axis (defaults to 0)
+    try:
+        last_axis = defs.TWIST_AXES[phase1_sol[-1]]
+    except IndexError: last_axis = 0
+
+    #for every phase 2 solution (one move may cancel with the phase 1 solution)
+    for phase2_sol in phase2.solution_generator(phase2_cube.get_phase2_node(), last_axis, bound, len_phase1_sol - 1, counters, poll_interval, poll):
+
+        #get the length of the phase 2 solution
+        len_phase2_sol = len(phase2_sol) + len_phase1_sol - int(sequence_cancellation(phase1_sol, phase2_sol))
+
+        #if the phase 2 solution became maximally long then break into a new phase 1 solution
+        if len_phase2_sol >= bound[0]:
+            return
+
+        #get the phase 3 node
+        phase3_node = phase2_cube.apply_move_list_new(phase2_sol).get_phase3_node()
+
+        #get the last move
+        try:
+            last_move = phase2_sol[-1]
+        except IndexError:
+            try:
+                last_move = phase1_sol[-1]
+            except IndexError: last_move = None
 
-def solve(cube: Stickercube or Cubiecube, search_depth=None):
+        #if it is not solvable in less than the shortest solution then get a new phase 2 solution
+        if not phase3.can_solve(phase3_node, bound[0] - len_phase2_sol - 1, last_move):
+            continue
+            
+        #get the last axis (defaults to 0)
+        try:
+            last_axis = defs.TWIST_AXES[last_move]
+        except TypeError: last_axis = 0
+        
+        #get the phase 3 solution (None if the bound was lowered so that it is too long)
+        phase3_sol = next(phase3.solution_generator(phase3_node, last_axis, bound, len_phase2_sol - 1, counters), None)
+        if phase3_sol is None:
+            continue
+
+        yield merge_sequences(phase1_sol, phase2_sol, phase3_sol)
+
+def solve(cube: Stickercube or Cubiecube, search_depth=None, n_workers: int = 1, counters: np.ndarray = None, poll_interval: int = utils.BOUND_POLL_INTERVAL,
+          race: bool = False, deadline: float = None, target_length: int = None, node_budget: int = None):
     '''
-    Solves the given cube stopping after 'terminate_time' seconds have elapsed since the last solution was found.
-    This method will eventually find and verify an optimal solution.
+    A generator which yields shorter and shorter solutions of the cube. Without limits it will eventually find and verify an optimal solution.
+    With limits the last solution yielded is the best found before they were reached (see SolveLimits).
 
     cube: the cube to solve
     search_depth: maximum solution length desired
+    n_workers: the number of processes to search with (see parallel_solve)
+    counters: counters which the work done by the search is added to (see utils.COUNTER_NAMES)
+    poll_interval: the number of nodes the searches generate between checks of the bound
+    race: whether to race searches of the cube in several orientations against each other (see race_solve, n_workers is then ignored)
+    deadline: the time (as returned by time.perf_counter) to stop searching at
+    target_length: stop once a solution of this many moves or fewer has been found
+    node_budget: stop once the searches have generated this many nodes
     '''
     #convert the cube to a cubiecube
     if type(cube) == Stickercube:
         cube = cube.to_cubiecube()
 
+    limits = SolveLimits(deadline, target_length, node_budget)
+
+    if race:
+        yield from race_solve(cube, search_depth, counters=counters, poll_interval=poll_interval, limits=limits)
+        return
+
+    if n_workers > 1:
+        yield from parallel_solve(cube, search_depth, n_workers, counters, poll_interval, limits)
+        return
+
+    if counters is None:
+        counters = utils.new_counters()
+    start_nodes = counters[utils.COUNTER_NODES]
+
     #initialize shortest solution
     if search_depth is None:
         len_shortest_solution = 99999999
     else: len_shortest_solution = search_depth + 1
 
-    #initialize shortest
-    shortest_solution = None
+    #the length that solutions must be shorter than
+    bound = np.array([len_shortest_solution], dtype=np.int64)
+
+    def poll():
+        #stop the searches by lowering the bound so that no solution is short enough
+        if limits.search_limit_reached(counters[utils.COUNTER_NODES] - start_nodes):
+            bound[0] = 0
+
+    #for every shorter solution
+    for shortest_solution in solve_with_bound(cube, bound, counters, poll_interval, poll):
+        #save the new length
+        bound[0] = len(shortest_solution)
+        counters[utils.COUNTER_BOUND_UPDATES] += 1
 
+        yield shortest_solution
+
+        if limits.target_reached(shortest_solution):
+            return
+
+def best_solution(cube: Stickercube or Cubiecube, deadline: float = None, target_length: int = None, node_budget: int = None, **kwargs) -> list:
+    '''
+    Returns the shortest solution of the cube found before the limits were reached, or None if no solution was found (see solve)
+    '''
+    solution = None
+    for solution in solve(cube, deadline=deadline, target_length=target_length, node_budget=node_budget, **kwargs):
+        pass
+
+    return solution
+
+def solve_with_bound(cube: Cubiecube, bound: np.ndarray, counters: np.ndarray, poll_interval: int = utils.BOUND_POLL_INTERVAL, poll = None):
+    '''
+    A generator which yields solutions of the cube which are shorter than bound[0] when they are found. The caller should lower the bound
+    to the length of each solution and other searches may lower it too.
+
+    cube: the cube to solve
+    bound: array holding the length which solutions must be shorter than
+    counters: counters which the work done by the search is added to
+    poll_interval: the number of nodes the searches generate between checks of the bound
+    poll: function called at each check of the bound which may lower the bound to stop the search
+    '''
     #for every phase 1 solution
-    for phase1_sol in phase1.solution_generator(cube.get_phase1_node()):
-        #get the length of the phase 1 solution
-        len_phase1_sol = len(phase1_sol)
-        
+    for phase1_sol in phase1.solution_generator(cube.get_phase1_node(), bound, 0, counters, poll_interval, poll):
         #stopping condition
-        if len_phase1_sol >= len_shortest_solution:
+        if len(phase1_sol) >= bound[0]:
             return
 
-        #get the cubiecube for the beginning of phase 2
-        phase2_cube = cube.apply_move_list_new(phase1_sol)
+        #for every shorter solution beginning with the phase 1 solution
+        yield from solve_phase1_solution(cube, phase1_sol, bound, counters, poll_interval, poll)
 
-        #get the last axis (defaults to 0)
-        try:
-            last_axis = defs.TWIST_AXES[phase1_sol[-1]]
-        except IndexError: last_axis = 0
+#number of phase 1 solutions waiting for or being searched by each worker in a parallel solve
+PARALLEL_SOLVE_QUEUE_DEPTH = 2
 
-        #for every phase 2 solution
-        for phase2_sol in phase2.solution_generator(phase2_cube.get_phase2_node(), last_axis):
+#the shared bound and the queue of results of a worker process in a parallel solve
+_solve_worker = {}
 
-            #get the length of the phase 2 solution
-            len_phase2_sol = len(phase2_sol) + len_phase1_sol - int(sequence_cancellation(phase1_sol, phase2_sol))
+def init_solve_worker(register: utils.BoundRegister, results):
+    '''
+    Saves the shared state of a parallel solve in a worker process
+    '''
+    _solve_worker["register"] = register
+    _solve_worker["results"] = results
 
-            #if the phase 2 solution became maximally long then break into a new phase 1 solution
-            if len_phase2_sol >= len_shortest_solution:
-                break
+def register_poll(register: utils.BoundRegister, counters: np.ndarray, limits: SolveLimits):
+    '''
+    Returns a function for a search against the register to call at each check of the bound. It moves the counters of the search to the
+    register and stops every search against the register once the limits are reached.
+    '''
+    def poll():
+        register.add_counters(counters)
+        counters[:] = 0
 
-            #get the phase 3 node
-            phase3_node = phase2_cube.apply_move_list_new(phase2_sol).get_phase3_node()
+        if limits.search_limit_reached(register.counters[utils.COUNTER_NODES]):
+            register.stop()
 
-            #get the last move
-            try:
-                last_move = phase2_sol[-1]
-            except IndexError:
-                try:
-                    last_move = phase1_sol[-1]
-                except IndexError: last_move = None
-
-            #if it is not solvable in less than the shortest solution then get a new phase 2 solution
-            if not phase3.can_solve(phase3_node, len_shortest_solution - len_phase2_sol - 1, last_move):
-                continue
-                
-            #get the last axis (defaults to 0)
-            try:
-                last_axis = defs.TWIST_AXES[last_move]
-            except TypeError: last_axis = 0
-            
-            #get the phase 3 solution
-            phase3_sol = next(phase3.solution_generator(phase3_node, last_axis))
+    return poll
+
+def receive_result(results, deadline: float = None):
+    '''
+    Waits for a result from a worker process and returns it, raising the exception instead if the worker failed. Raises queue.Empty if
+    the deadline passes first.
+    '''
+    result = results.get(timeout=None if deadline is None else max(deadline - perf_counter(), 0))
+
+    if isinstance(result, BaseException):
+        raise result
+
+    return result
+
+def solve_phase1_solution_worker(cube: Cubiecube, phase1_sol: list, poll_interval: int, limits: SolveLimits):
+    '''
+    Searches for solutions beginning with the phase 1 solution in a worker process. Each solution which is shorter than the shared bound
+    lowers the bound and is sent to the results queue, followed by None once the search is finished.
+    '''
+    register, results = _solve_worker["register"], _solve_worker["results"]
+    counters = utils.new_counters()
+
+    try:
+        #the bound may have been lowered while the phase 1 solution was waiting
+        if len(phase1_sol) >= register.get():
+            counters[utils.COUNTER_SKIPPED_PHASE1_SOLUTIONS] += 1
+            return
+
+        for solution in solve_phase1_solution(cube, phase1_sol, register.bound, counters, poll_interval, register_poll(register, counters, limits)):
+            #another worker may have lowered the bound since the solution was found
+            if register.lower(len(solution)):
+                results.put(solution)
+    finally:
+        register.add_counters(counters)
+        results.put(None)
+
+def parallel_solve(cube: Cubiecube, search_depth=None, n_workers: int = None, counters: np.ndarray = None, poll_interval: int = utils.BOUND_POLL_INTERVAL,
+                   limits: SolveLimits = SolveLimits()):
+    '''
+    Solves the cube like solve but searches the phase 2 and 3 solutions of several phase 1 solutions at once in a pool of worker processes.
+    The workers share the memory mapped tables and a register holding the length of the shortest solution, which the searches check every
+    poll_interval nodes so each worker prunes against the shortest solution found by any worker. Solutions are yielded in order of
+    decreasing length as they are found.
+
+    cube: the cube to solve
+    search_depth: maximum solution length desired
+    n_workers: the number of worker processes (defaults to one per core)
+    counters: counters which the work done by all the processes is added to when the solve finishes
+    poll_interval: the number of nodes the searches generate between checks of the bound
+    limits: the limits of the solve
+    '''
+    if n_workers is None:
+        n_workers = os.cpu_count()
+
+    #initialize shortest solution
+    if search_depth is None:
+        len_shortest_solution = 99999999
+    else: len_shortest_solution = search_depth + 1
+
+    #the length that solutions must be shorter than, shared with the workers
+    register = utils.BoundRegister(len_shortest_solution)
+    results = multiprocessing.Queue()
+    phase1_counters = utils.new_counters()
+    phase1_solutions = phase1.solution_generator(cube.get_phase1_node(), register.bound, 0, phase1_counters, poll_interval,
+                                                 register_poll(register, phase1_counters, limits))
+
+    try:
+        with multiprocessing.Pool(n_workers, init_solve_worker, (register, results)) as pool:
+            #number of phase 1 solutions which have not been finished
+            n_pending = 0
+
+            def receive():
+                #wait for a result and yield it if it is a new shortest solution
+                nonlocal n_pending, len_shortest_solution
+                solution = receive_result(results, limits.deadline)
+
+                if solution is None:
+                    n_pending -= 1
+                elif len(solution) < len_shortest_solution:
+                    len_shortest_solution = len(solution)
+                    yield solution
+
+                    #stop every search once the solution is short enough
+                    if limits.target_reached(solution):
+                        register.stop()
+
+            #for every phase 1 solution
+            for phase1_sol in phase1_solutions:
+                #stopping condition
+                if len(phase1_sol) >= register.get():
+                    break
+
+                #wait for a worker to be free
+                while n_pending >= PARALLEL_SOLVE_QUEUE_DEPTH * n_workers:
+                    yield from receive()
+
+                pool.apply_async(solve_phase1_solution_worker, (cube, phase1_sol, poll_interval, limits), error_callback=lambda error: results.put(error))
+                n_pending += 1
+
+                #yield any solutions which have already been found
+                while not results.empty():
+                    yield from receive()
+
+            #wait for the remaining phase 1 solutions
+            while n_pending > 0:
+                yield from receive()
+    except queue.Empty:
+        #the deadline passed while waiting for the workers, which are terminated on leaving the pool
+        pass
+    finally:
+        #the phase 1 search holds a view of the shared bound which must be released before the register is closed
+        phase1_solutions.close()
+
+        #the lock is not taken since a terminated worker may have been holding it
+        if counters is not None:
+            counters += register.counters
+            counters += phase1_counters
+
+        register.close()
+
+#the orientations searched by a race solve as the relabelling of the axes which the cube is conjugated by and whether the inverse is solved.
+#The phase 1 table is reduced by every relabelling of axes 0, 1 and 2 and the phase 2 table by swapping axes 0 and 1, so a search only depends
+#on which axis becomes W (the primary axis) and which becomes Z. Every axis is tried as W, and with W kept as W each other axis is tried as Z.
+RACE_AXES = ((0, 1, 2, 3), (0, 2, 1, 3), (2, 1, 0, 3), (3, 1, 2, 0), (0, 3, 2, 1), (0, 1, 3, 2))
+RACE_ORIENTATIONS = tuple((axes, inverse) for inverse in (False, True) for axes in RACE_AXES)
+
+#the move maps of orientations which have already been computed
+_move_maps = {}
+
+def get_move_map(move_cubes: list) -> np.ndarray:
+    '''
+    Returns the index of the first move giving each cube
+    '''
+    solved_moves = [Cubiecube().apply_move_new(move) for move in range(defs.N_PHASE1_MOVES)]
+
+    move_map = np.empty(len(move_cubes), dtype=np.uint8)
+    for i, move_cube in enumerate(move_cubes):
+        move_map[i] = next(move for move, solved_move in enumerate(solved_moves) if solved_move == move_cube)
+
+    return move_map
+
+def get_conjugate_moves(axes) -> np.ndarray:
+    '''
+    Returns the move which each move becomes when it is conjugated by the symmetry which relabels each axis a as axes[a]
+    '''
+    key = ("conjugate",) + tuple(int(axis) for axis in axes)
+
+    if key not in _move_maps:
+        _move_maps[key] = get_move_map([Cubiecube().apply_move_new(move).conjugate_new(axes) for move in range(defs.N_PHASE1_MOVES)])
+
+    return _move_maps[key]
+
+def get_inverse_moves() -> np.ndarray:
+    '''
+    Returns the inverse of each move
+    '''
+    if "inverse" not in _move_maps:
+        _move_maps["inverse"] = get_move_map([Cubiecube().apply_move_new(move).invert_new() for move in range(defs.N_PHASE1_MOVES)])
+
+    return _move_maps["inverse"]
+
+def orient_cube(cube: Cubiecube, axes, inverse: bool) -> Cubiecube:
+    '''
+    Returns the cube conjugated by the symmetry which relabels each axis a as axes[a] and inverted if inverse is True
+    '''
+    cube = cube.conjugate_new(axes)
+    if inverse:
+        cube.invert()
+
+    return cube
+
+def unorient_solution(solution: list, axes, inverse: bool) -> list:
+    '''
+    Returns the solution of the original cube given a solution of the cube returned by orient_cube
+    '''
+    #a solution of the inverse is undone backwards to solve the cube
+    if inverse:
+        solution = get_inverse_moves()[solution[::-1]].tolist()
+
+    #conjugate the moves back by the inverse relabelling
+    return get_conjugate_moves(np.argsort(axes))[solution].tolist()
+
+def solve_orientation_worker(cube: Cubiecube, axes, inverse: bool, poll_interval: int, limits: SolveLimits):
+    '''
+    Searches for solutions of the cube in an orientation in a worker process. Each solution which is shorter than the shared bound lowers
+    the bound and is sent to the results queue in the original orientation, followed by None once the search is finished.
+    '''
+    register, results = _solve_worker["register"], _solve_worker["results"]
+    counters = utils.new_counters()
+
+    try:
+        for solution in solve_with_bound(orient_cube(cube, axes, inverse), register.bound, counters, poll_interval, register_poll(register, counters, limits)):
+            #another search may have lowered the bound since the solution was found
+            if register.lower(len(solution)):
+                results.put(unorient_solution(solution, axes, inverse))
+    finally:
+        register.add_counters(counters)
+        results.put(None)
+
+def race_solve(cube: Cubiecube, search_depth=None, orientations=RACE_ORIENTATIONS, counters: np.ndarray = None, poll_interval: int = utils.BOUND_POLL_INTERVAL,
+               limits: SolveLimits = SolveLimits()):
+    '''
+    Solves the cube like solve but races searches of the cube in several orientations against each other, each in its own worker process.
+    A short solution is often found much sooner in one orientation than the others. The searches share a register holding the length of
+    the shortest solution so each search prunes against the shortest solution found by any of them. Solutions are mapped back to the
+    original orientation and yielded in order of decreasing length as they are found.
+
+    cube: the cube to solve
+    search_depth: maximum solution length desired
+    orientations: the orientations to search as pairs of the relabelling of the axes and whether to solve the inverse (see RACE_ORIENTATIONS)
+    counters: counters which the work done by all the searches is added to when the solve finishes
+    poll_interval: the number of nodes the searches generate between checks of the bound
+    limits: the limits of the solve
+    '''
+    #initialize shortest solution
+    if search_depth is None:
+        len_shortest_solution = 99999999
+    else: len_shortest_solution = search_depth + 1
+
+    #the length that solutions must be shorter than, shared with the searches
+    register = utils.BoundRegister(len_shortest_solution)
+    results = multiprocessing.Queue()
+
+    try:
+        with multiprocessing.Pool(len(orientations), init_solve_worker, (register, results)) as pool:
+            for axes, inverse in orientations:
+                pool.apply_async(solve_orientation_worker, (cube, axes, inverse, poll_interval, limits), error_callback=lambda error: results.put(error))
 
-            #save the solution
-            shortest_solution = merge_sequences(phase1_sol, phase2_sol, phase3_sol)
+            #wait for every search to finish
+            n_pending = len(orientations)
+            while n_pending > 0:
+                solution = receive_result(results, limits.deadline)
 
-            #save the new length
-            len_shortest_solution = len(shortest_solution)
+                if solution is None:
+                    n_pending -= 1
+                elif len(solution) < len_shortest_solution:
+                    len_shortest_solution = len(solution)
+                    yield solution
 
-            yield shortest_solution
+                    #stop every search once the solution is short enough
+                    if limits.target_reached(solution):
+                        register.stop()
+    except queue.Empty:
+        #the deadline passed while waiting for the searches, which are terminated on leaving the pool
+        pass
+    finally:
+        #the lock is not taken since a terminated worker may have been holding it
+        if counters is not None:
+            counters += register.counters
 
+        register.close()
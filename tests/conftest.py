@@ -0,0 +1,73 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+#the modules live in the repository folder rather than a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import defs
+
+#tables which are placeholders rather than None when they have not been generated
+PLACEHOLDER_SHAPE = (1, 15)
+
+def require_tables(*names):
+    '''
+    Skips the test unless every table has been generated
+    '''
+    for name in names:
+        table = defs.get_table(name)
+
+        if table is None or (isinstance(table, np.ndarray) and table.shape == PLACEHOLDER_SHAPE):
+            pytest.skip(name + " has not been generated")
+
+def brute_force_solutions(index: int, moves, axes, apply_move, max_depth: int) -> set:
+    '''
+    Returns every sequence of at most max_depth moves without two consecutive moves of the same axis which brings the node index to 0
+
+    index: the index of the node
+    moves: the moves which may be applied
+    axes: the axis of every move
+    apply_move: function taking a move and an index and returning the index after the move
+    max_depth: the maximum length of the sequences
+    '''
+    solutions = set()
+    frontier = [((), index)]
+
+    for _ in range(max_depth + 1):
+        new_frontier = []
+        for sequence, node in frontier:
+            if node == 0:
+                solutions.add(sequence)
+
+            for move in moves:
+                if sequence and axes[move] == axes[sequence[-1]]:
+                    continue
+                new_frontier.append((sequence + (move,), apply_move(move, node)))
+        frontier = new_frontier
+
+    return solutions
+
+def get_solutions(phase, node, max_depth: int, **kwargs) -> list:
+    '''
+    Returns the solutions yielded by the compiled search of the phase module up to max_depth moves
+
+    phase: the phase module (phase1 or phase2)
+    node: the node to solve
+    max_depth: the maximum length of the solutions
+    kwargs: the keyword arguments of the phase's solution_generator
+    '''
+    solutions = []
+    for solution in phase.solution_generator(node, **kwargs):
+        if len(solution) > max_depth:
+            break
+        solutions.append(tuple(solution))
+
+    return solutions
+
+def node_move_function(phase):
+    '''
+    Returns a function taking a move and a node index of the phase module and returning the index after the move (see brute_force_solutions)
+    '''
+    return lambda move, index: int(phase.Node(index).apply_move(move).index)
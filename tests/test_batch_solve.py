@@ -0,0 +1,72 @@
+import os
+import json
+
+import batch_solve
+from log import Log
+from cube import Cube
+from conftest import require_tables
+from test_solver import SOLVER_TABLES, SCRAMBLE, OPTIMAL_LENGTH
+
+SOLVE_ARGS = {"search_depth": None, "time_budget": None, "target_length": None, "node_budget": None}
+
+def scrambled_log() -> str:
+    '''
+    Returns the contents of a log file scrambled by SCRAMBLE
+    '''
+    cube = Cube()
+    cube.log.scrambling = True
+
+    return str(cube.apply_solution(SCRAMBLE).log)
+
+def test_find_logs(tmp_path, capsys):
+    for name in ("b.log", "a.log", "a.solution.log", "c.txt"):
+        (tmp_path / name).write_text("")
+
+    assert batch_solve.find_logs([str(tmp_path)]) == [str(tmp_path / "a.log"), str(tmp_path / "b.log")]
+    assert batch_solve.find_logs([str(tmp_path / "*.txt"), "-"]) == [str(tmp_path / "c.txt"), "-"]
+
+    assert batch_solve.find_logs([str(tmp_path / "missing*.log")]) == []
+    assert "No log files match" in capsys.readouterr().err
+
+def test_solution_log_path(tmp_path):
+    path = str(tmp_path / "logs" / "a.log")
+
+    assert batch_solve.solution_log_path(path) == str(tmp_path / "logs" / "a.solution.log")
+    assert batch_solve.solution_log_path(path, str(tmp_path / "out")) == str(tmp_path / "out" / "a.solution.log")
+    assert batch_solve.solution_log_path("-") == os.path.join(batch_solve.LAUNCH_DIRECTORY, "stdin.solution.log")
+
+def test_solve_log_saves_solution(tmp_path):
+    require_tables(*SOLVER_TABLES)
+    output_path = str(tmp_path / "a.solution.log")
+
+    summary = batch_solve.solve_log(("a.log", scrambled_log(), output_path, SOLVE_ARGS))
+
+    assert "error" not in summary
+    assert (summary["output"], summary["length"]) == (output_path, OPTIMAL_LENGTH)
+    assert summary["solutions"] >= 1 and summary["nodes"] > 0
+
+    #the saved log holds the scramble followed by the solution
+    with open(output_path) as f:
+        log = Log.from_string(f.read())
+    assert len(log.scramble) == len(Log.from_string(scrambled_log()).scramble)
+    assert Cube.from_log(log).state.is_solved()
+
+def test_solve_log_reports_bad_logs(tmp_path):
+    summary = batch_solve.solve_log(("bad.log", "not a log", str(tmp_path / "bad.solution.log"), SOLVE_ARGS))
+
+    assert "ValueError" in summary["error"]
+    assert (summary["output"], summary["solutions"]) == (None, 0)
+
+def test_main_writes_summaries(tmp_path):
+    require_tables(*SOLVER_TABLES)
+    (tmp_path / "a.log").write_text(scrambled_log())
+    (tmp_path / "bad.log").write_text("not a log")
+
+    batch_solve.main([str(tmp_path), "-j", "1", "-t", "0", "-o", str(tmp_path / "out"), "-s", str(tmp_path / "summary.jsonl")])
+
+    with open(tmp_path / "summary.jsonl") as f:
+        summaries = {summary["input"]: summary for summary in map(json.loads, f)}
+
+    assert summaries[str(tmp_path / "a.log")]["length"] == OPTIMAL_LENGTH
+    assert "error" in summaries[str(tmp_path / "bad.log")]
+    assert os.listdir(tmp_path / "out") == ["a.solution.log"]
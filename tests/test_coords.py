@@ -0,0 +1,39 @@
+import numpy as np
+
+import utils
+
+def reference_to_int(digits, base: int) -> int:
+    #the first digit is the least significant
+    return sum(int(digit) * base**i for i, digit in enumerate(digits))
+
+def test_index_encoders_match_reference():
+    rng = np.random.default_rng(1)
+    k4_lists = rng.integers(0, 4, (100, 15)).astype(np.uint8)
+    c3_lists = rng.integers(0, 3, (100, 15)).astype(np.uint8)
+
+    k4_coords = [reference_to_int(k4_list, 4) for k4_list in k4_lists]
+    c3_coords = [reference_to_int(c3_list[:14], 3) for c3_list in c3_lists]
+
+    assert [utils.k4_list_to_int(k4_list) for k4_list in k4_lists] == k4_coords
+    assert [utils.c3_list_to_int(c3_list) for c3_list in c3_lists] == c3_coords
+    assert utils.k4_lists_to_int(k4_lists).tolist() == k4_coords
+    assert utils.c3_lists_to_int(c3_lists).tolist() == c3_coords
+
+def test_index_encoders_round_trip():
+    rng = np.random.default_rng(2)
+    k4_coords = rng.integers(0, 4**15, 100).astype(np.uint32)
+    c3_coords = rng.integers(0, 3**14, 100).astype(np.uint32)
+
+    assert np.array_equal(utils.k4_lists_to_int(utils.int_to_k4_lists(k4_coords)), k4_coords)
+    assert np.array_equal(utils.c3_lists_to_int(utils.int_to_c3_lists(c3_coords)), c3_coords)
+
+    for coord in k4_coords:
+        assert np.array_equal(utils.int_to_base(coord, 4, 15), utils.int_to_k4_lists(np.array([coord], dtype=np.uint32))[0])
+
+    #the last piece of a C3 list makes the total twist a multiple of 3
+    assert np.all(utils.int_to_c3_lists(c3_coords).sum(axis=1) % 3 == 0)
+
+def test_index_encoders_extremes():
+    assert utils.k4_list_to_int(np.zeros(15, dtype=np.uint8)) == 0
+    assert utils.k4_list_to_int(np.full(15, 3, dtype=np.uint8)) == 4**15 - 1
+    assert utils.c3_list_to_int(np.full(15, 2, dtype=np.uint8)) == 3**14 - 1
@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+import pytest
+
+import defs
+from cube_internal import Cubiecube, CubieBatch
+from conftest import require_tables
+
+def random_cubes(n: int, seed: int) -> list:
+    random.seed(seed)
+    return [Cubiecube.from_int(random.randrange(defs.N_STATES)) for _ in range(n)]
+
+def test_batched_coords_match_cubiecube():
+    cubes = random_cubes(50, 1)
+    a4s = np.array([cube.a4 for cube in cubes], dtype=np.uint8)
+    permutations = np.array([cube.permutation for cube in cubes], dtype=np.uint8)
+
+    assert Cubiecube.get_c3_coords(a4s).tolist() == [cube.get_c3_coord() for cube in cubes]
+    assert Cubiecube.get_k4_coords(a4s).tolist() == [cube.get_k4_coord() for cube in cubes]
+    assert Cubiecube.get_IO_coords(permutations).tolist() == [cube.get_IO_coord() for cube in cubes]
+    assert Cubiecube.get_I_coords(permutations).tolist() == [cube.get_I_coord() for cube in cubes]
+    assert Cubiecube.get_O_coords(permutations).tolist() == [cube.get_O_coord() for cube in cubes]
+
+def test_batched_coords_decode_like_cubiecube():
+    random.seed(2)
+    c3_coords = np.array([random.randrange(defs.N_C3_COORD_STATES) for _ in range(50)], dtype=np.uint32)
+    k4_coords = np.array([random.randrange(defs.N_PHASE1_STATES) for _ in range(50)], dtype=np.uint32)
+    IO_coords = np.array([random.randrange(defs.N_IO_COORD_STATES) for _ in range(50)], dtype=np.uint16)
+    I_coords = np.array([random.randrange(defs.N_I_COORD_STATES) for _ in range(50)], dtype=np.uint16)
+    O_coords = np.array([random.randrange(defs.N_O_COORD_STATES) for _ in range(50)], dtype=np.uint16)
+
+    assert np.array_equal(Cubiecube.c3_coords_to_a4s(c3_coords), [Cubiecube.from_c3_coord(int(coord)).a4 for coord in c3_coords])
+    assert np.array_equal(Cubiecube.k4_coords_to_a4s(k4_coords), [Cubiecube.from_k4_coord(int(coord)).a4 for coord in k4_coords])
+    assert np.array_equal(Cubiecube.coords_to_permutations(IO_coords, I_coords, O_coords),
+                          [Cubiecube.from_permutation_coords(*coords).permutation for coords in zip(IO_coords, I_coords, O_coords)])
+
+    #and the encoders invert them
+    assert np.array_equal(Cubiecube.get_c3_coords(Cubiecube.c3_coords_to_a4s(c3_coords)), c3_coords)
+    assert np.array_equal(Cubiecube.get_k4_coords(Cubiecube.k4_coords_to_a4s(k4_coords)), k4_coords)
+    permutations = Cubiecube.coords_to_permutations(IO_coords, I_coords, O_coords)
+    assert np.array_equal(Cubiecube.get_IO_coords(permutations), IO_coords)
+    assert np.array_equal(Cubiecube.get_I_coords(permutations), I_coords)
+    assert np.array_equal(Cubiecube.get_O_coords(permutations), O_coords)
+
+def test_batched_ints_round_trip_cubiecube():
+    cubes = random_cubes(50, 3)
+    ints = [cube.to_int() for cube in cubes]
+    a4s, permutations = Cubiecube.from_ints(np.array(ints + [0, defs.N_STATES - 1], dtype=object))
+
+    assert [Cubiecube(a4, permutation) for a4, permutation in zip(a4s, permutations)] == cubes + [Cubiecube(), Cubiecube.from_int(defs.N_STATES - 1)]
+    assert Cubiecube.to_ints(a4s, permutations).tolist() == ints + [0, defs.N_STATES - 1]
+
+def test_batch_moves_match_cubiecube():
+    require_tables("A4_LIST_MOVE_TABLE", "PERMUTATION_LIST_MOVE_TABLE")
+    cubes = random_cubes(30, 4)
+    batch = CubieBatch.from_cubiecubes(cubes)
+
+    #one move for every cube
+    for move in (0, 17, defs.N_PHASE1_MOVES - 1):
+        assert batch.apply_move_new(move).to_cubiecubes() == [cube.apply_move_new(move) for cube in cubes]
+
+    #a move for each cube
+    moves = np.array([random.randrange(defs.N_PHASE1_MOVES) for _ in cubes])
+    assert batch.apply_move_new(moves).to_cubiecubes() == [cube.apply_move_new(int(move)) for cube, move in zip(cubes, moves)]
+    assert batch.to_cubiecubes() == cubes
+
+def test_batch_multiply_matches_cubiecube():
+    cubes = random_cubes(30, 5)
+    others = random_cubes(30, 6)
+    batch = CubieBatch.from_cubiecubes(cubes)
+
+    assert batch.multiply_new(CubieBatch.from_cubiecubes(others)).to_cubiecubes() == [cube.multiply_new(other) for cube, other in zip(cubes, others)]
+    assert batch.multiply_new(others[0]).to_cubiecubes() == [cube.multiply_new(others[0]) for cube in cubes]
+
+    #a batch of one cube on the left is multiplied with every cube on the right
+    assert CubieBatch.from_cubiecubes(others[:1]).multiply_new(batch).to_cubiecubes() == [others[0].multiply_new(cube) for cube in cubes]
+
+    with pytest.raises(ValueError):
+        batch.multiply(CubieBatch.from_cubiecubes(others[:2]))
+
+def test_batch_keys_and_ints():
+    cubes = random_cubes(20, 7)
+    batch = CubieBatch.from_cubiecubes(cubes + cubes[:5])
+
+    assert batch.unique().to_cubiecubes() == cubes
+    assert len(set(batch.hashes().tolist())) == 20
+    assert np.all(batch == CubieBatch.from_ints(batch.to_ints()))
+    assert batch.to_ints().tolist() == [cube.to_int() for cube in cubes + cubes[:5]]
+    assert np.array_equal(batch.get_c3_coords(), [cube.get_c3_coord() for cube in cubes + cubes[:5]])
+    assert batch[3] == cubes[3] and batch[2:4].to_cubiecubes() == cubes[2:4]
+
+    #comparing a batch and a cube works either way round
+    assert np.array_equal(batch == cubes[3], np.arange(25) % 20 == 3)
+    assert np.array_equal(cubes[3] == batch, batch == cubes[3])
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+
+import defs
+import utils
+import gen_move_tables
+from cube_internal import Cubiecube, CubieBatch
+from conftest import require_tables
+
+def test_c3_move_table_matches_cubiecube():
+    require_tables("C3_MOVE_TABLE")
+    random.seed(1)
+
+    for c3 in [0, defs.N_C3_COORD_STATES - 1] + [random.randrange(defs.N_C3_COORD_STATES) for _ in range(20)]:
+        cube = Cubiecube.from_c3_coord(c3)
+        for move in range(defs.N_PHASE2_MOVES):
+            assert defs.C3_MOVE_TABLE[move, c3] == cube.apply_move_new(move).get_c3_coord()
+
+def test_permutation_move_tables_match_cubiecube():
+    require_tables("IO_MOVE_TABLE", "I_MOVE_TABLE", "O_MOVE_TABLE")
+    random.seed(2)
+
+    for _ in range(20):
+        IO, I, O = random.randrange(defs.N_IO_COORD_STATES), random.randrange(defs.N_I_COORD_STATES), random.randrange(defs.N_O_COORD_STATES)
+
+        for move in range(defs.N_PHASE2_MOVES):
+            assert defs.IO_MOVE_TABLE[move, IO] == Cubiecube.from_permutation_coords(IO, 0, 0).apply_move_new(move).get_IO_coord()
+
+        for move in range(defs.N_PHASE3_MOVES):
+            assert defs.I_MOVE_TABLE[move, I] == Cubiecube.from_permutation_coords(0, I, 0).apply_move_new(move).get_I_coord()
+            assert defs.O_MOVE_TABLE[move, O] == Cubiecube.from_permutation_coords(0, 0, O).apply_move_new(move).get_O_coord()
+
+def test_batched_generator_matches_saved_table():
+    require_tables("IO_MOVE_TABLE")
+
+    coords = np.arange(0, defs.N_IO_COORD_STATES, 7, dtype=np.uint16)
+    zeros = np.zeros_like(coords)
+    move_table = gen_move_tables.gen_permutation_move_table(defs.N_PHASE2_MOVES, utils.coords_to_permutations(coords, zeros, zeros),
+                                                            CubieBatch.get_IO_coords)
+
+    assert np.array_equal(move_table, defs.IO_MOVE_TABLE[:, coords])
@@ -0,0 +1,112 @@
+import random
+
+import numpy as np
+
+import defs
+import phase1
+from cube_internal import Cubiecube
+from conftest import require_tables, brute_force_solutions, get_solutions, node_move_function
+
+PHASE1_TABLES = ("K4_CHUNK_MOVE_TABLE", "K4_SYMMETRY_TABLE", "K4_SYMMETRY_CLASSES", "PHASE1_PRUNING_TABLE")
+
+apply_move = node_move_function(phase1)
+
+def test_search_finds_every_short_solution():
+    require_tables(*PHASE1_TABLES)
+    random.seed(1)
+
+    #the solved node has more solutions of length 2 than fit in one batch of the search
+    nodes = [phase1.Node(0)] + [Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(n)]).get_phase1_node()
+                                for n in (1, 2)]
+
+    for node in nodes:
+        solutions = get_solutions(phase1, node, 2)
+
+        assert [len(solution) for solution in solutions] == sorted(len(solution) for solution in solutions)
+        assert len(set(solutions)) == len(solutions)
+        assert set(solutions) == brute_force_solutions(node.index, range(defs.N_PHASE1_MOVES), defs.TWIST_AXES, apply_move, 2)
+
+    assert len(get_solutions(phase1, phase1.Node(0), 2)) > phase1.SOLUTION_BATCH_SIZE
+
+def test_search_first_solution_is_optimal():
+    require_tables(*PHASE1_TABLES)
+    random.seed(2)
+
+    for _ in range(5):
+        cube = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(8)])
+        node = cube.get_phase1_node()
+        solution = next(phase1.solution_generator(node))
+
+        assert len(solution) == phase1.get_distance(node)
+        assert cube.apply_move_list_new(solution).get_phase1_node().index == 0
+
+def test_search_stops_at_bound():
+    require_tables(*PHASE1_TABLES)
+
+    node = Cubiecube().apply_move_list_new([50, 3, 70]).get_phase1_node()
+    bound = np.array([phase1.get_distance(node) + 1])
+
+    assert all(len(solution) < bound[0] for solution in phase1.solution_generator(node, bound=bound))
+
+def test_packed_moves_match_cubiecube():
+    require_tables("K4_CHUNK_MOVE_TABLE")
+    random.seed(3)
+
+    cubes = [Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(20)]) for _ in range(10)]
+    indices = np.array([cube.get_phase1_node().index for cube in cubes], dtype=np.uint32)
+
+    for move in range(defs.N_PHASE1_MOVES):
+        expected = [cube.apply_move_new(move).get_phase1_node().index for cube in cubes]
+
+        assert [int(phase1.apply_move(move, index, defs.K4_CHUNK_MOVE_TABLE)) for index in indices] == expected
+        assert phase1.apply_move_to_indices(indices, move).tolist() == expected
+
+def test_packed_state_round_trips_k4_list():
+    random.seed(4)
+
+    for _ in range(20):
+        k4_list = np.array([random.randrange(4) for _ in range(15)], dtype=np.uint8)
+        node = phase1.Node.from_list(k4_list)
+
+        assert 0 <= node.index < defs.N_PHASE1_STATES
+        assert np.array_equal(node.list, k4_list)
+
+def get_reduced_index(index: int) -> int:
+    return int(phase1.get_reduced_index(index, defs.K4_SYMMETRY_TABLE, defs.K4_SYMMETRY_CLASSES))
+
+def test_symmetry_table_matches_conjugation():
+    require_tables("K4_SYMMETRY_TABLE")
+    random.seed(6)
+
+    for _ in range(10):
+        cube = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(30)])
+        index = cube.get_phase1_node().index
+
+        for symmetry, axes in enumerate(defs.PHASE1_SYMMETRIES):
+            assert phase1.conjugate(symmetry, index, defs.K4_SYMMETRY_TABLE) == cube.conjugate_new(axes).get_phase1_node().index
+
+def test_reduced_index_is_symmetric():
+    require_tables(*PHASE1_TABLES)
+    random.seed(7)
+
+    for _ in range(20):
+        cube = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(30)])
+        index = get_reduced_index(cube.get_phase1_node().index)
+
+        assert index < defs.N_PHASE1_REDUCED_STATES
+        for axes in defs.PHASE1_SYMMETRIES:
+            assert get_reduced_index(cube.conjugate_new(axes).get_phase1_node().index) == index
+
+def test_reduced_distance_matches_unreduced_neighbours():
+    require_tables(*PHASE1_TABLES)
+    random.seed(8)
+    max_depth = defs.PHASE1_PRUNING_TABLE.max_depth
+
+    for n_moves in range(1, 9):
+        node = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(n_moves)]).get_phase1_node()
+        distance = phase1.get_distance(node)
+        neighbours = [phase1.get_distance(node.apply_move(move)) for move in range(defs.N_PHASE1_MOVES)]
+
+        #the distances of the unreduced neighbours differ by at most 1 and one is a move closer, so the reduced distance is the unreduced one
+        assert all(abs(neighbour - distance) <= 1 for neighbour in neighbours)
+        assert distance == 0 or distance > max_depth or min(neighbours) == distance - 1
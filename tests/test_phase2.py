@@ -0,0 +1,75 @@
+import random
+
+import numpy as np
+
+import defs
+import phase2
+from cube_internal import Cubiecube
+from conftest import require_tables, brute_force_solutions, get_solutions, node_move_function
+
+PHASE2_TABLES = ("C3_MOVE_TABLE", "IO_MOVE_TABLE", "C3_SYMMETRY_TABLE", "IO_SYMMETRY_CLASSES", "PHASE2_PRUNING_TABLE")
+
+apply_move = node_move_function(phase2)
+
+def test_search_finds_every_short_solution():
+    require_tables(*PHASE2_TABLES)
+    random.seed(1)
+
+    for n_moves in (1, 2, 3):
+        scramble = [random.randrange(defs.N_PHASE2_MOVES) for _ in range(n_moves)]
+        node = Cubiecube().apply_move_list_new(scramble).get_phase2_node()
+
+        solutions = get_solutions(phase2, node, 3)
+
+        #every solution is found once and in order of increasing length
+        assert [len(solution) for solution in solutions] == sorted(len(solution) for solution in solutions)
+        assert len(set(solutions)) == len(solutions)
+        assert set(solutions) == brute_force_solutions(node.index, range(defs.N_PHASE2_MOVES), defs.TWIST_AXES, apply_move, 3)
+
+def test_search_first_solution_is_optimal():
+    require_tables(*PHASE2_TABLES)
+    random.seed(2)
+
+    for _ in range(5):
+        cube = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE2_MOVES) for _ in range(8)])
+        node = cube.get_phase2_node()
+        solution = next(phase2.solution_generator(node))
+
+        assert len(solution) == phase2.get_distance(node)
+        assert cube.apply_move_list_new(solution).get_phase2_node().index == 0
+
+def test_search_stops_at_bound():
+    require_tables(*PHASE2_TABLES)
+
+    node = Cubiecube().apply_move_list_new([3, 20, 9]).get_phase2_node()
+    bound = np.array([phase2.get_distance(node) + 1])
+
+    assert all(len(solution) < bound[0] for solution in phase2.solution_generator(node, bound=bound))
+
+def get_reduced_index(node: phase2.Node) -> int:
+    return phase2.get_reduced_index(node.c3, node.io, defs.C3_SYMMETRY_TABLE, defs.IO_SYMMETRY_CLASSES)
+
+def test_reduced_index_is_symmetric():
+    require_tables(*PHASE2_TABLES)
+    random.seed(4)
+
+    for _ in range(20):
+        cube = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE2_MOVES) for _ in range(30)])
+        index = get_reduced_index(cube.get_phase2_node())
+
+        for axes in defs.PHASE2_SYMMETRIES:
+            assert get_reduced_index(cube.conjugate_new(axes).get_phase2_node()) == index
+
+def test_reduced_distance_matches_unreduced_neighbours():
+    require_tables(*PHASE2_TABLES)
+    random.seed(5)
+    max_depth = defs.PHASE2_PRUNING_TABLE.max_depth
+
+    for n_moves in range(1, 9):
+        node = Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE2_MOVES) for _ in range(n_moves)]).get_phase2_node()
+        distance = phase2.get_distance(node)
+        neighbours = [phase2.get_distance(node.apply_move(move)) for move in range(defs.N_PHASE2_MOVES)]
+
+        #the distances of the unreduced neighbours differ by at most 1 and one is a move closer, so the reduced distance is the unreduced one
+        assert all(abs(neighbour - distance) <= 1 for neighbour in neighbours)
+        assert distance == 0 or distance > max_depth or min(neighbours) == distance - 1
@@ -0,0 +1,190 @@
+import os
+import random
+
+import numpy as np
+import numba as nb
+import pytest
+
+import defs
+import utils
+import phase3
+from conftest import require_tables
+
+#a synthetic puzzle whose states are the coordinates of a box which wrap around, with moves adding or subtracting 1 from one coordinate
+BOX_SHAPE = (20, 30, 7)
+N_BOX_STATES = int(np.prod(BOX_SHAPE))
+N_BOX_MOVES = 2 * len(BOX_SHAPE)
+
+def apply_box_move(nodes: np.ndarray, move: int) -> np.ndarray:
+    '''
+    Returns the indices of the box states resulting from applying the move to an array of state indices
+    '''
+    coords = list(np.unravel_index(np.asarray(nodes, dtype=np.int64), BOX_SHAPE))
+    axis, side = divmod(move, 2)
+    coords[axis] = (coords[axis] + (1 if side else -1)) % BOX_SHAPE[axis]
+
+    return np.ravel_multi_index(coords, BOX_SHAPE).astype(np.int64)
+
+@nb.njit
+def apply_box_move_to_index(move: int, index: int) -> int:
+    '''
+    Returns the index of the box state resulting from applying the move to the state with the given index
+    '''
+    coords = [index // (BOX_SHAPE[1] * BOX_SHAPE[2]), index // BOX_SHAPE[2] % BOX_SHAPE[1], index % BOX_SHAPE[2]]
+    axis, side = divmod(move, 2)
+    coords[axis] = (coords[axis] + (1 if side else -1)) % BOX_SHAPE[axis]
+
+    return (coords[0] * BOX_SHAPE[1] + coords[1]) * BOX_SHAPE[2] + coords[2]
+
+@nb.njit
+def scan_box_distance(table: utils.PruningTable, index: int) -> int:
+    return utils.scan_distance(table, index, N_BOX_MOVES, apply_box_move_to_index)
+
+def box_distances() -> np.ndarray:
+    '''
+    Returns the distance from solved of every box state
+    '''
+    distances = [np.minimum(np.arange(n), n - np.arange(n)) for n in BOX_SHAPE]
+
+    return sum(np.ix_(*distances)).ravel()
+
+def decode_table(table: utils.PruningTable) -> np.ndarray:
+    '''
+    Returns the values stored for every box state
+    '''
+    return utils.get_entry_range(table, 0, N_BOX_STATES)
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    #split the box states into several chunks
+    monkeypatch.setattr(utils, "PRUNE_CHUNK_SIZE", 256)
+
+def test_breadth_first_matches_distances(small_chunks):
+    table = utils.prune_breadth_first(N_BOX_STATES, 30, N_BOX_MOVES, apply_box_move)
+
+    assert np.array_equal(decode_table(table), box_distances())
+
+def test_breadth_first_stops_at_max_depth(small_chunks):
+    distances = box_distances()
+    table = utils.prune_breadth_first(N_BOX_STATES, 10, N_BOX_MOVES, apply_box_move)
+
+    assert np.array_equal(decode_table(table), np.where(distances > 10, 11, distances))
+
+def test_phase3_vectorized_moves_match_nodes():
+    require_tables("I_MOVE_TABLE", "O_MOVE_TABLE")
+    random.seed(5)
+
+    indices = np.array([random.randrange(defs.N_PHASE3_STATES) for _ in range(200)], dtype=np.int64)
+    for move in range(defs.N_PHASE3_MOVES):
+        expected = [phase3.Node(int(index)).apply_move(move).index for index in indices]
+        assert phase3.apply_move_to_indices(indices, move).tolist() == expected
+
+@pytest.mark.parametrize("ratio", [0, float("inf")])
+def test_backward_and_forward_searches_agree(small_chunks, monkeypatch, ratio):
+    #a ratio of 0 searches every depth backward and an infinite ratio searches every depth forward
+    monkeypatch.setattr(utils, "BACKWARD_SEARCH_RATIO", ratio)
+    table = utils.prune_breadth_first(N_BOX_STATES, 30, N_BOX_MOVES, apply_box_move)
+
+    assert np.array_equal(decode_table(table), box_distances())
+
+def test_phase3_distances_are_consistent():
+    require_tables("I_MOVE_TABLE", "O_MOVE_TABLE", "PHASE3_PRUNING_TABLE")
+    random.seed(6)
+
+    for _ in range(100):
+        node = phase3.Node(random.randrange(defs.N_PHASE3_STATES))
+        distance = phase3.get_distance(node)
+        neighbours = [phase3.get_distance(node.apply_move(move)) for move in range(defs.N_PHASE3_MOVES)]
+
+        #neighbours are at most a move closer and the solved state is reached by moving closer each time
+        assert all(neighbour >= distance - 1 for neighbour in neighbours)
+        assert distance == 0 or min(neighbours) == distance - 1
+
+def test_mod3_encoding_recovers_distances(small_chunks):
+    distances = box_distances()
+    table = utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, utils.PRUNE_ENCODING_MOD3)
+
+    assert np.array_equal(decode_table(table), np.where(distances > 25, 3, distances % 3))
+
+    for index in range(0, N_BOX_STATES, 7):
+        expected = min(distances[index], 26)
+        assert utils.get_distance(table, index, scan_box_distance) == expected
+
+        #the distance is also recovered from the distance of any neighbour
+        for move in range(N_BOX_MOVES):
+            neighbour = apply_box_move_to_index(move, index)
+            if distances[neighbour] <= 25:
+                assert utils.prune_value(table, index, distances[neighbour]) == expected
+
+def test_nibble_encoding_saturates(small_chunks):
+    distances = box_distances()
+    table = utils.prune_breadth_first(N_BOX_STATES, 30, N_BOX_MOVES, apply_box_move, utils.PRUNE_ENCODING_NIBBLE)
+
+    #the depth is capped so every distance past the cap shares the unvisited value
+    assert table.max_depth == utils.NIBBLE_MAX_DEPTH
+    assert np.array_equal(decode_table(table), np.minimum(distances, utils.NIBBLE_MAX_DEPTH + 1))
+
+    for index in range(0, N_BOX_STATES, 7):
+        assert utils.get_distance(table, index, scan_box_distance) == min(distances[index], utils.NIBBLE_MAX_DEPTH + 1)
+
+class Interrupted(Exception):
+    pass
+
+@pytest.mark.parametrize("encoding", [utils.PRUNE_ENCODING_BYTE, utils.PRUNE_ENCODING_MOD3])
+def test_generation_resumes_from_checkpoint(small_chunks, monkeypatch, tmp_path, encoding):
+    monkeypatch.setattr(utils, "PRUNE_CHECKPOINT_INTERVAL", 1024)
+    checkpoint = str(tmp_path / "table.prun.checkpoint")
+    expected = utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, encoding)
+
+    #stop generating partway through a depth
+    n_calls = [0]
+    def interrupted_move(nodes, move):
+        n_calls[0] += 1
+        if n_calls[0] > 500:
+            raise Interrupted
+        return apply_box_move(nodes, move)
+
+    with pytest.raises(Interrupted):
+        utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, interrupted_move, encoding, checkpoint)
+
+    header = utils.read_table_header(checkpoint)
+    assert header["depth"] > 0 and header["start"] > 0
+
+    table = utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, encoding, checkpoint)
+    assert np.array_equal(table.data, expected.data)
+    assert not os.path.exists(checkpoint)
+
+def test_checkpoint_of_other_table_is_rejected(tmp_path):
+    checkpoint = str(tmp_path / "table.prun.checkpoint")
+    table = utils.new_pruning_table(N_BOX_STATES, 25, utils.PRUNE_ENCODING_BYTE)
+    utils.save_pruning_checkpoint(table, checkpoint, N_BOX_STATES, 3, 0, 10, 100)
+
+    with pytest.raises(ValueError):
+        utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, utils.PRUNE_ENCODING_MOD3, checkpoint)
+
+@pytest.mark.parametrize("encoding", [utils.PRUNE_ENCODING_BYTE, utils.PRUNE_ENCODING_MOD3, utils.PRUNE_ENCODING_NIBBLE])
+def test_workers_match_serial_generation(small_chunks, encoding):
+    expected = utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, encoding)
+    table = utils.prune_breadth_first(N_BOX_STATES, 25, N_BOX_MOVES, apply_box_move, encoding, n_workers=2)
+
+    assert np.array_equal(table.data, expected.data) and table.max_depth == expected.max_depth
+    assert type(table.data) is np.ndarray
+
+@pytest.mark.parametrize("encoding, max_depth", [(utils.PRUNE_ENCODING_NIBBLE, 21), (utils.PRUNE_ENCODING_BYTE, 20), (utils.PRUNE_ENCODING_MOD3, 14)])
+def test_phase3_table_must_be_exact(monkeypatch, encoding, max_depth):
+    #generating the table is refused before any work is done
+    monkeypatch.setattr(defs, "PHASE3_PRUNING_TABLE_ENCODING", encoding)
+    monkeypatch.setattr(defs, "PHASE3_PRUNE_DEPTH", max_depth)
+    with pytest.raises(ValueError):
+        phase3.prune()
+
+    #and so is loading a table saved with the encoding and depth
+    monkeypatch.setattr(defs, "load_pruning_table", lambda filename, max_depth: utils.new_pruning_table(16, max_depth, encoding))
+    with pytest.raises(ValueError):
+        defs.TABLE_LOADERS["PHASE3_PRUNING_TABLE"]()
+
+def test_exact_phase3_table_loads(monkeypatch):
+    table = utils.new_pruning_table(16, defs.PHASE3_FULL_DEPTH, utils.PRUNE_ENCODING_BYTE)
+    monkeypatch.setattr(defs, "load_pruning_table", lambda filename, max_depth: table)
+
+    assert defs.TABLE_LOADERS["PHASE3_PRUNING_TABLE"]() is table
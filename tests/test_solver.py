@@ -0,0 +1,183 @@
+
+import random
+import itertools
+import multiprocessing
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+import defs
+import utils
+import solver
+from cube_internal import Cubiecube
+from conftest import require_tables
+
+SOLVER_TABLES = ("K4_CHUNK_MOVE_TABLE", "K4_SYMMETRY_TABLE", "K4_SYMMETRY_CLASSES", "PHASE1_PRUNING_TABLE", "C3_MOVE_TABLE", "IO_MOVE_TABLE",
+                 "C3_SYMMETRY_TABLE", "IO_SYMMETRY_CLASSES", "PHASE2_PRUNING_TABLE", "I_MOVE_TABLE", "O_MOVE_TABLE", "PHASE3_PRUNING_TABLE")
+
+#a scramble which every solve proves optimal in a few seconds
+SCRAMBLE = [15, 63, 57, 60, 83, 48]
+OPTIMAL_LENGTH = 6
+
+def check_solutions(cube: Cubiecube, solutions: list):
+    '''
+    Checks that the solutions solve the cube and get shorter each time
+    '''
+    assert solutions
+    assert all(cube.apply_move_list_new(solution) == Cubiecube() for solution in solutions)
+    assert all(len(solution) > len(next_solution) for solution, next_solution in zip(solutions, solutions[1:]))
+
+def test_parallel_solve_matches_serial_solve():
+    require_tables(*SOLVER_TABLES)
+    cube = Cubiecube().apply_move_list_new(SCRAMBLE)
+
+    serial_solutions = list(solver.solve(cube))
+    counters = utils.new_counters()
+    parallel_solutions = list(solver.solve(cube, n_workers=2, counters=counters))
+
+    check_solutions(cube, serial_solutions)
+    check_solutions(cube, parallel_solutions)
+    assert len(serial_solutions[-1]) == len(parallel_solutions[-1]) == OPTIMAL_LENGTH
+
+    #the work done by the workers is added to the counters
+    assert counters[utils.COUNTER_NODES] > 0
+    assert counters[utils.COUNTER_BOUND_UPDATES] == len(parallel_solutions)
+
+def lower_register(register: utils.BoundRegister, bound: int):
+    register.lower(bound)
+    register.add_counters(np.arange(len(utils.COUNTER_NAMES)))
+
+def test_bound_register_is_shared_between_processes():
+    with utils.BoundRegister(20) as register:
+        assert not register.lower(25)
+        assert register.lower(15) and register.get() == 15
+
+        process = multiprocessing.Process(target=lower_register, args=(register, 10))
+        process.start()
+        process.join()
+
+        assert register.get() == 10
+        assert register.counters.tolist() == [0, 1, 2, 3 + 2]
+
+        register.stop()
+        assert register.get() == 0
+
+def test_poll_bound_checks_every_interval():
+    state = np.array([0, 0, 3], dtype=np.int64)
+    bound = np.array([10], dtype=np.int64)
+
+    #no check until the interval has passed
+    assert utils.poll_bound(state, bound, 9, 0, 100) == 0
+
+    state[2] = 0
+    assert utils.poll_bound(state, bound, 9, 0, 100) == utils.SEARCH_POLL
+    assert state[2] == 100
+
+    state[2] = 0
+    assert utils.poll_bound(state, bound, 9, 1, 100) == utils.SEARCH_CUT
+
+def test_solve_stops_at_shared_bound():
+    require_tables(*SOLVER_TABLES)
+    cube = Cubiecube().apply_move_list_new(SCRAMBLE)
+
+    #no solution is shorter than the optimal length
+    counters = utils.new_counters()
+    assert list(solver.solve_with_bound(cube, np.array([OPTIMAL_LENGTH]), counters, poll_interval=1)) == []
+
+    #lowering the bound to each solution leaves only the first optimal solution
+    bound = np.array([OPTIMAL_LENGTH + 1])
+    solutions = []
+    for solution in solver.solve_with_bound(cube, bound, counters, poll_interval=1):
+        solutions.append(solution)
+        bound[0] = len(solution)
+    assert [len(solution) for solution in solutions] == [OPTIMAL_LENGTH]
+
+    #a bound lowered by a poll cuts the searches
+    bound = np.array([99])
+    def stop():
+        bound[0] = 0
+
+    counters = utils.new_counters()
+    assert list(solver.solve_with_bound(cube, bound, counters, poll_interval=1, poll=stop)) == []
+    assert counters[utils.COUNTER_CUT_SEARCHES] > 0
+
+def test_conjugation_matches_stickercube():
+    require_tables("A4_LIST_MOVE_TABLE", "PERMUTATION_LIST_MOVE_TABLE")
+    random.seed(3)
+    cubes = [Cubiecube().apply_move_list_new([random.randrange(defs.N_PHASE1_MOVES) for _ in range(20)]) for _ in range(2)]
+
+    for cube in cubes:
+        assert cube.to_stickercube().to_cubiecube() == cube
+        assert cube.multiply_new(cube.invert_new()) == Cubiecube()
+
+        for axes in itertools.permutations(range(4)):
+            conjugate_cube = cube.conjugate_new(axes)
+            assert conjugate_cube == cube.to_stickercube().conjugate_new(axes).to_cubiecube()
+
+            #conjugating commutes with applying the conjugated moves
+            conjugate_moves = solver.get_conjugate_moves(axes)
+            for move in range(0, defs.N_PHASE1_MOVES, 23):
+                assert cube.apply_move_new(move).conjugate_new(axes) == conjugate_cube.apply_move_new(conjugate_moves[move])
+
+def test_oriented_solutions_solve_the_cube():
+    require_tables("A4_LIST_MOVE_TABLE", "PERMUTATION_LIST_MOVE_TABLE")
+    cube = Cubiecube().apply_move_list_new(SCRAMBLE)
+    solution = solver.get_inverse_moves()[SCRAMBLE[::-1]].tolist()
+    assert cube.apply_move_list_new(solution) == Cubiecube()
+
+    for axes in itertools.permutations(range(4)):
+        for inverse in (False, True):
+            #the inverse of the cube is solved by the scramble
+            oriented_solution = solver.get_conjugate_moves(axes)[SCRAMBLE if inverse else solution].tolist()
+            assert solver.orient_cube(cube, axes, inverse).apply_move_list_new(oriented_solution) == Cubiecube()
+
+            assert cube.apply_move_list_new(solver.unorient_solution(oriented_solution, axes, inverse)) == Cubiecube()
+
+def test_race_orientations_cover_every_primary_axis():
+    for inverse in (False, True):
+        #the axis relabelled as W is the primary axis of the search
+        primary_axes = {list(axes).index(3) for axes, orientation_inverse in solver.RACE_ORIENTATIONS if orientation_inverse == inverse}
+        assert primary_axes == {0, 1, 2, 3}
+
+    assert len(set(solver.RACE_ORIENTATIONS)) == len(solver.RACE_ORIENTATIONS)
+
+def test_race_solve_finds_optimal_solution():
+    require_tables(*SOLVER_TABLES)
+    cube = Cubiecube().apply_move_list_new(SCRAMBLE)
+
+    #the searches with X or Y as the primary axis take minutes to prove the solution optimal so the race stops once it is found
+    solutions = list(solver.solve(cube, race=True, target_length=OPTIMAL_LENGTH))
+
+    check_solutions(cube, solutions)
+    assert len(solutions[-1]) == OPTIMAL_LENGTH
+
+def test_solve_limits():
+    limits = solver.SolveLimits(node_budget=100, target_length=10)
+
+    assert not limits.search_limit_reached(99) and limits.search_limit_reached(100)
+    assert limits.target_reached([0] * 10) and not limits.target_reached([0] * 11)
+    assert solver.SolveLimits(deadline=perf_counter() - 1).search_limit_reached(0)
+    assert not solver.SolveLimits().search_limit_reached(10**12) and not solver.SolveLimits().target_reached([])
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_solve_stops_at_limits(n_workers):
+    require_tables(*SOLVER_TABLES)
+    cube = Cubiecube().apply_move_list_new(SCRAMBLE)
+
+    #the first solution found is long enough to stop at
+    solutions = list(solver.solve(cube, n_workers=n_workers, target_length=OPTIMAL_LENGTH + 5))
+    check_solutions(cube, solutions)
+    assert len(solutions[0]) <= OPTIMAL_LENGTH + 5 and len(solutions[-1]) > OPTIMAL_LENGTH
+
+    #proving the solution optimal takes thousands of nodes
+    counters = utils.new_counters()
+    solutions = list(solver.solve(cube, n_workers=n_workers, counters=counters, poll_interval=1, node_budget=100))
+    assert all(cube.apply_move_list_new(solution) == Cubiecube() for solution in solutions)
+    assert counters[utils.COUNTER_NODES] < 1000
+
+    #a random cube takes far longer than the deadline to find a solution
+    random.seed(4)
+    start = perf_counter()
+    assert solver.best_solution(Cubiecube.from_int(random.randrange(defs.N_STATES)), n_workers=n_workers, deadline=start + 1) is None
+    assert perf_counter() - start < 5
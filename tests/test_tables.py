@@ -0,0 +1,146 @@
+import os
+import sys
+import json
+import subprocess
+
+import h5py
+import numpy as np
+import pytest
+
+import defs
+import utils
+
+def random_table(shape=(37, 15), seed=0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(0, 2**16, shape, dtype=np.uint16)
+
+def test_table_file_round_trips(tmp_path):
+    data = random_table()
+    filename = str(tmp_path / "table.move")
+    utils.write_table(data, filename, encoding=1, max_depth=9)
+
+    loaded, header = utils.open_table(filename)
+    assert np.array_equal(loaded, data) and loaded.dtype == data.dtype
+    assert (header["encoding"], header["max_depth"]) == (1, 9)
+    assert utils.verify_table(filename)
+
+    #the data is page aligned after the header
+    assert (tmp_path / "table.move").stat().st_size == utils.TABLE_HEADER_SIZE + data.nbytes
+
+    #move tables are plain arrays over the memory map
+    imported = utils.import_data(filename)
+    assert type(imported) is np.ndarray
+    assert np.array_equal(imported, data)
+
+def test_table_checksum_detects_corruption(tmp_path):
+    filename = str(tmp_path / "table.move")
+    utils.write_table(random_table(), filename)
+
+    with open(filename, "r+b") as f:
+        f.seek(utils.TABLE_HEADER_SIZE + 10)
+        byte = f.read(1)
+        f.seek(utils.TABLE_HEADER_SIZE + 10)
+        f.write(bytes([byte[0] ^ 1]))
+
+    assert not utils.verify_table(filename)
+
+def test_read_table_header_rejects_other_files(tmp_path):
+    filename = str(tmp_path / "table.move")
+    (tmp_path / "table.move").write_bytes(b"not a table")
+
+    with pytest.raises(ValueError):
+        utils.read_table_header(filename)
+
+def test_pruning_table_round_trips(tmp_path):
+    table = utils.PruningTable(random_table((100,)).astype(np.uint8), utils.PRUNE_ENCODING_NIBBLE, 12)
+    filename = str(tmp_path / "table.prun")
+    utils.write_pruning_table(table, filename)
+
+    loaded = utils.import_pruning_table(filename, 5)
+    assert np.array_equal(loaded.data, table.data)
+    assert (loaded.encoding, loaded.max_depth) == (table.encoding, table.max_depth)
+
+def test_h5_file_converts(tmp_path):
+    data = random_table((100,)).astype(np.uint8)
+    filename = str(tmp_path / "table.prun")
+    with h5py.File(filename, "w") as f:
+        f.create_dataset(filename, data=data)
+
+    assert utils.is_h5_file(filename)
+    utils.convert_h5_file(filename, 7)
+
+    #pruning tables saved without an encoding hold one byte per entry
+    assert not utils.is_h5_file(filename)
+    loaded = utils.import_pruning_table(filename, 5)
+    assert np.array_equal(loaded.data, data)
+    assert (loaded.encoding, loaded.max_depth) == (utils.PRUNE_ENCODING_BYTE, 7)
+
+def test_tables_load_on_first_use(monkeypatch):
+    loads = []
+    monkeypatch.setitem(defs.TABLE_LOADERS, "TEST_TABLE", lambda: loads.append(1) or np.arange(3))
+
+    try:
+        assert "TEST_TABLE" not in vars(defs)
+        assert np.array_equal(defs.TEST_TABLE, np.arange(3))
+        assert defs.get_table("TEST_TABLE") is defs.TEST_TABLE
+        assert len(loads) == 1
+
+        #assigning a table replaces it
+        defs.TEST_TABLE = None
+        assert defs.get_table("TEST_TABLE") is None
+        assert len(loads) == 1
+    finally:
+        vars(defs).pop("TEST_TABLE", None)
+
+    with pytest.raises(AttributeError):
+        defs.NOT_A_TABLE
+
+def test_import_loads_no_tables():
+    code = "import defs; print(sum(name in vars(defs) for name in defs.TABLE_LOADERS))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(defs.__file__), capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "0"
+
+@pytest.mark.parametrize("codec", sorted(utils.COMPRESSION_CODECS))
+def test_chunked_table_round_trips(tmp_path, codec):
+    data = random_table((1000, 3))
+    filename = str(tmp_path / "table.move")
+    utils.write_chunked_table(data, filename, codec, chunk_size=1024, max_depth=4)
+
+    assert utils.is_chunked_table_file(filename) and not utils.is_h5_file(filename)
+    table = utils.ChunkedTable(filename)
+    assert table.n_chunks == 6 and table.header["max_depth"] == 4
+    assert np.array_equal(table.read(), data)
+    assert np.array_equal(utils.import_data(filename), data)
+
+    #single chunks hold consecutive entries of the flattened table
+    assert np.array_equal(table.read_chunk(2), data.reshape(-1)[1024:1536])
+    assert np.array_equal(table.read_chunk(5), data.reshape(-1)[2560:])
+
+def test_table_files_compress_and_decompress(tmp_path):
+    table = utils.PruningTable(random_table((5000,)).astype(np.uint8), utils.PRUNE_ENCODING_MOD3, 8)
+    filename = str(tmp_path / "table.prun")
+    utils.write_pruning_table(table, filename)
+
+    utils.compress_table_file(filename)
+    assert utils.is_chunked_table_file(filename)
+    loaded = utils.import_pruning_table(filename, 5)
+    assert np.array_equal(loaded.data, table.data) and (loaded.encoding, loaded.max_depth) == (table.encoding, table.max_depth)
+
+    utils.decompress_table_file(filename)
+    assert not utils.is_chunked_table_file(filename) and utils.verify_table(filename)
+    loaded = utils.import_pruning_table(filename, 5)
+    assert np.array_equal(loaded.data, table.data) and (loaded.encoding, loaded.max_depth) == (table.encoding, table.max_depth)
+
+def test_chunked_table_checksum_detects_corruption(tmp_path):
+    filename = str(tmp_path / "table.move")
+    utils.write_chunked_table(random_table(), filename, "zlib", chunk_size=256)
+
+    #store a different checksum in the header
+    with open(filename, "r+b") as f:
+        header = json.loads(f.read(utils.TABLE_HEADER_SIZE)[len(utils.CHUNKED_TABLE_MAGIC):])
+        header["checksum"] ^= 1
+        f.seek(0)
+        f.write((utils.CHUNKED_TABLE_MAGIC + json.dumps(header).encode()).ljust(utils.TABLE_HEADER_SIZE, b" "))
+
+    with pytest.raises(ValueError):
+        utils.ChunkedTable(filename).read()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from twist import Twist, Direction
+from cube_internal import Stickercube
+
+def random_twists(n: int, seed: int) -> list:
+    np.random.seed(seed)
+    twists = [Twist.random_mc4d() for _ in range(n)]
+
+    #include twists of both layers and of the second layer
+    return twists + [Twist.from_mc4d(code, 1, layer) for code, layer in ((5, 3), (40, 2), (100, 3), (200, 2))]
+
+def test_twist_matches_rotation_matrix():
+    cube = Stickercube()
+
+    for twist in random_twists(50, 1):
+        turned = cube.position[:, twist.axis] * twist.side >= 0
+        expected = cube.position.copy()
+        expected[turned] = [twist.rotate_vector(vector) for vector in cube.position[turned]]
+
+        cube.twist(twist)
+        assert np.array_equal(cube.position, expected)
+
+def test_twist_list_matches_twists():
+    twists = random_twists(100, 2)
+    cube = Stickercube()
+    for twist in twists:
+        cube.twist(twist)
+
+    assert cube == Stickercube().twist_list_new(twists)
+    assert Stickercube().twist_list_new([]) == Stickercube()
+
+def test_twists_are_interned():
+    twist = Twist.from_mc4d_string("20,1,1")
+
+    assert Twist.from_mc4d_string("20,1,1") is twist
+    assert Twist.from_mc4d(20, 1, 1) is twist
+    assert Twist.get(twist.axis, twist.dir, twist.side, twist.amount + twist.dir.order) is twist
+    assert Twist.from_mc4d_string("20,-1,1") is not twist
+
+    #the mc4d string is computed with the twist
+    assert vars(Twist(twist.axis, twist.dir, twist.side, twist.amount))["mc4d_string"] == "20,1,1"
+
+    #amounts are normalized before the lookup, so half turns in either direction are the same twist
+    assert Twist.from_mc4d_string("17,-1,1") is Twist.from_mc4d_string("17,1,1")
+
+def test_mc4d_strings_round_trip():
+    for code, (_, direction, _) in enumerate(Twist.mc4d_order_twist_parameters):
+        #the centre stickers do not define a twist
+        if not np.any(direction):
+            continue
+
+        for amount in (-1, 1):
+            for layer in (1, 2, 3):
+                twist = Twist.from_mc4d_string(",".join(str(x) for x in (code, amount, layer)))
+                moves = [Twist.from_mc4d_string(move) for move in twist.to_mc4d_string().split(" ")]
+
+                assert Stickercube().twist_list_new(moves) == Stickercube().twist_new(twist)
+
+def test_rotation_matrix_matches_exponential():
+    linalg = pytest.importorskip("scipy.linalg")
+
+    for axis, direction, side in Twist.mc4d_order_twist_parameters[::5]:
+        if not np.any(direction):
+            continue
+        twist = Twist(axis, Direction(direction), side, 1)
+
+        #the rotation is the exponential of the cross product matrix of the rotation vector
+        cross_matrix = np.cross(np.eye(3), np.sign(side + 0.1) * twist.dir.vec / twist.dir.l2_norm)
+        matrix3 = np.round(linalg.expm(cross_matrix * 2 * np.pi / twist.dir.order)).astype(int)
+
+        assert np.array_equal(np.delete(np.delete(np.asarray(twist.matrix, dtype=int), axis, 0), axis, 1), matrix3)
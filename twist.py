@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.linalg import expm
 import itertools
 
 #relative signs of the axes in this program as in MC4D
@@ -99,6 +98,13 @@ class Direction:
 class Twist:
     mc4d_order_twist_parameters = get_mc4d_twist_parameters()
 
+    #the mc4d code of each (axis, direction, side) in mc4d_order_twist_parameters
+    mc4d_codes = {(int(axis), tuple(int(x) for x in dir), int(side)): i for i, (axis, dir, side) in enumerate(mc4d_order_twist_parameters)}
+
+    #interned twists keyed by (axis, direction, side, amount) and by mc4d string, see Twist.get and Twist.from_mc4d_string
+    registry = {}
+    mc4d_string_registry = {}
+
     def __init__(self, axis: int, direction: Direction, side: int, amount: int) -> None:
         '''
         Creates a twist definition. Twist properties should not be modified once instance is created.
@@ -117,6 +123,12 @@ class Twist:
 
         #create the rotation matrix
         self.matrix = self.get_rotation_matrix()
+
+        #the rotation matrix is a signed permutation matrix so it is applied by a gather and a sign multiply
+        self.index_map, self.signs = self.get_index_map()
+
+        #twists are not modified so the mc4d string is computed once
+        self.mc4d_string = " ".join([",".join([str(item) for item in mov]) for mov in self.to_mc4d()])
     
     def __eq__(self, other: object) -> bool:
         if type(other) != Twist:
@@ -136,11 +148,34 @@ class Twist:
         '''
         Normalizes the twist amount to -1, 0, 1, or 2
         '''
+        self.amount = Twist.normalized_amount(self.amount, self.dir.order)
+
+    @staticmethod
+    def normalized_amount(amount: int, order: int) -> int:
+        '''
+        Returns the twist amount normalized to -1, 0, 1, or 2 for a direction of the given order
+        '''
         #get the positive amount
-        self.amount = self.amount % self.dir.order
+        amount = amount % order
         #if the reverse amount is shorter then choose that
-        if np.abs(self.amount - self.dir.order) < self.amount:
-            self.amount -= self.dir.order
+        if np.abs(amount - order) < amount:
+            amount -= order
+
+        return amount
+
+    @classmethod
+    def get(cls, axis: int, direction: Direction, side: int, amount: int):
+        '''
+        Returns the interned twist with the given parameters, creating it the first time it is requested. Interned twists must not be modified.
+        '''
+        key = (int(axis), tuple(int(x) for x in direction.vec), int(side), int(Twist.normalized_amount(amount, direction.order)))
+
+        twist = cls.registry.get(key)
+        if twist is None:
+            twist = cls(axis, direction, side, amount)
+            cls.registry[key] = twist
+
+        return twist
     
     @classmethod
     def random_mc4d(cls):
@@ -207,22 +242,27 @@ class Twist:
                     dir = -dir
                 side = 0
 
-        #create the twist object
-        return cls(axis, Direction(dir), side, amount)
+        #get the interned twist object
+        return cls.get(axis, Direction(dir), side, amount)
     
     @classmethod
     def from_mc4d_string(cls, string: str):
-        return cls.from_mc4d(*tuple(int(string.split(",")[i]) for i in range(3)))
+        '''
+        Returns the interned twist from an MC4D string 'mc4d_code,amount,layer'
+        '''
+        twist = cls.mc4d_string_registry.get(string)
+        if twist is None:
+            twist = cls.from_mc4d(*tuple(int(string.split(",")[i]) for i in range(3)))
+            cls.mc4d_string_registry[string] = twist
+
+        return twist
 
     def to_mc4d(self):
         '''
         Returns the MC4D move parameters for the twist as: mc4d_code, amount, layer. Two moves are returned as a list if necessary
         '''
-        #search for the mc4d code
-        for i in range(len(Twist.mc4d_order_twist_parameters)):
-            if (Twist.mc4d_order_twist_parameters[i][0] == self.axis and np.all(Twist.mc4d_order_twist_parameters[i][1] == self.dir.vec) and (Twist.mc4d_order_twist_parameters[i][2] == np.sign(self.side + 0.5))):
-                mc4d_code = i
-                break
+        #look up the mc4d code
+        mc4d_code = Twist.mc4d_codes[(int(self.axis), tuple(int(x) for x in self.dir.vec), int(np.sign(self.side + 0.5)))]
 
         #twist just one layer or both
         if self.side == 0:
@@ -240,7 +280,7 @@ class Twist:
         '''
         Returns the MC4D move parameters for the twist as a string: 'mc4d_code, amount, layer'. The string contains two moves if necessary.
         '''
-        return " ".join([",".join([str(item) for item in mov]) for mov in self.to_mc4d()])
+        return self.mc4d_string
     
     def to_piece_notation(self):
         '''
@@ -309,7 +349,10 @@ class Twist:
             return np.eye(4, dtype=int)
 
         #get 3D rotation matrix for the hyperplane #for some reason we need to manipulate the sign of the twist (probably because this is a left handed coordinate system and I'm not sure how to define the 4th axis anyway)
-        matrix3 = np.round(expm(np.cross(np.eye(3), np.sign(self.side + 0.1) * self.dir.vec/self.dir.l2_norm * (self.amount*2*np.pi/self.dir.order)))).astype(int)
+        #the matrix is the exponential of the cross product matrix of the rotation vector which is given by Rodrigues' formula
+        cross_matrix = np.cross(np.eye(3), np.sign(self.side + 0.1) * self.dir.vec/self.dir.l2_norm)
+        angle = self.amount*2*np.pi/self.dir.order
+        matrix3 = np.round(np.eye(3) + np.sin(angle) * cross_matrix + (1 - np.cos(angle)) * cross_matrix @ cross_matrix).astype(int)
 
         #identity vector for the twist axis
         identity_axis = np.zeros(4)
@@ -321,6 +364,16 @@ class Twist:
 
         return matrix4.astype(np.matrix)
 
+    def get_index_map(self):
+        '''
+        Returns the index map and signs of the rotation matrix, so that the rotated vector is vector[index_map] * signs
+        '''
+        matrix = np.asarray(self.matrix, dtype=int)
+
+        index_map = np.argmax(np.abs(matrix), axis=1)
+
+        return index_map, matrix[np.arange(4), index_map]
+
     def rotate_vector(self, vector: np.ndarray):
         '''
         Returns the vector rotated by the twist object. Does not account for side.
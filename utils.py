@@ -2,6 +2,20 @@ import numpy as np
 import numba as nb
 import h5py
 import os
+import tempfile
+import multiprocessing
+from multiprocessing import shared_memory
+import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from tqdm import trange, tqdm
+
+#faster compression codecs are used for chunked tables if they are installed
+try: import zstandard
+except ImportError: zstandard = None
+try: import lz4.frame
+except ImportError: lz4 = None
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -41,6 +55,9 @@ a4_table = np.array([[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11],
                     [10, 5, 6, 7, 2, 9, 4, 11, 0, 1, 8, 3], 
                     [11, 3, 7, 8, 0, 10, 5, 9, 1, 2, 6, 4]], dtype=np.uint8)
 
+#inverse of each alternating group 4 element
+a4_inverse_table = np.argmin(a4_table, axis=1).astype(np.uint8)
+
 #multiplication table for K4 states being acted on by A4 states
 k4_table = (a4_table // 3)[::3]
 
@@ -53,11 +70,14 @@ permutation_list_to_a4 = np.array([[0, 6, 4, 2], [9, 0, 5, 1], [10, 8, 0, 0], [1
 #array of factorials
 factorial = np.array([1, 1, 2, 6, 24, 120, 720, 5040, 40320, 362880, 3628800, 39916800, 479001600, 6227020800, 87178291200], dtype=np.uint64)
 
-@nb.njit(nb.uint16(nb.uint8, nb.uint8))
+@nb.njit(nb.uint16(nb.uint8, nb.uint8), cache=True)
 def n_choose_k(n: int, k: int):
+    #avoid indexing the factorials with a negative number
+    if k > n:
+        return 0
     return np.int16(factorial[n]/(factorial[k]*factorial[n - k]))
 
-@nb.njit(nb.uint8(nb.uint8[:], nb.uint8, nb.boolean[:]))
+@nb.njit(nb.uint8(nb.uint8[:], nb.uint8, nb.boolean[:]), cache=True)
 def cycle_length(permutation: np.ndarray, start: int, visited: np.ndarray):
     '''
     Counts the length of the permutation cycle starting at 'start' where visited marks which indices have been visited
@@ -74,7 +94,7 @@ def cycle_length(permutation: np.ndarray, start: int, visited: np.ndarray):
     
     return count
 
-@nb.njit(nb.boolean(nb.uint8[:]))
+@nb.njit(nb.boolean(nb.uint8[:]), cache=True)
 def permutation_parity(permutation: np.ndarray):
     '''
     Returns True if the permutation is even and False if the permutation is odd
@@ -91,7 +111,7 @@ def permutation_parity(permutation: np.ndarray):
     
     return even_parity
 
-@nb.njit(nb.boolean[:](nb.uint16))
+@nb.njit(nb.boolean[:](nb.uint16), cache=True)
 def coord_to_IO_permutation(coord: int) -> np.ndarray:
     '''
     Converts an IO permutation coord to its list representation
@@ -120,41 +140,55 @@ def coord_to_IO_permutation(coord: int) -> np.ndarray:
     bool_array[combination] = True
     return bool_array
 
-@nb.njit(nb.uint8[:](nb.uint16))
-def coord_to_I_permutation(coord: int):
+@nb.njit(nb.uint8[:](nb.uint16, nb.uint8), cache=True)
+def coord_to_sub_permutation(coord: int, length: int) -> np.ndarray:
     '''
-    Converts the I permutation coordinate to its list representation
+    Converts a permutation coordinate of length pieces to its list representation (the inverse of sub_permutation_to_coord)
     '''
-
-    #it is common that the coord is 0 so skip the calculation in this case
-    if coord == 0:
-        return np.arange(8, dtype=np.uint8)
-    
     #get the parity and the base coordinate
-    parity, coord = divmod(coord, 20160)
+    parity, coord = divmod(coord, factorial[length] // 2)
 
-    #initialize empty permutation
-    permutation = np.empty(8, dtype=np.uint8)
+    #the pieces which have not been placed
+    remaining = np.ones(length, dtype=np.bool8)
+
+    permutation = np.empty(length, dtype=np.uint8)
+
+    for i in range(length - 1, -1, -1):
+        #the number of pieces before this one which are larger than it (the count for piece 1 is given by the parity)
+        left = 0
+        if i >= 2:
+            left, coord = divmod(coord, factorial[i] // 2)
+
+        #the piece is the remaining piece with left larger remaining pieces
+        j = length - 1
+        while not remaining[j]:
+            j -= 1
+        for _ in range(left):
+            j -= 1
+            while not remaining[j]:
+                j -= 1
 
-    for i in range(7, -1, -1):
-        left = np.uint8(coord//(factorial[i]/2))
-        
-        j = 0
-        while 7 - left - len(permutation[i+1:][permutation[i+1:]>j]) != j:
-            j += 1
-        
         permutation[i] = j
-        coord -= left * factorial[i]/2
+        remaining[j] = False
 
     #if it does not have the parity that it should have then swap the first 2 elements
     if permutation_parity(permutation) == parity:
         permutation[0], permutation[1] = permutation[1], permutation[0]
-    
-
 
     return permutation
 
-@nb.njit(nb.uint8[:](nb.uint16))
+@nb.njit(nb.uint8[:](nb.uint16), cache=True)
+def coord_to_I_permutation(coord: int):
+    '''
+    Converts the I permutation coordinate to its list representation
+    '''
+    #it is common that the coord is 0 so skip the calculation in this case
+    if coord == 0:
+        return np.arange(8, dtype=np.uint8)
+
+    return coord_to_sub_permutation(coord, 8)
+
+@nb.njit(nb.uint8[:](nb.uint16), cache=True)
 def coord_to_O_permutation(coord: int):
     '''
     Converts the O permutation coordinate to its list representation
@@ -163,42 +197,53 @@ def coord_to_O_permutation(coord: int):
     if coord == 0:
         return np.arange(7, dtype=np.uint8)
 
-    #get the parity and the base coordinate
-    parity, coord = divmod(coord, 2520)
+    return coord_to_sub_permutation(coord, 7)
 
-    #initialize empty permutation
-    permutation = np.empty(7, dtype=np.uint8)
+@nb.njit(nb.uint32(nb.uint8[:]), cache=True)
+def k4_list_to_int(k4_list: np.ndarray) -> np.uint32:
+    '''
+    Converts a K4 list of 15 pieces into its base 4 integer (the K4 coordinate)
+    '''
+    index = 0
+    for i in range(14, -1, -1):
+        index = 4 * index + k4_list[i]
 
-    for i in range(6, -1, -1):
-        left = np.uint8(coord//(factorial[i]/2))
-        
-        j = 0
-        while 6 - left - len(permutation[i+1:][permutation[i+1:]>j]) != j:
-            j += 1
-        
-        permutation[i] = j
-        coord -= left * factorial[i]/2
-    
-    #if it does not have the parity that it should have then swap the first 2 elements
-    if permutation_parity(permutation) == parity:
-        permutation[0], permutation[1] = permutation[1], permutation[0]
+    return index
 
-    return permutation
+@nb.njit(nb.uint32(nb.uint8[:]), cache=True)
+def c3_list_to_int(c3_list: np.ndarray) -> np.uint32:
+    '''
+    Converts a C3 list of 15 pieces into its base 3 integer (the C3 coordinate). The last piece is ignored since the others determine it.
+    '''
+    index = 0
+    for i in range(13, -1, -1):
+        index = 3 * index + c3_list[i]
+
+    return index
 
-@nb.njit(nb.uint32(nb.uint8[:], nb.uint8), parallel=True)
-def base_to_int(array: np.ndarray, base: int) -> np.uint32:
+@nb.njit(nb.uint32[:](nb.uint8[:, :]), cache=True)
+def k4_lists_to_int(k4_lists: np.ndarray) -> np.ndarray:
     '''
-    Converts an array of base n integers into an integer. Caution: maximum expected output must be < 2^32!
-    array: array to be converted
-    base: base that the array is in
+    Converts an array of K4 lists with shape (N, 15) into their K4 coordinates
     '''
+    result = np.empty(len(k4_lists), dtype=np.uint32)
+    for j in range(len(k4_lists)):
+        result[j] = k4_list_to_int(k4_lists[j])
+
+    return result
 
-    #reversed index (lowest value place on left)
-    index = np.arange(len(array))
+@nb.njit(nb.uint32[:](nb.uint8[:, :]), cache=True)
+def c3_lists_to_int(c3_lists: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of C3 lists with shape (N, 15) into their C3 coordinates
+    '''
+    result = np.empty(len(c3_lists), dtype=np.uint32)
+    for j in range(len(c3_lists)):
+        result[j] = c3_list_to_int(c3_lists[j])
 
-    return np.sum(base**index * array)
+    return result
 
-@nb.njit(nb.uint8[:](nb.uint32, nb.uint8, nb.uint8))
+@nb.njit(nb.uint8[:](nb.uint32, nb.uint8, nb.uint8), cache=True)
 def int_to_base(integer: int, base: int, padding: int) -> np.ndarray:
     '''
     Converts an integer (<2^32) to an array of base n integers
@@ -220,14 +265,1163 @@ def int_to_base(integer: int, base: int, padding: int) -> np.ndarray:
     
     return array
 
-def write_data(data, filename):
+@nb.njit(nb.uint8[:, :](nb.uint32[:]), cache=True)
+def int_to_c3_lists(c3_coords: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of C3 coordinates into their C3 lists with shape (N, 15), with the last piece determined by the others
+    '''
+    result = np.empty((len(c3_coords), 15), dtype=np.uint8)
+    for j in range(len(c3_coords)):
+        coord = c3_coords[j]
+        total = 0
+        for i in range(14):
+            result[j, i] = coord % 3
+            total += result[j, i]
+            coord //= 3
+        result[j, 14] = (3 - total % 3) % 3
+
+    return result
+
+@nb.njit(nb.uint8[:, :](nb.uint32[:]), cache=True)
+def int_to_k4_lists(k4_coords: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of K4 coordinates into their K4 lists with shape (N, 15)
+    '''
+    result = np.empty((len(k4_coords), 15), dtype=np.uint8)
+    for j in range(len(k4_coords)):
+        coord = k4_coords[j]
+        for i in range(15):
+            result[j, i] = coord & 3
+            coord >>= 2
+
+    return result
+
+@nb.njit(nb.boolean[:](nb.uint8[:, :]), cache=True)
+def permutations_parity(permutations: np.ndarray) -> np.ndarray:
+    '''
+    Returns True for each even permutation and False for each odd permutation in an array of permutations
+    '''
+    result = np.empty(len(permutations), dtype=np.bool8)
+    for j in range(len(permutations)):
+        result[j] = permutation_parity(permutations[j])
+
+    return result
+
+@nb.njit(nb.uint8[:, :](nb.uint16[:], nb.uint16[:], nb.uint16[:]), cache=True)
+def coords_to_permutations(IO_coords: np.ndarray, I_coords: np.ndarray, O_coords: np.ndarray) -> np.ndarray:
+    '''
+    Converts arrays of IO, I and O permutation coordinates into permutations with shape (N, 15)
+    '''
+    result = np.empty((len(IO_coords), 15), dtype=np.uint8)
+    for j in range(len(IO_coords)):
+        IO_list = coord_to_IO_permutation(IO_coords[j])
+        I_list = coord_to_I_permutation(I_coords[j])
+        O_list = coord_to_O_permutation(O_coords[j])
+
+        #fill the O locations with the O pieces and the others with the I pieces
+        i_index = 0
+        o_index = 0
+        for i in range(15):
+            if IO_list[i]:
+                result[j, i] = O_list[o_index] + 8
+                o_index += 1
+            else:
+                result[j, i] = I_list[i_index]
+                i_index += 1
+
+    return result
+
+@nb.njit(nb.uint16(nb.uint8[:]), cache=True)
+def permutation_to_IO_coord(permutation: np.ndarray) -> np.uint16:
+    '''
+    Returns the coordinate for which locations hold the O pieces of the permutation
+    '''
+    coord = 6434
+    k = 1
+    for i in range(15):
+        if permutation[i] > 7:
+            coord -= n_choose_k(i, k)
+            k += 1
+
+    return coord
+
+@nb.njit(nb.uint16(nb.uint8[:], nb.uint8, nb.uint8), cache=True)
+def sub_permutation_to_coord(permutation: np.ndarray, start: int, length: int) -> np.uint16:
+    '''
+    Returns the permutation coordinate of the pieces start to start + length - 1 in the order they appear in the permutation. The coordinate
+    of an odd permutation is offset by half the number of permutations.
+    '''
+    pieces = np.empty(length, dtype=np.uint8)
+    n = 0
+    for i in range(15):
+        if start <= permutation[i] < start + length:
+            pieces[n] = permutation[i] - start
+            n += 1
+
+    coord = 0
+    for i in range(2, length):
+        count = 0
+        for j in range(i):
+            count += pieces[j] > pieces[i]
+        coord += count * (factorial[i] // 2)
+
+    if not permutation_parity(pieces):
+        coord += factorial[length] // 2
+
+    return coord
+
+@nb.njit(nb.uint16[:](nb.uint8[:, :]), cache=True)
+def permutations_to_IO_coords(permutations: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of permutations with shape (N, 15) into their IO coordinates
+    '''
+    result = np.empty(len(permutations), dtype=np.uint16)
+    for j in range(len(permutations)):
+        result[j] = permutation_to_IO_coord(permutations[j])
+
+    return result
+
+@nb.njit(nb.uint16[:](nb.uint8[:, :]), cache=True)
+def permutations_to_I_coords(permutations: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of permutations with shape (N, 15) into their I coordinates
+    '''
+    result = np.empty(len(permutations), dtype=np.uint16)
+    for j in range(len(permutations)):
+        result[j] = sub_permutation_to_coord(permutations[j], 0, 8)
+
+    return result
+
+@nb.njit(nb.uint16[:](nb.uint8[:, :]), cache=True)
+def permutations_to_O_coords(permutations: np.ndarray) -> np.ndarray:
+    '''
+    Converts an array of permutations with shape (N, 15) into their O coordinates
+    '''
+    result = np.empty(len(permutations), dtype=np.uint16)
+    for j in range(len(permutations)):
+        result[j] = sub_permutation_to_coord(permutations[j], 8, 7)
+
+    return result
+
+@nb.njit(nb.uint8[:, :](nb.uint8[:, :], nb.uint8[:], nb.uint8[:]), cache=True)
+def permute_a4_lists(a4_lists: np.ndarray, permutation: np.ndarray, a4_list: np.ndarray) -> np.ndarray:
+    '''
+    Returns the A4 lists with shape (N, 15) resulting from applying the permutation and A4 list of a move (or any cubie) to an array of A4 lists
+    '''
+    result = np.empty_like(a4_lists)
+    for j in range(len(a4_lists)):
+        for i in range(15):
+            result[j, i] = a4_table[a4_lists[j, permutation[i]], a4_list[i]]
+
+    return result
+
+@nb.njit(nb.types.UniTuple(nb.uint8[:, :], 2)(nb.uint8[:, :], nb.uint8[:, :], nb.uint8[:, :], nb.uint8[:, :]), cache=True)
+def multiply_cubies(a4s: np.ndarray, permutations: np.ndarray, other_a4s: np.ndarray, other_permutations: np.ndarray):
+    '''
+    Returns the A4 lists and permutations with shape (N, 15) resulting from multiplying each cubie by the corresponding other cubie. If either
+    side holds only one cubie then it is multiplied with every cubie of the other side. Raises ValueError if the numbers of cubies differ otherwise.
+    '''
+    if len(a4s) != len(other_a4s) and len(a4s) != 1 and len(other_a4s) != 1:
+        raise ValueError("cannot multiply batches of cubies with different lengths")
+
+    n = max(len(a4s), len(other_a4s))
+    new_a4s = np.empty((n, 15), dtype=np.uint8)
+    new_permutations = np.empty((n, 15), dtype=np.uint8)
+
+    for j in range(n):
+        l = j if len(a4s) > 1 else 0
+        k = j if len(other_a4s) > 1 else 0
+        for i in range(15):
+            location = other_permutations[k, i]
+            new_permutations[j, i] = permutations[l, location]
+            new_a4s[j, i] = a4_table[a4s[l, location], other_a4s[k, i]]
+
+    return new_a4s, new_permutations
+
+@nb.njit(nb.void(nb.int64[:, :], nb.int64[:], nb.int64[:], nb.int64[:, :], nb.int64[:, :]), cache=True)
+def twist_position(position: np.ndarray, axes: np.ndarray, sides: np.ndarray, index_maps: np.ndarray, signs: np.ndarray):
+    '''
+    Applies a list of twists to a stickercube position in place
+
+    position: the positions of the 16 pieces with shape (16, 4)
+    axes: the axis of each twist
+    sides: the side of each twist (0 for both sides)
+    index_maps: the index map of the rotation of each twist with shape (N, 4)
+    signs: the signs of the rotation of each twist with shape (N, 4)
+    '''
+    vector = np.empty(4, dtype=np.int64)
+
+    for t in range(len(axes)):
+        for i in range(16):
+            #if the piece is on the correct side then turn it
+            if position[i, axes[t]] * sides[t] >= 0:
+                for j in range(4):
+                    vector[j] = position[i, index_maps[t, j]] * signs[t, j]
+                position[i] = vector
+
+#pruning table encodings
+#one byte per entry holding the distance
+PRUNE_ENCODING_BYTE = 0
+#two bits per entry holding the distance mod 3 (the exact distance is recovered from the distance of a neighbour)
+PRUNE_ENCODING_MOD3 = 1
+#four bits per entry holding the distance, saturating at NIBBLE_MAX_DEPTH + 1
+PRUNE_ENCODING_NIBBLE = 2
+
+#tables with the nibble encoding are generated to at most this depth
+NIBBLE_MAX_DEPTH = 14
+
+class PruningTable(NamedTuple):
+    '''
+    A pruning table stored in one of the pruning table encodings. Entries further than max_depth from solved hold the unvisited value.
+
+    data: the encoded entries
+    encoding: the encoding of the entries
+    max_depth: the depth the table was generated to
+    '''
+    data: np.ndarray
+    encoding: int
+    max_depth: int
+
+def new_pruning_table(n_states: int, max_depth: int, encoding: int) -> PruningTable:
+    '''
+    Returns a pruning table with every entry unvisited
+    '''
+    if encoding == PRUNE_ENCODING_MOD3:
+        data = np.full((n_states + 3) // 4, 255, dtype=np.uint8)
+    elif encoding == PRUNE_ENCODING_NIBBLE:
+        max_depth = min(max_depth, NIBBLE_MAX_DEPTH)
+        data = np.full((n_states + 1) // 2, (max_depth + 1) * 17, dtype=np.uint8)
+    else:
+        data = np.full(n_states, max_depth + 1, dtype=np.uint8)
+
+    return PruningTable(data, encoding, max_depth)
+
+def check_exact_pruning_table(encoding: int, max_depth: int, full_depth: int, name: str):
+    '''
+    Raises ValueError unless a pruning table with the encoding and depth holds the exact distance of every state, which searches that
+    follow the distances straight to a solution rely on
+
+    encoding: the encoding of the pruning table
+    max_depth: the depth the table is generated to
+    full_depth: the distance of the states furthest from solved
+    name: the name of the table used in the error
+    '''
+    if encoding == PRUNE_ENCODING_NIBBLE:
+        raise ValueError(name + " must hold exact distances so it cannot use the nibble encoding, which saturates at depth " + str(NIBBLE_MAX_DEPTH))
+    if max_depth < full_depth:
+        raise ValueError(name + " must hold exact distances but is generated to depth " + str(max_depth) + " instead of " + str(full_depth))
+
+@nb.njit
+def unvisited_value(table: PruningTable) -> int:
+    '''
+    Returns the value stored for entries further than the maximum depth from solved
+    '''
+    if table.encoding == PRUNE_ENCODING_MOD3:
+        return 3
+    return table.max_depth + 1
+
+@nb.njit
+def encode_distance(table: PruningTable, distance: int) -> int:
+    '''
+    Returns the value stored for entries at the given distance from solved
+    '''
+    if distance > table.max_depth:
+        return unvisited_value(table)
+    if table.encoding == PRUNE_ENCODING_MOD3:
+        return distance % 3
+    return distance
+
+@nb.njit
+def get_entry(table: PruningTable, index: int) -> int:
+    '''
+    Returns the value stored for the entry
+    '''
+    index = np.int64(index)
+    if table.encoding == PRUNE_ENCODING_MOD3:
+        return (table.data[index >> 2] >> ((index & 3) << 1)) & 3
+    if table.encoding == PRUNE_ENCODING_NIBBLE:
+        return (table.data[index >> 1] >> ((index & 1) << 2)) & 15
+    return table.data[index]
+
+@nb.njit
+def get_entries(table: PruningTable, indices: np.ndarray) -> np.ndarray:
+    '''
+    Returns the values stored for an array of entries
+    '''
+    result = np.empty(len(indices), dtype=np.uint8)
+    for i in range(len(indices)):
+        result[i] = get_entry(table, indices[i])
+
+    return result
+
+@nb.njit
+def get_entry_range(table: PruningTable, start: int, stop: int) -> np.ndarray:
+    '''
+    Returns the values stored for the entries from start up to stop
+    '''
+    result = np.empty(stop - start, dtype=np.uint8)
+    for i in range(stop - start):
+        result[i] = get_entry(table, start + i)
+
+    return result
+
+@nb.njit
+def set_entries(table: PruningTable, indices: np.ndarray, value: int):
+    '''
+    Stores the value for an array of entries
+    '''
+    for i in range(len(indices)):
+        index = np.int64(indices[i])
+        if table.encoding == PRUNE_ENCODING_MOD3:
+            shift = (index & 3) << 1
+            table.data[index >> 2] = (table.data[index >> 2] & ~(3 << shift)) | (value << shift)
+        elif table.encoding == PRUNE_ENCODING_NIBBLE:
+            shift = (index & 1) << 2
+            table.data[index >> 1] = (table.data[index >> 1] & ~(15 << shift)) | (value << shift)
+        else:
+            table.data[index] = value
+
+@nb.njit
+def count_entries(table: PruningTable, n_states: int, value: int) -> int:
+    '''
+    Returns the number of entries holding the value
+    '''
+    count = 0
+    for i in range(n_states):
+        if get_entry(table, i) == value:
+            count += 1
+
+    return count
+
+@nb.njit
+def prune_value(table: PruningTable, index: int, neighbour_distance: int) -> int:
+    '''
+    Returns the pruning value (lower bound on the distance from solved) of the entry given the pruning value of a neighbouring entry. The
+    neighbour is only needed by the mod 3 encoding, where the distance is the value within 1 of the neighbour's with the stored remainder.
+    '''
+    value = get_entry(table, index)
+
+    if table.encoding == PRUNE_ENCODING_MOD3:
+        if value == 3:
+            return table.max_depth + 1
+        return neighbour_distance - 1 + (value - neighbour_distance + 1) % 3
+
+    return value
+
+def get_distance(table: PruningTable, index: int, scan_distance, *move_tables) -> int:
+    '''
+    Returns the pruning value (lower bound on the distance from solved) of the entry without knowing the value of a neighbour.
+    Entries of the byte and nibble encodings are read directly, for the mod 3 encoding the distance is found by scan_distance.
+
+    table: the pruning table
+    index: the index of the entry
+    scan_distance: compiled function taking the table, the index and the move tables and returning the distance of a visited mod 3 entry
+    move_tables: the move tables passed to scan_distance
+    '''
+    index = int(index)
+
+    if table.encoding == PRUNE_ENCODING_BYTE:
+        return int(table.data[index])
+    if table.encoding == PRUNE_ENCODING_NIBBLE:
+        return (int(table.data[index >> 1]) >> ((index & 1) << 2)) & 15
+
+    if (int(table.data[index >> 2]) >> ((index & 3) << 1)) & 3 == 3:
+        return table.max_depth + 1
+    return scan_distance(table, index, *move_tables)
+
+@nb.njit
+def scan_distance(table: PruningTable, index: int, n_moves: int, apply_move, *move_tables) -> int:
+    '''
+    Returns the distance from solved of a visited entry of a mod 3 pruning table by following moves which decrease the distance until the solved
+    state is reached. Each phase wraps this in a compiled function which binds its apply_move so it is not passed through a python call.
+
+    table: the pruning table
+    index: the index of the entry
+    n_moves: the number of moves
+    apply_move: compiled function taking a move, an index and the move tables and returning the index after the move
+    move_tables: the move tables passed to apply_move
+    '''
+    value = get_entry(table, index)
+
+    distance = 0
+    while index != 0:
+        #find a move to a state one move closer to solved
+        for move in range(n_moves):
+            new_index = apply_move(move, index, *move_tables)
+            if get_entry(table, new_index) == (value + 2) % 3:
+                break
+
+        index = new_index
+        value = (value + 2) % 3
+        distance += 1
+
+    return distance
+
+#number of nodes a search generates between checks of the bound
+BOUND_POLL_INTERVAL = 2**14
+
+#returned by the phase searches when a check finds the bound has dropped to the depth being searched
+SEARCH_CUT = -1
+
+#returned by the phase searches when they stop to let the caller check its limits (calling the search again resumes it)
+SEARCH_POLL = -2
+
+#indices of the counters of the work done by a solve
+COUNTER_NODES = 0
+COUNTER_CUT_SEARCHES = 1
+COUNTER_SKIPPED_PHASE1_SOLUTIONS = 2
+COUNTER_BOUND_UPDATES = 3
+COUNTER_NAMES = ("nodes", "cut_searches", "skipped_phase1_solutions", "bound_updates")
+
+def new_counters() -> np.ndarray:
+    '''
+    Returns zeroed counters of the work done by a solve
+    '''
+    return np.zeros(len(COUNTER_NAMES), dtype=np.int64)
+
+def counters_to_dict(counters: np.ndarray) -> dict:
+    '''
+    Returns the counters as a dictionary of their names to their values
+    '''
+    return {name: int(value) for name, value in zip(COUNTER_NAMES, counters)}
+
+@nb.njit
+def poll_bound(state: np.ndarray, bound: np.ndarray, depth: int, offset: int, poll_interval: int) -> int:
+    '''
+    Checks the bound once the search has generated poll_interval nodes since the last check. Returns SEARCH_CUT if solutions of length
+    depth + offset are no longer shorter than the bound, SEARCH_POLL if the search should stop to let the caller check its limits and 0
+    if the search should continue.
+
+    state: the search state whose third entry holds the number of nodes until the next check
+    bound: array whose first entry is the length which solutions must be shorter than
+    '''
+    if state[2] > 0:
+        return 0
+
+    state[2] = poll_interval
+    if depth + offset >= bound[0]:
+        return SEARCH_CUT
+    return SEARCH_POLL
+
+class BoundRegister:
+    def __init__(self, bound: int) -> None:
+        '''
+        Creates a bound on the solution length in a shared memory block along with counters of the work done by the processes searching
+        against it. The bound can be read without locking and only ever decreases. Registers passed to other processes attach to the same block.
+
+        bound: the length which solutions must be shorter than
+        '''
+        self.memory = shared_memory.SharedMemory(create=True, size=8 * (len(COUNTER_NAMES) + 1))
+        self.lock = multiprocessing.Lock()
+        self.owner = True
+        self.attach()
+
+        self.values[0] = bound
+        self.counters[:] = 0
+
+    def attach(self):
+        #the first value is the bound and the rest are the counters
+        self.values = np.ndarray(len(COUNTER_NAMES) + 1, dtype=np.int64, buffer=self.memory.buf)
+        self.bound = self.values[:1]
+        self.counters = self.values[1:]
+
+    def __getstate__(self):
+        return self.memory.name, self.lock
+
+    def __setstate__(self, state):
+        name, self.lock = state
+        self.memory = shared_memory.SharedMemory(name)
+        self.owner = False
+        self.attach()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get(self) -> int:
+        '''
+        Returns the bound
+        '''
+        return int(self.bound[0])
+
+    def lower(self, bound: int) -> bool:
+        '''
+        Lowers the bound if it is below the current bound and returns whether it was lowered
+        '''
+        with self.lock:
+            if bound >= self.bound[0]:
+                return False
+
+            self.bound[0] = bound
+            self.counters[COUNTER_BOUND_UPDATES] += 1
+            return True
+
+    def stop(self):
+        '''
+        Lowers the bound to 0 so that every search against the register stops at its next check
+        '''
+        with self.lock:
+            self.bound[0] = 0
+
+    def add_counters(self, counters: np.ndarray):
+        '''
+        Adds the counters of a search to the shared counters
+        '''
+        with self.lock:
+            self.counters += counters
+
+    def close(self):
+        '''
+        Detaches from the shared memory block, freeing it if this is the register which created it
+        '''
+        if self.memory is None:
+            return
+
+        self.values = self.bound = self.counters = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+        self.memory = None
+
+#number of pruning table entries scanned at once while generating pruning tables
+PRUNE_CHUNK_SIZE = 2**22
+
+#pruning tables are generated by searching backwards once the frontier is larger than this fraction of the unvisited states
+BACKWARD_SEARCH_RATIO = 0.5
+
+#number of pruning table entries scanned between checkpoints within one depth (a checkpoint is also saved after every depth)
+PRUNE_CHECKPOINT_INTERVAL = 2**32
+
+def save_pruning_checkpoint(table: PruningTable, filename: str, n_states: int, depth: int, start: int, n_frontier: int, n_unvisited: int):
+    '''
+    Saves the progress of generating a pruning table. The file is replaced only once the new checkpoint is fully written.
+
+    table: the partially generated pruning table
+    filename: the name of the checkpoint file
+    n_states: the number of states in the table
+    depth: the depth being explored
+    start: the first entry which has not been scanned at this depth
+    n_frontier: the number of nodes at the previous depth
+    n_unvisited: the number of unvisited nodes before exploring this depth
+    '''
+    write_table(table.data, filename + ".tmp", encoding=table.encoding, max_depth=table.max_depth, n_states=n_states, depth=depth, start=start,
+                n_frontier=n_frontier, n_unvisited=n_unvisited)
+    os.replace(filename + ".tmp", filename)
+
+def load_pruning_checkpoint(filename: str, n_states: int, max_depth: int, encoding: int):
+    '''
+    Returns the pruning table, depth being explored, first unscanned entry, number of nodes at the previous depth and number of unvisited nodes
+    saved in a checkpoint. Raises ValueError if the checkpoint was saved for a different table.
+    '''
+    data, header = open_table(filename)
+    table = new_pruning_table(n_states, max_depth, encoding)
+
+    if (header["n_states"], header["encoding"], header["max_depth"]) != (n_states, table.encoding, table.max_depth):
+        raise ValueError("checkpoint " + filename + " was saved for a different pruning table, delete it to start again")
+
+    #copy into memory since the checkpoint file is replaced while generating
+    table = PruningTable(np.array(data), table.encoding, table.max_depth)
+
+    return table, header["depth"], header["start"], header["n_frontier"], header["n_unvisited"]
+
+def explore_chunk(table: PruningTable, start: int, stop: int, n_moves: int, apply_move, backward: bool, frontier_value: int, new_value: int,
+                  in_place: bool = True) -> np.ndarray:
+    '''
+    Finds the nodes at the next depth from the entries from start up to stop. The backward search always sets the new nodes since they are
+    in the chunk. The forward search sets the new nodes if in_place is True and otherwise returns them without duplicates.
+
+    table: the partially generated pruning table
+    start: the first entry in the chunk
+    stop: the entry after the last entry in the chunk
+    n_moves: the number of moves
+    apply_move: function taking an array of node indices and a move and returning the indices of the resulting nodes
+    backward: whether to search for unvisited nodes neighbouring the frontier rather than expand the frontier
+    frontier_value: the value stored for the nodes at the current depth
+    new_value: the value stored for the nodes at the next depth
+    in_place: whether the forward search sets the new nodes
+    '''
+    chunk = get_entry_range(table, start, stop)
+    unvisited = unvisited_value(table)
+    new_nodes = [np.empty(0, dtype=np.int64)]
+
+    if backward:
+        #get the unvisited nodes in this chunk
+        nodes = start + np.flatnonzero(chunk == unvisited)
+
+        #for every move check which nodes have a neighbour at the current depth
+        for i in range(n_moves):
+            if len(nodes) == 0:
+                break
+
+            found = get_entries(table, apply_move(nodes, i)) == frontier_value
+            set_entries(table, nodes[found], new_value)
+            nodes = nodes[~found]
+    else:
+        #get the frontier nodes in this chunk
+        nodes = start + np.flatnonzero(chunk == frontier_value)
+
+        #for every move find the new nodes that have not been visited
+        n_new_nodes = 0
+        for i in range(n_moves):
+            if len(nodes) == 0:
+                break
+
+            neighbours = apply_move(nodes, i)
+            neighbours = neighbours[get_entries(table, neighbours) == unvisited].astype(np.int64)
+
+            if in_place:
+                set_entries(table, neighbours, new_value)
+                continue
+
+            new_nodes.append(neighbours)
+            n_new_nodes += len(neighbours)
+
+            #remove duplicates now and then to bound the memory used
+            if n_new_nodes > PRUNE_CHUNK_SIZE:
+                new_nodes = [np.unique(np.concatenate(new_nodes))]
+                n_new_nodes = len(new_nodes[0])
+
+    return np.unique(np.concatenate(new_nodes))
+
+#the pruning table and move function of a worker process generating a pruning table in parallel
+_prune_worker = {}
+
+def init_prune_worker(filename: str, n_bytes: int, encoding: int, max_depth: int, apply_move):
+    '''
+    Opens the pruning table shared by the worker processes
+    '''
+    _prune_worker["table"] = PruningTable(np.memmap(filename, dtype=np.uint8, mode="r+", shape=(n_bytes,)), encoding, max_depth)
+    _prune_worker["apply_move"] = apply_move
+
+def explore_shared_chunk(args) -> np.ndarray:
+    '''
+    Calls explore_chunk on the pruning table shared by the worker processes with the arguments (start, stop, n_moves, backward, frontier_value,
+    new_value, in_place)
+    '''
+    start, stop, n_moves, backward, frontier_value, new_value, in_place = args
+
+    return explore_chunk(_prune_worker["table"], start, stop, n_moves, _prune_worker["apply_move"], backward, frontier_value, new_value, in_place)
+
+def prune_breadth_first(n_states: int, max_depth: int, n_moves: int, apply_move, encoding: int = PRUNE_ENCODING_BYTE, checkpoint: str = None,
+                        n_workers: int = 1) -> PruningTable:
+    '''
+    Returns a pruning table holding the distance from solved (index 0) of every state up to max_depth and unvisited for all other states.
+    Each depth is found from the nodes at the previous depth (forward) until the frontier grows large compared to the unvisited states. After
+    that each unvisited state is checked for a neighbour at the previous depth instead (backward), so memory use is bounded by the table
+    and one chunk of indices in both cases. The move set must contain the inverse of every move.
+
+    With the mod 3 encoding the forward search also expands nodes 3, 6, ... moves closer to solved than the frontier but these only lead to
+    visited nodes. The backward search is unaffected since an unvisited node cannot neighbour a node more than 1 move closer to solved.
+
+    Progress is saved to the checkpoint file after every depth and every PRUNE_CHECKPOINT_INTERVAL entries scanned. If the checkpoint file
+    exists generation continues from it and it is deleted once the table is complete. Scanning part of a depth again is harmless since
+    expanding a node twice sets the same entries.
+
+    With more than one worker the chunks of each depth are shared between worker processes which all map the table from a shared file. The
+    backward search only sets entries in its own chunk and chunks never share a byte, so the workers set the entries directly. The forward
+    search can reach any entry, so unless each entry has its own byte the workers return the new nodes and this process sets them. Every new
+    node is set to the same value, so it does not matter which worker reaches it first.
+
+    n_states: the number of states in the table
+    max_depth: the maximum depth to search to
+    n_moves: the number of moves
+    apply_move: function taking an array of node indices and a move and returning the indices of the resulting nodes (must be importable by
+                the worker processes if n_workers is more than 1)
+    encoding: the encoding of the pruning table
+    checkpoint: the name of the checkpoint file (no checkpoints are saved if None)
+    n_workers: the number of worker processes
+    '''
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        #continue from the checkpoint
+        table, current_depth, start, n_frontier, n_unvisited = load_pruning_checkpoint(checkpoint, n_states, max_depth, encoding)
+        print("Resuming from depth " + str(current_depth + 1) + "...")
+    else:
+        #initialize the table with all entries unvisited
+        table = new_pruning_table(n_states, max_depth, encoding)
+
+        #set the solved state
+        set_entries(table, np.zeros(1, dtype=np.int64), encode_distance(table, 0))
+
+        #current distance from solved, the first entry to scan and the number of nodes at that distance
+        current_depth = 0
+        start = 0
+        n_frontier = 1
+        n_unvisited = n_states - 1
+
+    #the encoding may limit the depth of the table
+    max_depth = table.max_depth
+    unvisited = unvisited_value(table)
+
+    if n_workers > 1:
+        #move the table into a file mapped by every worker
+        shared_file, shared_filename = tempfile.mkstemp(suffix=".shared", dir=".")
+        os.close(shared_file)
+        data = np.memmap(shared_filename, dtype=np.uint8, mode="w+", shape=table.data.shape)
+        data[:] = table.data
+        table = PruningTable(data, table.encoding, table.max_depth)
+
+        pool = multiprocessing.Pool(n_workers, init_prune_worker, (shared_filename, len(data), table.encoding, table.max_depth, apply_move))
+        #the forward search can set entries in place if no other entry shares their byte
+        in_place = table.encoding == PRUNE_ENCODING_BYTE
+        explore = lambda tasks: pool.imap_unordered(explore_shared_chunk, tasks)
+    else:
+        in_place = True
+        explore = lambda tasks: (explore_chunk(table, task[0], task[1], task[2], apply_move, *task[3:]) for task in tasks)
+
+    try:
+        #while the last depth found new nodes and we are below the max depth
+        while (current_depth < max_depth) and n_frontier > 0 and n_unvisited > 0:
+            backward = n_frontier > BACKWARD_SEARCH_RATIO * n_unvisited
+            frontier_value = encode_distance(table, current_depth)
+            new_value = encode_distance(table, current_depth + 1)
+
+            with tqdm(total=-(-(n_states - start) // PRUNE_CHUNK_SIZE), leave=False, desc="Exploring Depth " + str(current_depth+1) + (" (backward)" if backward else "")) as progress:
+                #scan the table a chunk at a time for the nodes to expand, saving a checkpoint between batches of chunks
+                for batch_start in range(start, n_states, PRUNE_CHECKPOINT_INTERVAL):
+                    if checkpoint is not None and batch_start != start:
+                        save_pruning_checkpoint(table, checkpoint, n_states, current_depth, batch_start, n_frontier, n_unvisited)
+
+                    batch_stop = min(batch_start + PRUNE_CHECKPOINT_INTERVAL, n_states)
+                    tasks = [(chunk_start, min(chunk_start + PRUNE_CHUNK_SIZE, batch_stop), n_moves, backward, frontier_value, new_value, in_place)
+                             for chunk_start in range(batch_start, batch_stop, PRUNE_CHUNK_SIZE)]
+
+                    for new_nodes in explore(tasks):
+                        set_entries(table, new_nodes, new_value)
+                        progress.update()
+
+            #add 1 to the current distance
+            current_depth += 1
+            start = 0
+            new_n_unvisited = count_entries(table, n_states, unvisited)
+            n_frontier = n_unvisited - new_n_unvisited
+            n_unvisited = new_n_unvisited
+
+            if checkpoint is not None:
+                save_pruning_checkpoint(table, checkpoint, n_states, current_depth, start, n_frontier, n_unvisited)
+    finally:
+        if n_workers > 1:
+            pool.terminate()
+            pool.join()
+
+            #copy the table out of the shared file before deleting it
+            table = PruningTable(np.array(table.data), table.encoding, table.max_depth)
+            del data
+            os.remove(shared_filename)
+
+    #the table is complete so the checkpoint is no longer needed
+    if checkpoint is not None and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    return table
+
+def write_pruning_table(table: PruningTable, filename: str):
+    '''
+    Saves the pruning table along with its encoding and depth
+    '''
+    write_table(table.data, filename, encoding=table.encoding, max_depth=table.max_depth)
+
+def import_pruning_table(filename: str, max_depth: int) -> PruningTable:
+    '''
+    Opens a pruning table. Tables saved without an encoding hold one byte per entry generated to max_depth.
+    '''
+    if is_h5_file(filename):
+        with h5py.File(filename, "r") as f:
+            dataset = f[filename]
+            return PruningTable(dataset[:], int(dataset.attrs.get("encoding", PRUNE_ENCODING_BYTE)), int(dataset.attrs.get("max_depth", max_depth)))
+
+    if is_chunked_table_file(filename):
+        table = ChunkedTable(filename)
+        return PruningTable(table.read(), table.header["encoding"], table.header["max_depth"])
+
+    #the memory map is viewed as a plain array since numba is much slower to accept memmap objects as arguments
+    data, header = open_table(filename)
+    return PruningTable(data.view(np.ndarray), header["encoding"], header["max_depth"])
+
+class SymmetryClasses(NamedTuple):
+    '''
+    The equivalence classes of a coordinate under a group of symmetries. The representative of each class is its smallest coordinate.
+
+    class_index: the class of each coordinate
+    symmetry: a symmetry which conjugates each coordinate to the representative of its class
+    representative: the representative coordinate of each class
+    stabilizer: whether each symmetry fixes the representative of each class (indexed as [class, symmetry])
+    '''
+    class_index: np.ndarray
+    symmetry: np.ndarray
+    representative: np.ndarray
+    stabilizer: np.ndarray
+
+def gen_symmetry_classes(conjugation_table: np.ndarray) -> SymmetryClasses:
+    '''
+    Returns the equivalence classes of a coordinate under a group of symmetries
+
+    conjugation_table: the coordinate after conjugating by each symmetry (indexed as [symmetry, coordinate])
+    '''
+
+    #the representative is the smallest coordinate the coordinate can be conjugated to
+    symmetry = np.argmin(conjugation_table, axis=0).astype(np.uint8)
+    representative_of = np.min(conjugation_table, axis=0)
+
+    representative = np.unique(representative_of)
+    class_index = np.searchsorted(representative, representative_of).astype(np.uint32)
+    stabilizer = (conjugation_table[:, representative] == representative).T.copy()
+
+    return SymmetryClasses(class_index, symmetry, representative, stabilizer)
+
+def gen_k4_chunk_move_table(permutation_move_table: np.ndarray, a4_move_table: np.ndarray) -> np.ndarray:
+    '''
+    Returns a table indexed by [move, chunk, chunk value] for applying moves to packed K4 states. A packed K4 state holds the K4 value of piece i
+    in bits 2i and 2i+1 (the phase 1 node index) so each byte is a chunk of 4 pieces. The packed state after a move is the bitwise or of the
+    table entries for each of its 4 bytes.
+
+    permutation_move_table: the permutation list of each move
+    a4_move_table: the A4 list of each move
+    '''
+
+    #K4 value of each of the 4 pieces in every possible chunk value
+    chunk_pieces = (np.arange(256)[:, None] >> (2 * np.arange(4))) & 3
+
+    table = np.zeros((len(permutation_move_table), 4, 256), dtype=np.uint32)
+
+    for move in range(len(permutation_move_table)):
+        for i in range(15):
+            #find where the piece which ends up in slot i comes from
+            chunk, offset = divmod(int(permutation_move_table[move, i]), 4)
+
+            #add its new K4 value for every value of that chunk
+            table[move, chunk] |= k4_table[chunk_pieces[:, offset], a4_move_table[move, i]].astype(np.uint32) << np.uint32(2 * i)
+
+    return table
+
+def gen_k4_chunk_symmetry_table(location_maps: np.ndarray, k4_maps: np.ndarray) -> np.ndarray:
+    '''
+    Returns a table indexed by [symmetry, chunk, chunk value] for conjugating packed K4 states by symmetries in the same way as
+    gen_k4_chunk_move_table does for moves
+
+    location_maps: the new location of the piece in each location for each symmetry
+    k4_maps: the new K4 orientation of each K4 orientation of the piece in each location for each symmetry (indexed as [symmetry, location, K4])
+    '''
+
+    #K4 value of each of the 4 pieces in every possible chunk value
+    chunk_pieces = (np.arange(256)[:, None] >> (2 * np.arange(4))) & 3
+
+    table = np.zeros((len(location_maps), 4, 256), dtype=np.uint32)
+
+    for symmetry in range(len(location_maps)):
+        for i in range(15):
+            chunk, offset = divmod(i, 4)
+
+            #add the new K4 value of the piece at its new location for every value of its chunk
+            table[symmetry, chunk] |= k4_maps[symmetry, i][chunk_pieces[:, offset]].astype(np.uint32) << np.uint32(2 * location_maps[symmetry][i])
+
+    return table
+
+def gen_k4_symmetry_classes(k4_chunk_symmetry_table: np.ndarray) -> SymmetryClasses:
+    '''
+    Returns the symmetry classes of the upper 14 bits of packed K4 states (the pieces in locations 8 to 14). The symmetries must keep
+    these pieces within locations 8 to 14.
+
+    k4_chunk_symmetry_table: the table from gen_k4_chunk_symmetry_table
+    '''
+    upper = np.arange(2**14)
+
+    return gen_symmetry_classes((k4_chunk_symmetry_table[:, 2][:, upper & 255] | k4_chunk_symmetry_table[:, 3][:, upper >> 8]) >> 16)
+
+#table files hold a header padded to TABLE_HEADER_SIZE followed by the uncompressed data so that they can be memory mapped
+TABLE_MAGIC = b"HYPERSOLVE TABLE"
+TABLE_VERSION = 1
+TABLE_HEADER_SIZE = 4096
+
+#the first bytes of an h5 file (the format tables were saved in before)
+H5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+#number of bytes checksummed at once
+CHECKSUM_CHUNK_SIZE = 2**26
+
+def table_checksum(data: np.ndarray) -> int:
+    '''
+    Returns the CRC32 checksum of the table data
+    '''
+    data = np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+
+    checksum = 0
+    for start in range(0, len(data), CHECKSUM_CHUNK_SIZE):
+        checksum = zlib.crc32(data[start:start + CHECKSUM_CHUNK_SIZE], checksum)
+
+    return checksum
+
+def write_table(data: np.ndarray, filename: str, **attrs):
+    '''
+    Saves the data as a table file
+
+    data: the table data
+    filename: the name of the file
+    attrs: extra values to store in the header
+    '''
     print("Saving data...")
-    with h5py.File(filename, 'w') as hf_object:
-        hf_object.create_dataset(filename, data=data, compression='gzip')
+    data = np.ascontiguousarray(data)
+
+    header = {"version": TABLE_VERSION, "dtype": data.dtype.str, "shape": data.shape, "checksum": table_checksum(data), **attrs}
+    header = TABLE_MAGIC + json.dumps(header).encode()
+
+    if len(header) > TABLE_HEADER_SIZE:
+        raise ValueError("Table header is too large")
+
+    with open(filename, "wb") as f:
+        f.write(header.ljust(TABLE_HEADER_SIZE, b" "))
+        data.tofile(f)
     print("Done")
 
-def import_data(filename):
+def read_table_header(filename: str) -> dict:
+    '''
+    Returns the header of a table file
+    '''
+    with open(filename, "rb") as f:
+        header = f.read(TABLE_HEADER_SIZE)
+
+    if not header.startswith(TABLE_MAGIC):
+        raise ValueError(filename + " is not a table file")
+
+    header = json.loads(header[len(TABLE_MAGIC):])
+
+    if header["version"] != TABLE_VERSION:
+        raise ValueError(filename + " has unsupported table version " + str(header["version"]))
+
+    return header
+
+def open_table(filename: str):
+    '''
+    Returns the data of a table file memory mapped copy on write (pages are shared between processes until they are written to) and its header
+    '''
+    header = read_table_header(filename)
+    data = np.memmap(filename, dtype=np.dtype(header["dtype"]), mode="c", offset=TABLE_HEADER_SIZE, shape=tuple(header["shape"]))
+
+    return data, header
+
+def verify_table(filename: str) -> bool:
+    '''
+    Returns whether the data of a table file matches the checksum in its header
+    '''
+    data, header = open_table(filename)
+
+    return table_checksum(data) == header["checksum"]
+
+def is_h5_file(filename: str) -> bool:
+    '''
+    Returns whether the file is an h5 file
+    '''
+    with open(filename, "rb") as f:
+        return f.read(len(H5_SIGNATURE)) == H5_SIGNATURE
+
+def convert_h5_file(filename: str, max_depth: int = None):
+    '''
+    Converts an h5 file into a table file with the same name
+
+    filename: the name of the file
+    max_depth: the depth of a pruning table saved without its depth (None for other tables)
+    '''
+    print("Converting " + filename + "...")
     with h5py.File(filename, "r") as f:
-        return f[filename][:]
+        dataset = f[filename]
+        data = dataset[:]
+        attrs = {key: int(value) for key, value in dataset.attrs.items()}
+
+    #pruning tables from before encodings were stored hold one byte per entry
+    if max_depth is not None:
+        attrs.setdefault("encoding", PRUNE_ENCODING_BYTE)
+        attrs.setdefault("max_depth", max_depth)
+
+    write_table(data, filename + ".tmp", **attrs)
+
+    if not verify_table(filename + ".tmp"):
+        os.remove(filename + ".tmp")
+        raise ValueError("Converted table " + filename + " failed its checksum")
+
+    os.replace(filename + ".tmp", filename)
+
+#chunked table files hold a header padded to TABLE_HEADER_SIZE, the file offset of each chunk and then the separately compressed chunks
+CHUNKED_TABLE_MAGIC = b"HYPERSOLVE CHUNKS"
+
+#number of uncompressed bytes in each chunk
+TABLE_CHUNK_SIZE = 2**24
+
+#compression functions of each codec as (compress, decompress)
+COMPRESSION_CODECS = {"zlib": (lambda data: zlib.compress(data, 1), zlib.decompress)}
+if lz4 is not None:
+    COMPRESSION_CODECS["lz4"] = (lz4.frame.compress, lz4.frame.decompress)
+if zstandard is not None:
+    COMPRESSION_CODECS["zstd"] = (lambda data: zstandard.ZstdCompressor(level=3).compress(data), lambda data: zstandard.ZstdDecompressor().decompress(data))
+
+def default_codec() -> str:
+    '''
+    Returns the fastest available compression codec
+    '''
+    for codec in ("zstd", "lz4", "zlib"):
+        if codec in COMPRESSION_CODECS:
+            return codec
+
+def write_chunked_table(data: np.ndarray, filename: str, codec: str = None, chunk_size: int = TABLE_CHUNK_SIZE, **attrs):
+    '''
+    Saves the data as a chunked table file with the chunks compressed in parallel
+
+    data: the table data
+    filename: the name of the file
+    codec: the compression codec (defaults to the fastest available)
+    chunk_size: the number of uncompressed bytes in each chunk
+    attrs: extra values to store in the header
+    '''
+    print("Saving data...")
+    if codec is None:
+        codec = default_codec()
+    compress = COMPRESSION_CODECS[codec][0]
+
+    data = np.ascontiguousarray(data)
+    data_bytes = data.reshape(-1).view(np.uint8)
+    n_chunks = (len(data_bytes) + chunk_size - 1) // chunk_size
+
+    header = {"version": TABLE_VERSION, "dtype": data.dtype.str, "shape": data.shape, "checksum": table_checksum(data), "codec": codec,
+              "chunk_size": chunk_size, "n_chunks": n_chunks, **attrs}
+    header = CHUNKED_TABLE_MAGIC + json.dumps(header).encode()
+
+    if len(header) > TABLE_HEADER_SIZE:
+        raise ValueError("Table header is too large")
+
+    offsets = np.empty(n_chunks + 1, dtype=np.uint64)
+    offsets[0] = TABLE_HEADER_SIZE + offsets.nbytes
+
+    with open(filename, "wb") as f, ThreadPoolExecutor() as executor:
+        f.write(header.ljust(TABLE_HEADER_SIZE, b" "))
+        f.write(offsets.tobytes())
+
+        #compress the chunks in parallel and write them in order
+        chunks = executor.map(compress, (data_bytes[start:start + chunk_size] for start in range(0, len(data_bytes), chunk_size)))
+        for i, chunk in enumerate(tqdm(chunks, total=n_chunks, leave=False, desc="Compressing")):
+            f.write(chunk)
+            offsets[i + 1] = offsets[i] + len(chunk)
+
+        #write the offsets now that the chunk sizes are known
+        f.seek(TABLE_HEADER_SIZE)
+        f.write(offsets.tobytes())
+    print("Done")
+
+def is_chunked_table_file(filename: str) -> bool:
+    '''
+    Returns whether the file is a chunked table file
+    '''
+    with open(filename, "rb") as f:
+        return f.read(len(CHUNKED_TABLE_MAGIC)) == CHUNKED_TABLE_MAGIC
+
+class ChunkedTable:
+    def __init__(self, filename: str) -> None:
+        '''
+        Opens a chunked table file. Single chunks can be read without decompressing the whole table.
+
+        filename: the name of the file
+        '''
+        self.filename = filename
+
+        with open(filename, "rb") as f:
+            header = f.read(TABLE_HEADER_SIZE)
+
+            if not header.startswith(CHUNKED_TABLE_MAGIC):
+                raise ValueError(filename + " is not a chunked table file")
+
+            self.header = json.loads(header[len(CHUNKED_TABLE_MAGIC):])
+
+            if self.header["version"] != TABLE_VERSION:
+                raise ValueError(filename + " has unsupported table version " + str(self.header["version"]))
+
+            self.offsets = np.frombuffer(f.read(8 * (self.header["n_chunks"] + 1)), dtype=np.uint64)
+
+        if self.header["codec"] not in COMPRESSION_CODECS:
+            raise ValueError(filename + " is compressed with " + self.header["codec"] + " which is not installed")
+
+        self.dtype = np.dtype(self.header["dtype"])
+        self.shape = tuple(self.header["shape"])
+        self.chunk_size = self.header["chunk_size"]
+        self.n_chunks = self.header["n_chunks"]
+        self.decompress = COMPRESSION_CODECS[self.header["codec"]][1]
+
+    def read_chunk_bytes(self, chunk: int) -> bytes:
+        '''
+        Returns the decompressed bytes of the chunk
+        '''
+        with open(self.filename, "rb") as f:
+            f.seek(int(self.offsets[chunk]))
+            return self.decompress(f.read(int(self.offsets[chunk + 1] - self.offsets[chunk])))
+
+    def read_chunk(self, chunk: int) -> np.ndarray:
+        '''
+        Returns the entries of the flattened table held by the chunk (the chunk size must be a multiple of the entry size)
+        '''
+        return np.frombuffer(self.read_chunk_bytes(chunk), dtype=self.dtype)
+
+    def read(self) -> np.ndarray:
+        '''
+        Returns the whole table with the chunks decompressed in parallel
+        '''
+        data = np.empty(self.shape, dtype=self.dtype)
+        data_bytes = data.reshape(-1).view(np.uint8)
+
+        def read_into(chunk):
+            data_bytes[chunk * self.chunk_size:(chunk + 1) * self.chunk_size] = np.frombuffer(self.read_chunk_bytes(chunk), dtype=np.uint8)
+
+        with ThreadPoolExecutor() as executor:
+            for _ in tqdm(executor.map(read_into, range(self.n_chunks)), total=self.n_chunks, leave=False, desc="Decompressing"):
+                pass
+
+        if table_checksum(data) != self.header["checksum"]:
+            raise ValueError(self.filename + " failed its checksum")
+
+        return data
+
+def table_attrs(header: dict) -> dict:
+    '''
+    Returns the extra values stored in a table header
+    '''
+    return {key: value for key, value in header.items() if key in ("encoding", "max_depth")}
+
+def compress_table_file(filename: str, codec: str = None):
+    '''
+    Converts a table file into a chunked table file with the same name
+
+    filename: the name of the file
+    codec: the compression codec (defaults to the fastest available)
+    '''
+    print("Compressing " + filename + "...")
+    data, header = open_table(filename)
+
+    write_chunked_table(data, filename + ".tmp", codec, **table_attrs(header))
+    del data
+
+    os.replace(filename + ".tmp", filename)
+
+def decompress_table_file(filename: str):
+    '''
+    Converts a chunked table file into a table file with the same name
+    '''
+    print("Decompressing " + filename + "...")
+    table = ChunkedTable(filename)
+
+    write_table(table.read(), filename + ".tmp", **table_attrs(table.header))
+
+    os.replace(filename + ".tmp", filename)
+
+def write_data(data, filename):
+    write_table(data, filename)
+
+def import_data(filename):
+    if is_h5_file(filename):
+        with h5py.File(filename, "r") as f:
+            return f[filename][:]
+    if is_chunked_table_file(filename):
+        return ChunkedTable(filename).read()
+
+    #move and symmetry tables are indexed from python for every move so the memory map is viewed as a plain array, which avoids the overhead
+    #of indexing memmap objects while the pages stay shared between processes
+    return open_table(filename)[0].view(np.ndarray)
 
 move_composition_table = np.array([[254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 3, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 6, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 9, 10, 11, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 10, 11, 8, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 11, 8, 9, 6, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 8, 9, 10, 5, 6, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [13, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 0, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [12, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [16, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 15, 17, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [17, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 16, 14, 13, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [14, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 17, 15, 0, 13, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [15, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 14, 16, 12, 0, 13, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 19, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 18, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 22, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 21, 23, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 23, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 22, 20, 19, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 20, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 23, 21, 1, 19, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 21, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 20, 22, 18, 1, 19, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 25, 26, 27, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 26, 27, 24, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 27, 24, 25, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 3, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 24, 25, 26, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 2, 3, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 35, 38, 41, 37, 42, 31, 32, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 33, 36, 40, 30, 34, 39, 43, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 41, 8, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 34, 39, 43, 29, 33, 36, 40, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 35, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 32, 37, 42, 38, 41, 28, 35, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 10, 43, 33, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 37, 42, 31, 35, 38, 41, 28, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 39, 7, 9, 29, 33, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 36, 40, 29, 43, 30, 34, 39, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 11, 31, 38, 7, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 39, 43, 30, 40, 29, 33, 36, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 7, 37, 28, 11, 8, 42, 35, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 38, 41, 28, 32, 37, 42, 31, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 30, 9, 7, 36, 40, 10, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 40, 29, 33, 39, 43, 30, 34, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 42, 6, 10, 35, 38, 7, 11, 31, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 42, 31, 32, 28, 35, 38, 41, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 6, 40, 34, 8, 9, 29, 39, 7, 33, 10, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 41, 28, 35, 31, 32, 37, 42, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 8, 33, 43, 6, 7, 36, 30, 9, 40, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 43, 30, 34, 36, 40, 29, 33, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 32, 10, 6, 41, 28, 11, 7, 37, 8, 35, 42, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 29, 33, 36, 34, 39, 43, 30, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 5, 28, 37, 9, 10, 35, 42, 6, 38, 11, 7, 31, 41, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 28, 35, 38, 42, 31, 32, 37, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 29, 5, 11, 39, 43, 6, 8, 33, 7, 30, 36, 9, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 31, 32, 37, 41, 28, 35, 38, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 36, 11, 5, 30, 34, 8, 6, 40, 9, 39, 29, 7, 10, 33, 43, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 255, 255, 255, 30, 34, 39, 33, 36, 40, 29, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 9, 38, 31, 5, 6, 41, 32, 10, 28, 7, 11, 37, 35, 8, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [54, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 51, 57, 53, 58, 47, 48, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [52, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 49, 56, 46, 50, 55, 59, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 57, 14, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [55, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 50, 59, 45, 49, 52, 56, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 51, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [53, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 58, 54, 57, 44, 51, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 16, 59, 49, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [58, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 53, 47, 51, 54, 57, 44, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 55, 13, 15, 45, 49, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [56, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 52, 45, 59, 46, 50, 55, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 17, 47, 54, 13, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [59, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 55, 46, 56, 45, 49, 52, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 13, 53, 44, 17, 14, 58, 51, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [57, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 54, 44, 48, 53, 58, 47, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 46, 15, 13, 52, 56, 16, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [45, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 56, 49, 55, 59, 46, 50, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 58, 0, 16, 51, 54, 13, 17, 47, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [47, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 58, 48, 44, 51, 54, 57, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 0, 56, 50, 14, 15, 45, 55, 13, 49, 16, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [44, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 57, 51, 47, 48, 53, 58, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 14, 49, 59, 0, 13, 52, 46, 15, 56, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [46, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 59, 50, 52, 56, 45, 49, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 48, 16, 0, 57, 44, 17, 13, 53, 14, 51, 58, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [49, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 45, 52, 50, 55, 59, 46, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 12, 44, 53, 15, 16, 51, 58, 0, 54, 17, 13, 47, 57, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [51, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 44, 54, 58, 47, 48, 53, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 45, 12, 17, 55, 59, 0, 14, 49, 13, 46, 52, 15, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [48, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 47, 53, 57, 44, 51, 54, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 52, 17, 12, 46, 50, 14, 0, 56, 15, 55, 45, 13, 16, 49, 59, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [50, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 46, 55, 49, 52, 56, 45, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 15, 54, 47, 12, 0, 57, 48, 16, 44, 13, 17, 53, 51, 14, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 70, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 67, 73, 69, 74, 63, 64, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 68, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 65, 72, 62, 66, 71, 75, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 73, 20, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 71, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 66, 75, 61, 65, 68, 72, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 67, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 69, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 64, 74, 70, 73, 60, 67, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 22, 75, 65, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 74, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 69, 63, 67, 70, 73, 60, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 71, 19, 21, 61, 65, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 72, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 68, 61, 75, 62, 66, 71, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 23, 63, 70, 19, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 75, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 71, 62, 72, 61, 65, 68, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 19, 69, 60, 23, 20, 74, 67, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 73, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 70, 60, 64, 69, 74, 63, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 62, 21, 19, 68, 72, 22, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 61, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 72, 65, 71, 75, 62, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 74, 1, 22, 67, 70, 19, 23, 63, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 63, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 74, 64, 60, 67, 70, 73, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 1, 72, 66, 20, 21, 61, 71, 19, 65, 22, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 60, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 73, 67, 63, 64, 69, 74, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 20, 65, 75, 1, 19, 68, 62, 21, 72, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 62, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 75, 66, 68, 72, 61, 65, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 64, 22, 1, 73, 60, 23, 19, 69, 20, 67, 74, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 65, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 61, 68, 66, 71, 75, 62, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 18, 60, 69, 21, 22, 67, 74, 1, 70, 23, 19, 63, 73, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 67, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 60, 70, 74, 63, 64, 69, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 61, 18, 23, 71, 75, 1, 20, 65, 19, 62, 68, 21, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 64, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 63, 69, 73, 60, 67, 70, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 68, 23, 18, 62, 66, 20, 1, 72, 21, 71, 61, 19, 22, 65, 75, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 66, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 62, 71, 65, 68, 72, 61, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 21, 70, 63, 18, 1, 73, 64, 22, 60, 19, 23, 69, 67, 20, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 83, 86, 89, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 85, 90, 79, 80, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 81, 84, 88, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 78, 82, 87, 91, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 89, 24, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 82, 87, 91, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 77, 81, 84, 88, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 83, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 80, 85, 90, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 86, 89, 76, 83, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 26, 91, 81, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 85, 90, 79, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 83, 86, 89, 76, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 87, 4, 25, 77, 81, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 84, 88, 77, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 91, 78, 82, 87, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 27, 79, 86, 4, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 87, 91, 78, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 88, 77, 81, 84, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 4, 85, 76, 27, 24, 90, 83, 254, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 86, 89, 76, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 80, 85, 90, 79, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 78, 25, 4, 84, 88, 26, 254, 255, 255, 255, 255, 255, 255, 255, 255, 255], [255, 255, 88, 77, 81, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 87, 91, 78, 82, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 90, 3, 26, 83, 86, 4, 27, 79, 254, 255, 255, 255, 255, 255, 255, 255], [255, 255, 90, 79, 80, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 76, 83, 86, 89, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 3, 88, 82, 24, 25, 77, 87, 4, 81, 26, 254, 255, 255, 255, 255, 255], [255, 255, 89, 76, 83, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 79, 80, 85, 90, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 24, 81, 91, 3, 4, 84, 78, 25, 88, 254, 255, 255, 255, 255, 255, 255], [255, 255, 91, 78, 82, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 84, 88, 77, 81, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 80, 26, 3, 89, 76, 27, 4, 85, 24, 83, 90, 254, 255, 255, 255, 255], [255, 255, 77, 81, 84, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 82, 87, 91, 78, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 2, 76, 85, 25, 26, 83, 90, 3, 86, 27, 4, 79, 89, 254, 255, 255], [255, 255, 76, 83, 86, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 90, 79, 80, 85, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 77, 2, 27, 87, 91, 3, 24, 81, 4, 78, 84, 25, 254, 255, 255, 255], [255, 255, 79, 80, 85, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 89, 76, 83, 86, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 84, 27, 2, 78, 82, 24, 3, 88, 25, 87, 77, 4, 26, 81, 91, 254], [255, 255, 78, 82, 87, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 81, 84, 88, 77, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 25, 86, 79, 2, 3, 89, 80, 26, 76, 4, 27, 85, 83, 24, 254, 255]], dtype=np.uint8)
\ No newline at end of file